@@ -0,0 +1,61 @@
+"""Decoding array-shaped trade histories into NumPy columns.
+
+Compares building a model per row, as the clients do by default, and
+turning those models into columns for analytics, against decoding the rows
+straight into a structured array (`columnar=True`).
+
+    $ python -m benchmarks.columnar_bench
+"""
+
+import timeit
+from functools import partial
+
+import numpy as np
+
+from trading_api_wrappers.bitfinex import models_v2
+from trading_api_wrappers.buda import models
+from trading_api_wrappers.columnar import structured_array
+
+from benchmarks import payloads
+
+CASES = {
+    "bitfinex trades": (payloads.bitfinex_trades, models_v2.TradingTrade),
+    "buda trades": (payloads.buda_trades, models.TradeEntry),
+}
+
+
+def build(rows, model):
+    return [model.create_from_json(row) for row in rows]
+
+
+def build_columns(rows, model):
+    items = build(rows, model)
+    return {
+        field.name: np.array([getattr(item, field.name) for item in items])
+        for field in model.schema
+    }
+
+
+def main():
+    for name, (payload, model) in CASES.items():
+        for count in [10_000, 100_000]:
+            rows = payload(count)
+            print(f"{name} ({count:,} rows)")
+            results = {}
+            for target, decode in [
+                ("models", build),
+                ("models+columns", build_columns),
+                ("structured", lambda r, m: structured_array(r, m.schema)),
+            ]:
+                seconds = min(
+                    timeit.repeat(partial(decode, rows, model), number=1, repeat=5)
+                )
+                results[target] = seconds * 1e3
+                speedup = results["models"] / results[target]
+                print(f"  {target:<16} {results[target]:8.2f} ms  {speedup:5.1f}x")
+            speedup = results["models+columns"] / results["structured"]
+            print(f"  structured vs models+columns: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Parsing time of the timestamps of an order history.
+
+Compares `datetime.strptime` (the previous behaviour of the model modules)
+against `common.parse_datetime` on unique timestamps (cold cache) and on
+trades sharing their timestamps.
+
+    $ python -m benchmarks.datetime_bench
+"""
+
+import timeit
+from datetime import datetime
+from functools import partial
+
+from trading_api_wrappers import common
+
+from benchmarks import payloads
+
+BUDA_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def strptime(values):
+    return [datetime.strptime(value, BUDA_FORMAT) for value in values]
+
+
+def parse(values):
+    common._parse_datetime.cache_clear()
+    return [common.parse_datetime(value) for value in values]
+
+
+def main():
+    unique = [order["created_at"] for order in payloads.buda_orders(20_000)]
+    # Ten trades a second
+    repeated = [value for value in unique[:2_000] for _ in range(10)]
+    accelerator = "ciso8601" if common.ciso8601 else "fixed layout"
+    print(f"buda created_at, {len(unique):,} strings ({accelerator})")
+    for name, values in [("unique", unique), ("repeated", repeated)]:
+        results = {}
+        for target, func in [("strptime", strptime), ("parse_datetime", parse)]:
+            target_func = partial(func, values)
+            seconds = min(timeit.repeat(target_func, number=1, repeat=5))
+            results[target] = seconds * 1e3
+            speedup = results["strptime"] / results[target]
+            print(
+                f"  {name:<9} {target:<15} {results[target]:8.2f} ms  {speedup:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
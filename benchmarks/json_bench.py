@@ -0,0 +1,51 @@
+"""Decoding time of the JSON backends on the largest responses.
+
+Compares `Response.json()` (the previous behaviour) against every backend
+installed in `trading_api_wrappers.decoders`, decoding `response.content`.
+
+    $ python -m benchmarks.json_bench
+"""
+
+import json
+import timeit
+from functools import partial
+
+from requests import Response
+
+from trading_api_wrappers.decoders import DECODERS
+
+from benchmarks import payloads
+
+PAYLOADS = {
+    "bitex transactions_archive": payloads.bitex_transactions(),
+    "coinmarketcap ticker": payloads.coinmarketcap_ticker(),
+    "kraken public/Depth": payloads.kraken_depth(),
+}
+
+
+def response_for(payload):
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def main():
+    for name, payload in PAYLOADS.items():
+        response = response_for(payload)
+        size = len(response.content) / 2**20
+        print(f"{name} ({len(response.content) // 1024:,} KiB)")
+        targets = {"Response.json()": response.json}
+        for backend, loads in DECODERS.items():
+            targets[backend] = partial(loads, response.content)
+        results = {}
+        for target, func in targets.items():
+            number = max(1, int(20 / size))
+            seconds = min(timeit.repeat(func, number=number, repeat=3))
+            results[target] = seconds / number * 1e3
+            speedup = results["Response.json()"] / results[target]
+            print(f"  {target:<18} {results[target]:9.2f} ms  {speedup:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Cost of reading the top of a response with eager and lazy models.
+
+Builds Buda models from decoded payloads, as `lazy_models` does, and reads
+only the first item: the best ask of an order book and the first order of
+a page.
+
+    $ python -m benchmarks.lazy_bench
+"""
+
+import timeit
+from functools import partial
+
+from trading_api_wrappers.buda import models
+
+from benchmarks import payloads
+
+CASES = {
+    "order_book asks[0]": (
+        payloads.buda_order_book(),
+        lambda d, lazy: models.OrderBook.create_from_json(d, lazy).asks[0],
+    ),
+    "order_pages orders[0]": (
+        payloads.buda_orders(1_000),
+        lambda d, lazy: models.OrderPages.create_from_json(d, None, lazy).orders[0],
+    ),
+}
+
+
+def main():
+    for name, (payload, read) in CASES.items():
+        print(name)
+        results = {}
+        for lazy in (False, True):
+            number = 20
+            target = partial(read, payload, lazy)
+            seconds = min(timeit.repeat(target, number=number))
+            results[lazy] = seconds / number * 1e3
+            speedup = results[False] / results[lazy]
+            label = "lazy" if lazy else "eager"
+            print(f"  {label:<6} {results[lazy]:9.3f} ms  {speedup:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Memory held by models built with and without their raw JSON payload.
+
+Builds Buda orders the way the client does (`ModelMixin._build`) from a
+freshly decoded response, drops the decoded payload, as the client does,
+and reports the memory still held by the models.
+
+    $ python -m benchmarks.models_bench
+"""
+
+import gc
+import json
+import tracemalloc
+
+from trading_api_wrappers import Buda
+
+from benchmarks import payloads
+
+COUNT = 100_000
+
+
+def retained(content: bytes, client=None):
+    """Bytes still allocated after building models from `content`."""
+    gc.collect()
+    tracemalloc.start()
+    data = json.loads(content)
+    if client is not None:
+        data = client._build(
+            data, lambda d: [Buda.models.Order.create_from_json(o) for o in d]
+        )
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size
+
+
+def main():
+    content = json.dumps(payloads.buda_orders(COUNT)).encode()
+    print(f"buda orders ({COUNT:,} orders, {len(content) // 2**20} MiB of JSON)")
+    results = {
+        "raw JSON": retained(content),
+        "models": retained(content, Buda.Public()),
+        "models, keep_json=False": retained(content, Buda.Public(keep_json=False)),
+    }
+    for target, size in results.items():
+        ratio = size / results["models"]
+        print(f"  {target:<24} {size / 2**20:8.1f} MiB  {ratio:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Synthetic payloads shaped like real API responses, for benchmarks."""
+
+import random
+import time
+
+random.seed(575)
+NOW = int(time.time())
+
+
+def bitex_transactions(count: int = 200_000):
+    """Bitex `transactions_archive`: [timestamp, id, price, amount] rows."""
+    return [
+        [
+            NOW - i * 7,
+            10_000_000 - i,
+            round(random.uniform(5e6, 9e6), 2),
+            round(random.uniform(1e-4, 2), 8),
+        ]
+        for i in range(count)
+    ]
+
+
+def coinmarketcap_ticker(count: int = 2_000):
+    """CoinMarketCap `ticker/` without a currency: one object per coin."""
+    tickers = []
+    for i in range(count):
+        price = random.uniform(1e-4, 1e4)
+        supply = random.uniform(1e6, 1e10)
+        tickers.append(
+            {
+                "id": f"coin-{i}",
+                "name": f"Coin {i}",
+                "symbol": f"C{i:03d}",
+                "rank": str(i + 1),
+                "price_usd": f"{price:.8f}",
+                "price_btc": f"{price / 9e3:.8f}",
+                "24h_volume_usd": f"{price * supply / 50:.1f}",
+                "market_cap_usd": f"{price * supply:.1f}",
+                "available_supply": f"{supply:.1f}",
+                "total_supply": f"{supply * 1.2:.1f}",
+                "max_supply": None if i % 3 else f"{supply * 2:.1f}",
+                "percent_change_1h": f"{random.uniform(-5, 5):.2f}",
+                "percent_change_24h": f"{random.uniform(-20, 20):.2f}",
+                "percent_change_7d": f"{random.uniform(-50, 50):.2f}",
+                "last_updated": str(NOW - i),
+            }
+        )
+    return tickers
+
+
+def kraken_depth(count: int = 500, pair: str = "XXBTZUSD"):
+    """Kraken `public/Depth`: string price/volume levels with timestamps."""
+
+    def levels(start, step):
+        return [
+            [
+                f"{start + i * step:.1f}",
+                f"{random.uniform(1e-3, 10):.3f}",
+                NOW - random.randint(0, 3600),
+            ]
+            for i in range(count)
+        ]
+
+    return {
+        "error": [],
+        "result": {pair: {"asks": levels(9000.1, 0.5), "bids": levels(9000, -0.5)}},
+    }
+
+
+def buda_orders(count: int = 100_000, market_id: str = "BTC-CLP"):
+    """Buda `markets/{market_id}/orders`: one object per order."""
+    base, quote = market_id.split("-")
+    orders = []
+    for i in range(count):
+        price = round(random.uniform(5e6, 9e6), 2)
+        amount = round(random.uniform(1e-4, 2), 8)
+        traded = round(amount * random.random(), 8)
+        orders.append(
+            {
+                "id": 10_000_000 - i,
+                "account_id": 1234,
+                "amount": [f"{amount - traded:.8f}", base],
+                "created_at": time.strftime(
+                    "%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(NOW - i * 60)
+                ),
+                "fee_currency": base,
+                "limit": [f"{price:.2f}", quote],
+                "market_id": market_id,
+                "original_amount": [f"{amount:.8f}", base],
+                "paid_fee": [f"{traded * 0.008:.8f}", base],
+                "price_type": "limit",
+                "state": random.choice(["traded", "canceled", "pending"]),
+                "total_exchanged": [f"{traded * price:.2f}", quote],
+                "traded_amount": [f"{traded:.8f}", base],
+                "type": random.choice(["Bid", "Ask"]),
+            }
+        )
+    return orders
+
+
+def buda_order_book(count: int = 5_000):
+    """Buda `markets/{market_id}/order_book`: [price, amount] string levels."""
+
+    def levels(start, step):
+        return [
+            [f"{start + i * step:.2f}", f"{random.uniform(1e-4, 2):.8f}"]
+            for i in range(count)
+        ]
+
+    return {"asks": levels(7_000_001, 10), "bids": levels(7_000_000, -10)}
+
+
+def buda_trades(count: int = 100_000):
+    """Buda `markets/{market_id}/trades` entries: [timestamp, amount, price,
+    direction, id] rows of strings."""
+    return [
+        [
+            str((NOW - i) * 1000),
+            f"{random.uniform(1e-4, 2):.8f}",
+            f"{random.uniform(5e6, 9e6):.2f}",
+            random.choice(["buy", "sell"]),
+            10_000_000 - i,
+        ]
+        for i in range(count)
+    ]
+
+
+def buda_balance_events(count: int = 50_000, currency: str = "BTC"):
+    """Buda `balance_events`: one object per event."""
+    events = []
+    for i in range(count):
+        amount = random.uniform(0, 10)
+        events.append(
+            {
+                "id": 10_000_000 - i,
+                "account_id": 1234,
+                "created_at": time.strftime(
+                    "%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(NOW - i * 60)
+                ),
+                "currency": currency,
+                "event": "transaction",
+                "event_ids": [i],
+                "new_amount": f"{amount:.8f}",
+                "new_available_amount": f"{amount:.8f}",
+                "new_frozen_amount": "0.0",
+                "new_frozen_for_fee": "0.0",
+                "new_pending_withdraw_amount": "0.0",
+                "old_amount": f"{amount * 0.9:.8f}",
+                "old_available_amount": f"{amount * 0.9:.8f}",
+                "old_frozen_amount": "0.0",
+                "old_frozen_for_fee": "0.0",
+                "old_pending_withdraw_amount": "0.0",
+                "transaction_type": "trade",
+                "transfer_description": None,
+            }
+        )
+    return events
+
+
+def bitfinex_trades(count: int = 100_000):
+    """Bitfinex v2 `trades/{symbol}/hist`: [ID, MTS, AMOUNT, PRICE] rows."""
+    return [
+        [
+            400_000_000 - i,
+            (NOW - i) * 1000,
+            round(random.uniform(-2, 2), 8),
+            round(random.uniform(3e3, 9e3), 1),
+        ]
+        for i in range(count)
+    ]
@@ -0,0 +1,59 @@
+"""Per-request overhead of the retry layer.
+
+Compares decorating every request with `backoff.on_exception` (the previous
+`Client._retry` behaviour) against reusing a prebuilt `RetryPolicy`.
+
+    $ python -m benchmarks.retry_bench
+"""
+
+import timeit
+
+import backoff
+
+from trading_api_wrappers.base import RETRY_CODES
+from trading_api_wrappers.errors import RequestException
+from trading_api_wrappers.retry import RetryPolicy
+
+NUMBER = 100_000
+
+
+def fetch_base():
+    return {}
+
+
+def decorate_per_request():
+    def give_up_retry(e: RequestException):
+        return e.response is not None and e.response.status_code not in RETRY_CODES
+
+    return backoff.on_exception(
+        backoff.expo,
+        RequestException,
+        factor=1.5,
+        max_time=30,
+        max_tries=3,
+        giveup=give_up_retry,
+    )(fetch_base)()
+
+
+policy = RetryPolicy(max_tries=3, factor=1.5, max_time=30, retry_codes=RETRY_CODES)
+
+
+def prebuilt_policy():
+    return policy.call(fetch_base)
+
+
+def main():
+    results = {}
+    for name, target in [
+        ("backoff decorator per request", decorate_per_request),
+        ("prebuilt RetryPolicy", prebuilt_policy),
+    ]:
+        seconds = min(timeit.repeat(target, number=NUMBER, repeat=5))
+        results[name] = seconds / NUMBER * 1e6
+        print(f"{name:<32} {results[name]:8.3f} us/call")
+    speedup = results["backoff decorator per request"] / results["prebuilt RetryPolicy"]
+    print(f"{'speedup':<32} {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Building large lists of models with compiled schema decoders.
+
+Compares the hand-written `create_from_json` classmethods the models used
+to have (copied below) against the decoders compiled from their schemas.
+
+    $ python -m benchmarks.schema_bench
+"""
+
+import timeit
+from functools import partial
+
+from trading_api_wrappers.bitfinex import models_v2
+from trading_api_wrappers.buda import models
+from trading_api_wrappers.common import parse_datetime
+
+from benchmarks import payloads
+
+
+def amount(amount):
+    if amount:
+        amount = models.Amount(
+            amount=float(amount[0]),
+            currency=amount[1],
+        )
+    return amount
+
+
+def order(order):
+    return models.Order(
+        id=order["id"],
+        account_id=order["account_id"],
+        amount=amount(order["amount"]),
+        created_at=parse_datetime(order["created_at"]),
+        fee_currency=order["fee_currency"],
+        limit=amount(order["limit"]),
+        market_id=order["market_id"],
+        original_amount=amount(order["original_amount"]),
+        paid_fee=amount(order["paid_fee"]),
+        price_type=order["price_type"],
+        state=order["state"],
+        total_exchanged=amount(order["total_exchanged"]),
+        traded_amount=amount(order["traded_amount"]),
+        type=order["type"],
+        json=order,
+    )
+
+
+def balance_event(event):
+    return models.BalanceEvent(
+        id=event["id"],
+        account_id=event["account_id"],
+        created_at=parse_datetime(event["created_at"]),
+        currency=event["currency"],
+        event=event["event"],
+        event_ids=event["event_ids"],
+        new_amount=event["new_amount"],
+        new_available_amount=event["new_available_amount"],
+        new_frozen_amount=event["new_frozen_amount"],
+        new_frozen_for_fee=event["new_frozen_for_fee"],
+        new_pending_withdraw_amount=event["new_pending_withdraw_amount"],
+        old_amount=event["old_amount"],
+        old_available_amount=event["old_available_amount"],
+        old_frozen_amount=event["old_frozen_amount"],
+        old_frozen_for_fee=event["old_frozen_for_fee"],
+        old_pending_withdraw_amount=event["old_pending_withdraw_amount"],
+        transaction_type=event["transaction_type"],
+        transfer_description=event["transfer_description"],
+        json=event,
+    )
+
+
+def trade_entry(entry):
+    return models.TradeEntry(
+        timestamp=int(entry[0]),
+        amount=float(entry[1]),
+        price=float(entry[2]),
+        direction=entry[3],
+    )
+
+
+def trading_trade(trade):
+    return models_v2.TradingTrade(
+        ID=trade[0],
+        MTS=trade[1],
+        AMOUNT=trade[2],
+        PRICE=trade[3],
+    )
+
+
+CASES = {
+    "buda Order": (payloads.buda_orders(50_000), order, models.Order),
+    "buda BalanceEvent": (
+        payloads.buda_balance_events(),
+        balance_event,
+        models.BalanceEvent,
+    ),
+    "buda TradeEntry": (payloads.buda_trades(), trade_entry, models.TradeEntry),
+    "bitfinex TradingTrade": (
+        payloads.bitfinex_trades(),
+        trading_trade,
+        models_v2.TradingTrade,
+    ),
+}
+
+
+def build(items, builder):
+    return [builder(item) for item in items]
+
+
+def main():
+    for name, (items, classmethod_, model) in CASES.items():
+        print(f"{name} ({len(items):,} items)")
+        # Same models either way
+        assert build(items[:100], classmethod_) == build(
+            items[:100], model.create_from_json
+        )
+        results = {}
+        for target, builder in [
+            ("classmethod", classmethod_),
+            ("compiled", model.create_from_json),
+        ]:
+            seconds = min(
+                timeit.repeat(partial(build, items, builder), number=1, repeat=5)
+            )
+            results[target] = seconds * 1e3
+            speedup = results["classmethod"] / results[target]
+            print(f"  {target:<12} {results[target]:8.2f} ms  {speedup:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
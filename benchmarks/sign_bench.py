@@ -0,0 +1,83 @@
+"""Signing time per exchange, keying a new HMAC vs copying a prepared one.
+
+The previous `sign` implementations encoded (or base64 decoded, for Kraken)
+the secret and created a new `hmac` object on every request.
+
+    $ python -m benchmarks.sign_bench
+"""
+
+import base64
+import hmac
+import timeit
+from functools import partial
+
+from trading_api_wrappers.bitfinex.client_auth_v1 import BitfinexHMACAuth
+from trading_api_wrappers.bitstamp.client_auth import BitstampHMACAuth
+from trading_api_wrappers.buda.client_auth import BudaHMACAuth
+from trading_api_wrappers.cryptomkt.client_auth import CryptoMKTHMACAuth
+from trading_api_wrappers.kraken.client_auth import KrakenHMACAuth
+
+NUMBER = 100_000
+KEY = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4"
+SECRET = "0123456789abcdef0123456789abcdef0123456789abcdef"
+KRAKEN_SECRET = base64.b64encode(bytes(range(64))).decode()
+BODY = '{"type": "Bid", "price_type": "limit", "limit": 3850000, "amount": 0.01}'
+
+# Auth, message shaped like the exchange's own, legacy sign
+EXCHANGES = {
+    "buda": (
+        BudaHMACAuth(KEY, SECRET),
+        f"POST /api/v2/markets/btc-clp/orders {BODY} 1546300800000000",
+        lambda auth, msg: hmac.new(
+            auth.secret.encode(), msg.encode(), auth.algorithm
+        ).hexdigest(),
+    ),
+    "bitfinex": (
+        BitfinexHMACAuth(KEY, SECRET),
+        base64.b64encode(BODY.encode()),
+        lambda auth, msg: hmac.new(
+            auth.secret.encode(), msg, auth.algorithm
+        ).hexdigest(),
+    ),
+    "bitstamp": (
+        BitstampHMACAuth(KEY, SECRET, customer_id=123456),
+        f"1546300800000000123456{KEY}",
+        lambda auth, msg: hmac.new(
+            auth.secret.encode(), msg.encode(), auth.algorithm
+        ).hexdigest(),
+    ),
+    "cryptomkt": (
+        CryptoMKTHMACAuth(KEY, SECRET),
+        "1546300800/v1/orders/create0.01ETHCLP300000buylimit",
+        lambda auth, msg: hmac.new(
+            auth.secret.encode(), msg.encode(), auth.algorithm
+        ).hexdigest(),
+    ),
+    "kraken": (
+        KrakenHMACAuth(KEY, KRAKEN_SECRET),
+        b"/0/private/AddOrder" + bytes(32),
+        lambda auth, msg: base64.b64encode(
+            hmac.new(base64.b64decode(auth.secret), msg, auth.algorithm).digest()
+        ).decode(),
+    ),
+}
+
+
+def main():
+    for name, (auth, message, legacy_sign) in EXCHANGES.items():
+        assert auth.sign(message) == legacy_sign(auth, message)
+        legacy = min(
+            timeit.repeat(partial(legacy_sign, auth, message), number=NUMBER, repeat=5)
+        )
+        prepared = min(
+            timeit.repeat(partial(auth.sign, message), number=NUMBER, repeat=5)
+        )
+        print(
+            f"{name:<10} new hmac {legacy / NUMBER * 1e6:6.2f} us"
+            f"  prepared {prepared / NUMBER * 1e6:6.2f} us"
+            f"  {legacy / prepared:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Peak memory of downloading a large response, whole vs streamed.
+
+Serves a synthetic Bitex `transactions_archive` locally and compares
+`transactions_archive` (full body, decoded list, list of models) against
+iterating `iter_transactions_archive`.
+
+    $ python -m benchmarks.stream_bench
+"""
+
+import json
+import time
+import tracemalloc
+
+from trading_api_wrappers import Bitex
+
+from benchmarks import payloads
+from tests.server import MockServer
+
+MARKET_ID = "btc_usd"
+
+
+def consume(transactions):
+    volume = 0
+    for transaction in transactions:
+        volume += transaction.amount
+    return volume
+
+
+def main():
+    content = json.dumps(payloads.bitex_transactions()).encode()
+    routes = {f"/{MARKET_ID}/market/transactions_archive": (200, content)}
+    print(f"transactions_archive ({len(content) // 1024:,} KiB)")
+    with MockServer(routes) as server:
+        client = Bitex.Public(base_url=server.url)
+        for name, target in [
+            ("transactions_archive", client.transactions_archive),
+            ("iter_transactions_archive", client.iter_transactions_archive),
+        ]:
+            start = time.perf_counter()
+            consume(target(MARKET_ID))
+            seconds = time.perf_counter() - start
+            # Tracing slows allocations down, measure memory on its own run
+            tracemalloc.start()
+            consume(target(MARKET_ID))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {name:<28} {peak / 2 ** 20:8.1f} MiB peak  {seconds:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
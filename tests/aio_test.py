@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from trading_api_wrappers import (
+    BitfinexV2,
+    Buda,
+    CoinMarketCapAsync,
+    InvalidResponse,
+    Kraken,
+)
+from trading_api_wrappers.aio import aiohttp
+from trading_api_wrappers.buda import models
+
+from tests.server import MockServer
+
+MARKET_ID = "BTC-CLP"
+TICKER = {
+    "ticker": {
+        "last_price": ["100.0", "CLP"],
+        "min_ask": ["101.0", "CLP"],
+        "max_bid": ["99.0", "CLP"],
+        "volume": ["10.0", "BTC"],
+        "price_variation_24h": "0.01",
+        "price_variation_7d": "0.02",
+    }
+}
+
+
+class SlowTradesHandler(BaseHTTPRequestHandler):
+    """Bitfinex trades sent in chunks, slower than the client timeout
+    overall but never idle for that long."""
+
+    protocol_version = "HTTP/1.1"
+    chunks = [b"[[3,3,1,10]", b",[2,2,1,10]", b",[1,1,1,10]]"]
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(sum(map(len, self.chunks))))
+        self.end_headers()
+        for chunk in self.chunks:
+            self.wfile.write(chunk)
+            self.wfile.flush()
+            time.sleep(0.2)
+
+
+@unittest.skipUnless(aiohttp, "aiohttp is not installed")
+class AsyncClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(
+            {
+                f"/markets/{MARKET_ID}/ticker": (200, TICKER),
+                "/private/Balance": (200, {"error": [], "result": {"XXBT": "1.0"}}),
+                "/ticker/": (200, [{"id": "bitcoin", "symbol": "BTC"}]),
+                "/ticker/bitcoin/": (200, [{"id": "bitcoin", "price_usd": "10.5"}]),
+            }
+        ).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_ticker(self):
+        async def main():
+            async with Buda.AsyncPublic(base_url=self.server.url) as client:
+                return await client.ticker(MARKET_ID)
+
+        ticker = self.run_async(main())
+        self.assertIsInstance(ticker, models.Ticker)
+        self.assertEqual(ticker.last_price, models.Amount(100.0, "CLP"))
+
+    def test_return_json(self):
+        async def main():
+            async with Buda.AsyncPublic(
+                base_url=self.server.url, return_json=True
+            ) as client:
+                return await client.ticker(MARKET_ID)
+
+        self.assertEqual(self.run_async(main()), TICKER)
+
+    def test_concurrent_requests(self):
+        async def main():
+            async with Buda.AsyncPublic(base_url=self.server.url) as client:
+                coroutines = [client.ticker(MARKET_ID) for _ in range(100)]
+                return await asyncio.gather(*coroutines)
+
+        tickers = self.run_async(main())
+        self.assertEqual(len(tickers), 100)
+        self.assertEqual(len(self.server.requests), 100)
+
+    def test_invalid_response(self):
+        async def main():
+            async with Buda.AsyncPublic(
+                base_url=self.server.url, max_retries=1
+            ) as client:
+                return await client.ticker("NOT-FOUND")
+
+        with self.assertRaises(InvalidResponse):
+            self.run_async(main())
+
+    def test_auth_headers(self):
+        async def main():
+            async with Kraken.AsyncAuth(
+                "KEY", "U0VDUkVU", base_url=self.server.url
+            ) as client:
+                return await client.balance()
+
+        response = self.run_async(main())
+        self.assertEqual(response["result"], {"XXBT": "1.0"})
+        request = self.server.requests[0]
+        self.assertEqual(request["headers"]["API-Key"], "KEY")
+        self.assertIn("API-Sign", request["headers"])
+        self.assertIn(b"nonce=", request["body"])
+
+    def test_chained_requests(self):
+        async def main():
+            async with CoinMarketCapAsync(base_url=self.server.url) as client:
+                return await client.price("BTC")
+
+        self.assertEqual(self.run_async(main()), 10.5)
+
+
+@unittest.skipUnless(aiohttp, "aiohttp is not installed")
+class AsyncStreamTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowTradesHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_slow_stream(self):
+        host, port = self.server.server_address
+
+        async def main():
+            async with BitfinexV2.AsyncPublic(
+                base_url=f"http://{host}:{port}/", timeout=0.3
+            ) as client:
+                return [t.ID async for t in client.iter_trades("tBTCUSD")]
+
+        self.assertEqual(asyncio.run(main()), [3, 2, 1])
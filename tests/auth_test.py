@@ -0,0 +1,112 @@
+import base64
+import hashlib
+import hmac
+import unittest
+
+from requests import Request, Session
+
+from trading_api_wrappers.auth import HMACAuth
+from trading_api_wrappers.base import ClientSession
+from trading_api_wrappers.bitfinex.client_auth_v1 import BitfinexHMACAuth
+from trading_api_wrappers.bitstamp.client_auth import BitstampHMACAuth
+from trading_api_wrappers.buda.client_auth import BudaHMACAuth
+from trading_api_wrappers.cryptomkt.client_auth import CryptoMKTHMACAuth
+from trading_api_wrappers.kraken.client_auth import KrakenHMACAuth
+from trading_api_wrappers.nonce import NonceGenerator
+
+SECRET = base64.b64encode(b"kraken-like secret" * 4).decode()
+MESSAGE = b"POST /api/v2/orders 1546300800000000"
+
+
+class HMACAuthTest(unittest.TestCase):
+    def test_hex_signatures(self):
+        for auth in [
+            HMACAuth("KEY", SECRET),
+            BudaHMACAuth("KEY", SECRET),
+            BitfinexHMACAuth("KEY", SECRET),
+            BitstampHMACAuth("KEY", SECRET, customer_id=1),
+            CryptoMKTHMACAuth("KEY", SECRET),
+        ]:
+            with self.subTest(auth=type(auth).__name__):
+                expected = hmac.new(SECRET.encode(), MESSAGE, auth.algorithm)
+                # Signing twice must not reuse the updated state
+                for _ in range(2):
+                    self.assertEqual(auth.sign(MESSAGE), expected.hexdigest())
+                    self.assertEqual(auth.sign(MESSAGE.decode()), expected.hexdigest())
+
+    def test_kraken_signature(self):
+        auth = KrakenHMACAuth("KEY", SECRET)
+        expected = hmac.new(base64.b64decode(SECRET), MESSAGE, hashlib.sha512)
+        expected = base64.b64encode(expected.digest()).decode()
+        self.assertEqual(auth.sign(MESSAGE), expected)
+        self.assertEqual(auth.sign(MESSAGE), expected)
+
+    def test_secret_change(self):
+        auth = HMACAuth("KEY", "old")
+        auth.sign(MESSAGE)
+        auth.secret = "new"
+        expected = hmac.new(b"new", MESSAGE, auth.algorithm).hexdigest()
+        self.assertEqual(auth.sign(MESSAGE), expected)
+
+    def test_keyed_on_init(self):
+        auth = HMACAuth("KEY", SECRET)
+        keyed = auth._hmac
+        self.assertIsNotNone(keyed)
+        auth.sign(MESSAGE)
+        # Signatures copy the state, it is never rebuilt
+        self.assertIs(auth._hmac, keyed)
+        auth.secret = "new"
+        self.assertIsNot(auth._hmac, keyed)
+
+    def test_algorithm_override(self):
+        auth = HMACAuth("KEY", SECRET, algorithm="sha1")
+        expected = hmac.new(SECRET.encode(), MESSAGE, "sha1").hexdigest()
+        self.assertEqual(auth.sign(MESSAGE), expected)
+
+
+class PreparePayloadTest(unittest.TestCase):
+    url = "https://api.example.com/v1/orders/create"
+
+    def prepare(self, session, auth, **kwargs):
+        # Same nonce on both paths
+        auth._nonce = lambda: 1546300800
+        auth.nonces = NonceGenerator()
+        session.auth = auth
+        return session.prepare_request(Request("POST", self.url, **kwargs))
+
+    def assertSameRequest(self, auth, **kwargs):
+        # Signed before encoding vs signing the encoded request
+        hooked = self.prepare(ClientSession(self.url), auth, **kwargs)
+        legacy = self.prepare(Session(), auth, **kwargs)
+        self.assertEqual(hooked.body, legacy.body)
+        self.assertEqual(hooked.headers, legacy.headers)
+        self.assertEqual(len(hooked.hooks["response"]), 2)
+        return hooked
+
+    def test_kraken(self):
+        auth = KrakenHMACAuth("KEY", SECRET)
+        r = self.assertSameRequest(auth, data={"pair": "XBTUSD", "volume": 1.5})
+        self.assertEqual(r.body, "pair=XBTUSD&volume=1.5&nonce=1546300800")
+        self.assertIn("API-Sign", r.headers)
+
+    def test_bitstamp(self):
+        auth = BitstampHMACAuth("KEY", SECRET, customer_id=1)
+        r = self.assertSameRequest(auth, data={"amount": 1})
+        self.assertTrue(r.body.startswith("amount=1&key=KEY&nonce=1546300800&"))
+
+    def test_cryptomkt(self):
+        auth = CryptoMKTHMACAuth("KEY", SECRET)
+        r = self.assertSameRequest(auth, json={"market": "ETHCLP", "amount": 1.5})
+        message = "1546300800/v1/orders/create1.5ETHCLP"
+        self.assertEqual(r.headers["X-MKT-SIGNATURE"], auth.sign(message))
+
+    def test_bitfinex(self):
+        auth = BitfinexHMACAuth("KEY", SECRET)
+        payload = {"order_id": 1}
+        r = self.assertSameRequest(auth, json=payload)
+        self.assertEqual(payload, {"order_id": 1})
+        self.assertIn("x-bfx-payload", r.headers)
+        self.assertSameRequest(auth)
+
+    def test_default(self):
+        self.assertSameRequest(BudaHMACAuth("KEY", SECRET), json={"amount": 1})
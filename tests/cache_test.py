@@ -0,0 +1,124 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from trading_api_wrappers import Buda, Kraken
+from trading_api_wrappers.aio import aiohttp
+from trading_api_wrappers.cache import DiskCache, MemoryCache
+
+from tests.server import MockServer
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class CacheTestMixin:
+    def make_cache(self, maxsize):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = self.make_cache(maxsize=2)
+        self.cache.clock = self.clock
+
+    def test_ttl(self):
+        self.cache.set(("GET", "a"), {"a": 1}, ttl=10)
+        self.assertEqual(self.cache.get(("GET", "a")), (True, {"a": 1}))
+        self.clock.now += 10
+        self.assertEqual(self.cache.get(("GET", "a")), (False, None))
+        self.assertEqual(self.cache.cache_info()[:2], (1, 1))
+
+    def test_lru_eviction(self):
+        self.cache.set("a", 1, ttl=10)
+        self.clock.now += 1
+        self.cache.set("b", 2, ttl=10)
+        self.clock.now += 1
+        self.cache.get("a")
+        self.clock.now += 1
+        self.cache.set("c", 3, ttl=10)
+        self.assertEqual(self.cache.get("a"), (True, 1))
+        self.assertEqual(self.cache.get("b"), (False, None))
+        self.assertEqual(self.cache.get("c"), (True, 3))
+        self.assertEqual(self.cache.cache_info(), (3, 1, 2, 2))
+
+    def test_clear(self):
+        self.cache.set("a", 1, ttl=10)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+class MemoryCacheTest(CacheTestMixin, unittest.TestCase):
+    def make_cache(self, maxsize):
+        return MemoryCache(maxsize)
+
+
+class DiskCacheTest(CacheTestMixin, unittest.TestCase):
+    def make_cache(self, maxsize):
+        fd, self.path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(fd)
+        return DiskCache(self.path, maxsize)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_persistent(self):
+        self.cache.set(("GET", "a"), {"a": [1, 2]}, ttl=10)
+        cache = DiskCache(self.path)
+        cache.clock = self.clock
+        self.assertEqual(cache.get(("GET", "a")), (True, {"a": [1, 2]}))
+
+
+class ClientCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(
+            {
+                "/public/Assets": (200, {"error": [], "result": {"XXBT": {}}}),
+                "/public/Time": (200, {"error": [], "result": {"unixtime": 1}}),
+                "/markets": (200, {"markets": []}),
+            }
+        ).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_disabled_by_default(self):
+        client = Kraken.Public(base_url=self.server.url)
+        client.assets()
+        client.assets()
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_endpoint_ttl(self):
+        cache = MemoryCache()
+        client = Kraken.Public(base_url=self.server.url, cache=cache)
+        for _ in range(3):
+            self.assertEqual(client.assets()["result"], {"XXBT": {}})
+            client.server_time()
+        paths = [request["path"] for request in self.server.requests]
+        self.assertEqual(paths.count("/public/Assets"), 1)
+        self.assertEqual(paths.count("/public/Time"), 3)
+        self.assertEqual(cache.cache_info()[:3], (2, 1, 1))
+
+    def test_models_from_cache(self):
+        client = Buda.Public(base_url=self.server.url, cache=MemoryCache())
+        self.assertEqual(client.markets(), [])
+        self.assertEqual(client.markets(), [])
+        self.assertEqual(len(self.server.requests), 1)
+
+    @unittest.skipUnless(aiohttp, "aiohttp is not installed")
+    def test_async(self):
+        cache = MemoryCache()
+
+        async def main():
+            async with Kraken.AsyncPublic(
+                base_url=self.server.url, cache=cache
+            ) as client:
+                return [(await client.assets())["result"] for _ in range(3)]
+
+        self.assertEqual(asyncio.run(main()), [{"XXBT": {}}] * 3)
+        self.assertEqual(len(self.server.requests), 1)
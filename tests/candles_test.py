@@ -0,0 +1,146 @@
+import threading
+import unittest
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+
+from trading_api_wrappers import Buda, BitfinexV2, Kraken
+from trading_api_wrappers.columnar import Candles, np
+from trading_api_wrappers.errors import InvalidResponse
+
+from tests.server import MockServer
+
+START = 1546300800  # 2019-01-01 UTC
+MINUTE = 60
+
+
+def query(request):
+    return {k: v[0] for k, v in parse_qs(urlsplit(request["url"]).query).items()}
+
+
+class BitfinexCandles:
+    """`candles_hist` of 1m candles, failing the first tries of some windows."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.lock = threading.Lock()
+        self.windows = []
+
+    def __call__(self, request):
+        params = query(request)
+        start, end = int(params["start"]), int(params["end"])
+        with self.lock:
+            self.windows.append((start // 1000, (end + 1) // 1000))
+            if self.failures:
+                self.failures -= 1
+                return 500, {"message": "Internal Server Error"}
+        first = -(-start // 60000) * 60
+        candles = [
+            [t * 1000, t, t + 2, t + 3, t - 1, 1.5]
+            for t in range(first, end // 1000 + 1, MINUTE)
+        ]
+        return 200, candles[: int(params["limit"])]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class CandlesTest(unittest.TestCase):
+    def test_create_from_rows(self):
+        rows = [
+            ["120", "3", "4", "2", "3", "1"],
+            [60, 1, 2, 0, 1, 5],
+            [120, 9, 9, 9, 9, 9],
+        ]
+        candles = Candles.create_from_rows(rows)
+        self.assertEqual(candles.timestamp.tolist(), [60, 120])
+        self.assertEqual(candles.timestamp.dtype, np.int64)
+        self.assertEqual(candles.open.tolist(), [1.0, 3.0])
+        self.assertEqual(candles.volume.tolist(), [5.0, 1.0])
+        self.assertTrue(candles.close.flags["C_CONTIGUOUS"])
+        self.assertEqual(candles.between(0, 120).timestamp.tolist(), [60])
+        self.assertEqual(len(Candles.create_from_rows([]).timestamp), 0)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class CandleDownloaderTest(unittest.TestCase):
+    def test_bitfinex(self):
+        route = BitfinexCandles()
+        with MockServer({"/candles/trade:1m:tBTCUSD/hist": route}) as server:
+            client = BitfinexV2.Public(base_url=server.url)
+            downloader = BitfinexV2.CandleDownloader(
+                client, "tBTCUSD", "1m", limit=100, concurrency=3
+            )
+            end = datetime.fromtimestamp(START + 250 * MINUTE, timezone.utc)
+            candles = downloader.download(START, end)
+        self.assertEqual(
+            sorted(route.windows),
+            [
+                (START, START + 100 * MINUTE),
+                (START + 100 * MINUTE, START + 200 * MINUTE),
+                (START + 200 * MINUTE, START + 250 * MINUTE),
+            ],
+        )
+        self.assertEqual(
+            candles.timestamp.tolist(), list(range(START, START + 250 * MINUTE, 60))
+        )
+        # OPEN, CLOSE, HIGH, LOW reordered
+        first = [column[0] for column in candles]
+        self.assertEqual(first, [START, START, START + 3, START - 1, START + 2, 1.5])
+
+    def test_retry_windows(self):
+        route = BitfinexCandles(failures=2)
+        with MockServer({"/candles/trade:1m:tBTCUSD/hist": route}) as server:
+            client = BitfinexV2.Public(base_url=server.url, max_retries=1)
+            downloader = BitfinexV2.CandleDownloader(
+                client, "tBTCUSD", "1m", limit=10, concurrency=1, retries=1
+            )
+            candles = downloader.download(START, START + 30 * MINUTE)
+            self.assertEqual(len(candles.timestamp), 30)
+            self.assertEqual(len(route.windows), 5)
+            # Not enough retries
+            route.failures = 2
+            downloader.retries = 0
+            with self.assertRaises(InvalidResponse):
+                downloader.download(START, START + 30 * MINUTE)
+
+    def test_kraken(self):
+        candles = [
+            [START + i * MINUTE, "1", "2", "0", "1", "1", "3", 1] for i in range(5)
+        ]
+        cursors = []
+
+        def ohlc(request):
+            since = int(query(request)["since"])
+            cursors.append(since)
+            # Two candles per response, the last one still open
+            page = [c for c in candles if c[0] >= since][:2]
+            last = page[-1][0] if page else since
+            return 200, {"error": [], "result": {"XXBTZUSD": page, "last": last}}
+
+        with MockServer({"/public/OHLC": ohlc}) as server:
+            client = Kraken.Public(base_url=server.url)
+            downloader = Kraken.CandleDownloader(client, "XXBTZUSD")
+            result = downloader.download(START, START + 4 * MINUTE)
+        self.assertEqual(
+            result.timestamp.tolist(), [START + i * MINUTE for i in range(4)]
+        )
+        self.assertEqual(result.volume.tolist(), [3.0] * 4)
+        self.assertEqual(cursors[:3], [START, START + MINUTE, START + 2 * MINUTE])
+
+    def test_buda(self):
+        windows = []
+
+        def reports(request):
+            params = query(request)
+            start, end = int(params["from"]), int(params["to"])
+            windows.append((start, end))
+            rows = [
+                [t * 1000, "1", "2", "0", "1", "5"] for t in range(start, end, 3600)
+            ]
+            return 200, {"reports": rows}
+
+        with MockServer({"/markets/BTC-CLP/reports": reports}) as server:
+            client = Buda.Public(base_url=server.url)
+            downloader = Buda.CandleDownloader(client, "BTC-CLP", window=86400)
+            candles = downloader.download(START, START + 2.5 * 86400)
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(len(candles.timestamp), 60)
+        self.assertEqual(candles.timestamp[-1], START + 59 * 3600)
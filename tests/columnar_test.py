@@ -0,0 +1,197 @@
+import math
+import unittest
+
+from trading_api_wrappers import SFOX, Bitex, BitfinexV2, Buda, CryptoMKT, Kraken, Ripio
+from trading_api_wrappers.bitfinex import models_v2
+from trading_api_wrappers.buda import models
+from trading_api_wrappers.columnar import (
+    BookSide,
+    ColumnarOrderBook,
+    np,
+    structured_array,
+)
+from trading_api_wrappers.schema import Field
+
+from tests.server import MockServer
+
+BOOK = {
+    "bids": [["99.0", "2.0"], ["100.0", "1.0"], ["98.0", "5.0"]],
+    "asks": [["101.0", "1.0"], ["102.0", "3.0"]],
+}
+BITFINEX_TRADES = [[2, 1546300801000, -0.5, 3800.5], [1, 1546300800000, 1.25, 3800]]
+BUDA_TRADES = {
+    "timestamp": "1546300801000",
+    "last_timestamp": "1546300800000",
+    "entries": [
+        ["1546300801000", "0.5", "2700000.0", "sell", 2],
+        ["1546300800000", "1.25", "2699000.0", "buy", 1],
+    ],
+}
+KRAKEN_TRADES = {
+    "error": [],
+    "result": {
+        "XXBTZUSD": [
+            ["3800.5", "0.5", 1546300800.1234, "s", "l", ""],
+            ["3801.0", "1.25", 1546300801.5, "b", "m", ""],
+        ],
+        "last": "1546300801500000000",
+    },
+}
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class ColumnarOrderBookTest(unittest.TestCase):
+    def setUp(self):
+        self.book = ColumnarOrderBook.create_from_json(BOOK)
+
+    def test_columns(self):
+        self.assertEqual(self.book.bids.price.dtype, np.float64)
+        self.assertEqual(self.book.bids.price.tolist(), [100.0, 99.0, 98.0])
+        self.assertEqual(self.book.bids.amount.tolist(), [1.0, 2.0, 5.0])
+        self.assertEqual(self.book.asks.price.tolist(), [101.0, 102.0])
+        self.assertEqual(self.book.spread, 1.0)
+
+    def test_cumulative(self):
+        self.assertEqual(self.book.bids.cumulative_amount().tolist(), [1, 3, 8])
+        self.assertEqual(self.book.asks.cumulative_quote().tolist(), [101, 407])
+
+    def test_vwap(self):
+        self.assertEqual(self.book.vwap("buy", 1), 101.0)
+        self.assertEqual(self.book.vwap("buy", 2), 101.5)
+        self.assertEqual(self.book.vwap("sell", 3), (100 + 2 * 99) / 3)
+        self.assertTrue(math.isnan(self.book.vwap("buy", 4.5)))
+        sizes = self.book.bids.vwap([0.5, 1, 8, 9])
+        self.assertEqual(sizes[:3].tolist(), [100.0, 100.0, (100 + 198 + 490) / 8])
+        self.assertTrue(math.isnan(sizes[3]))
+
+    def test_empty_side(self):
+        book = ColumnarOrderBook.create_from_json({"bids": [], "asks": BOOK["asks"]})
+        self.assertTrue(math.isnan(book.spread))
+        self.assertTrue(math.isnan(book.vwap("sell", 1)))
+
+    def test_dict_levels(self):
+        side = BookSide.create_from_json(
+            [{"price": 10, "amount": 1}, {"price": 11, "amount": 2}],
+            "price",
+            "amount",
+            descending=True,
+        )
+        self.assertEqual(side.price.tolist(), [11.0, 10.0])
+        self.assertEqual(side._replace(amount=side.amount * 2).amount.tolist(), [4, 2])
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class StructuredArrayTest(unittest.TestCase):
+    def test_schema(self):
+        trades = structured_array(BITFINEX_TRADES, models_v2.TradingTrade.schema)
+        self.assertEqual(trades.dtype.names, models_v2.TradingTrade._fields)
+        self.assertEqual(trades["MTS"].dtype, np.int64)
+        self.assertEqual(trades["AMOUNT"].tolist(), [-0.5, 1.25])
+        # Same values as the models
+        expected = [models_v2.TradingTrade.create_from_json(t) for t in BITFINEX_TRADES]
+        self.assertEqual([tuple(t) for t in trades.tolist()], expected)
+
+    def test_strings(self):
+        entries = structured_array(BUDA_TRADES["entries"], models.TradeEntry.schema)
+        self.assertEqual(entries["timestamp"].tolist(), [1546300801000, 1546300800000])
+        self.assertEqual(entries["price"].tolist(), [2700000.0, 2699000.0])
+        self.assertEqual(entries["direction"].tolist(), ["sell", "buy"])
+
+    def test_fields_without_dtype(self):
+        fields = [Field("a", 1, dtype="f8"), Field("b", 0)]
+        array = structured_array([[1, "2"], [3, "4"]], fields)
+        self.assertEqual(array.dtype.names, ("a",))
+        self.assertEqual(array["a"].tolist(), [2.0, 4.0])
+
+    def test_empty(self):
+        trades = structured_array([], models_v2.TradingTrade.schema)
+        self.assertEqual(len(trades), 0)
+        self.assertEqual(trades.dtype.names, models_v2.TradingTrade._fields)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class ClientColumnarTest(unittest.TestCase):
+    def setUp(self):
+        entries = [
+            {"price": "99", "amount": "2", "timestamp": "2019-01-01T00:00:00"},
+            {"price": "100", "amount": "1", "timestamp": "2019-01-01T00:00:00"},
+        ]
+        ripio = {"bids": entries, "asks": entries, "timestamp": 0, "last_price": 0}
+        self.server = MockServer(
+            {
+                "/markets/btc-clp/order_book": (200, {"order_book": BOOK}),
+                "/btc_usd/market/order_book": (200, BOOK),
+                "/markets/orderbook": (200, {**BOOK, "market_making": BOOK}),
+                "/book/": (200, {"BTC_ARS": ripio}),
+                "/book": (200, {"data": entries, "pagination": {}}),
+                "/trades/tBTCUSD/hist": (200, BITFINEX_TRADES),
+                "/book/tBTCUSD/R0": (200, [[123456789, 3800.5, -0.25]]),
+                "/candles/trade:1m:tBTCUSD/hist": (
+                    200,
+                    [[1546300800000, 1, 2, 3, 0.5, 10]],
+                ),
+                "/markets/btc-clp/trades": (200, {"trades": BUDA_TRADES}),
+                "/public/Trades": (200, KRAKEN_TRADES),
+            }
+        ).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_order_books(self):
+        url = self.server.url
+        for book in [
+            Buda.Public(base_url=url).order_book("btc-clp", columnar=True),
+            Bitex.Public(base_url=url).order_book("btc_usd", columnar=True),
+            SFOX.Public(base_url=url).order_book(market_making=True, columnar=True),
+            Ripio.Public(base_url=url).exchange.order_book("BTC_ARS", columnar=True),
+        ]:
+            with self.subTest(book=book):
+                self.assertIsInstance(book, ColumnarOrderBook)
+                self.assertEqual(book.bids.price[0], 100.0)
+
+    def test_cryptomkt_side(self):
+        client = CryptoMKT.Public(base_url=self.server.url)
+        side = client.order_book("ETHCLP", "buy", columnar=True)
+        self.assertEqual(side.price.tolist(), [100.0, 99.0])
+        side = client.order_book("ETHCLP", "sell", columnar=True)
+        self.assertEqual(side.price.tolist(), [99.0, 100.0])
+
+    def test_trades(self):
+        url = self.server.url
+        bitfinex = BitfinexV2.Public(base_url=url)
+        trades = bitfinex.trades("tBTCUSD", columnar=True)
+        self.assertEqual(trades["ID"].tolist(), [2, 1])
+        candles = bitfinex.candles_hist("tBTCUSD", "1m", columnar=True)
+        self.assertEqual(candles["CLOSE"].tolist(), [2.0])
+        buda = Buda.Public(base_url=url).trades("btc-clp", columnar=True)
+        self.assertEqual(buda.last_timestamp, 1546300800000)
+        self.assertEqual(buda.entries["amount"].tolist(), [0.5, 1.25])
+        kraken = Kraken.Public(base_url=url).trades("XBTUSD", columnar=True)
+        result = kraken["result"]
+        self.assertEqual(result["last"], "1546300801500000000")
+        self.assertEqual(result["XXBTZUSD"]["side"].tolist(), ["s", "b"])
+        self.assertEqual(result["XXBTZUSD"]["time"][0], 1546300800.1234)
+
+    def test_raw_book(self):
+        client = BitfinexV2.Public(base_url=self.server.url)
+        book = client.books("tBTCUSD", "R0", columnar=True)
+        self.assertEqual(book["ORDER_ID"].tolist(), [123456789])
+        self.assertEqual(book["PRICE"].tolist(), [3800.5])
+        self.assertEqual(book["AMOUNT"].tolist(), [-0.25])
+        (order,) = client.books("tBTCUSD", "R0")
+        self.assertIsInstance(order, models_v2.TradingRawBook)
+        self.assertEqual(order.PRICE, 3800.5)
+
+    def test_buda_trades_flags(self):
+        url = self.server.url
+        raw = Buda.Public(base_url=url, return_json=True).trades(
+            "btc-clp", columnar=True
+        )
+        self.assertEqual(raw, {"trades": BUDA_TRADES})
+        trades = Buda.Public(base_url=url).trades("btc-clp", columnar=True)
+        self.assertEqual(trades.json, BUDA_TRADES)
+        trades = Buda.Public(base_url=url, keep_json=False).trades(
+            "btc-clp", columnar=True
+        )
+        self.assertIsNone(trades.json)
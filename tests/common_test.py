@@ -0,0 +1,57 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from trading_api_wrappers import common
+
+
+class ParseDatetimeTest(unittest.TestCase):
+    def test_layouts(self):
+        cases = {
+            "2019-01-02T03:04:05.123Z": "%Y-%m-%dT%H:%M:%S.%fZ",
+            "2019-01-02T03:04:05.123456": "%Y-%m-%dT%H:%M:%S.%f",
+            "2019-01-02T03:04:05Z": "%Y-%m-%dT%H:%M:%SZ",
+            "2019-01-02 03:04:05.5": "%Y-%m-%d %H:%M:%S.%f",
+            "2019-01-02 03:04:05": "%Y-%m-%d %H:%M:%S",
+            "2019-01-02 03:04": "%Y-%m-%d %H:%M",
+        }
+        for value, fmt in cases.items():
+            with self.subTest(value=value):
+                expected = datetime.strptime(value, fmt)
+                self.assertEqual(common.parse_datetime(value), expected)
+                self.assertEqual(common._parse_fixed(value), expected)
+
+    def test_utc_offsets(self):
+        cases = {
+            "2019-01-02T03:04:05-03:00": datetime(2019, 1, 2, 6, 4, 5),
+            "2019-01-02T03:04:05.5+0130": datetime(2019, 1, 2, 1, 34, 5, 500000),
+            "2019-01-02 03:04+00:00": datetime(2019, 1, 2, 3, 4),
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(common.parse_datetime(value), expected)
+
+    @unittest.skipIf(common.ciso8601 is None, "ciso8601 is not installed")
+    def test_same_without_ciso8601(self):
+        values = ["2019-01-02T03:04:05.123Z", "2019-01-02T03:04:05-03:00"]
+        fast = [common.parse_datetime(value) for value in values]
+        common._parse_datetime.cache_clear()
+        with patch.object(common, "ciso8601", None):
+            self.assertEqual([common.parse_datetime(v) for v in values], fast)
+        common._parse_datetime.cache_clear()
+
+    def test_empty(self):
+        self.assertIsNone(common.parse_datetime(None))
+        self.assertIsNone(common.parse_datetime(""))
+
+    def test_invalid(self):
+        for value in ["2019/01/02 03:04", "2019-01-02T03:04:05.", "2019-13-02 03:04"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    common.parse_datetime(value)
+
+    def test_memoized(self):
+        common._parse_datetime.cache_clear()
+        for _ in range(3):
+            common.parse_datetime("2019-01-02T03:04:05.123Z")
+        self.assertEqual(common._parse_datetime.cache_info().hits, 2)
@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+
+from trading_api_wrappers import OXR, Bitex, CoinDesk
+from trading_api_wrappers.aio import aiohttp
+
+from tests.server import MockServer
+
+TRANSACTIONS = [[1546300800 - i, 100 - i, 3850.5 + i, 0.1] for i in range(10)]
+RATES = {"base": "USD", "rates": {"CLP": 700.5}}
+LAST_MODIFIED = "Tue, 01 Jan 2019 00:00:00 GMT"
+
+
+def etag_route(request):
+    if request["headers"].get("If-None-Match") == '"v1"':
+        return 304, b"", {"ETag": '"v1"'}
+    return 200, TRANSACTIONS, {"ETag": '"v1"'}
+
+
+def last_modified_route(request):
+    if request["headers"].get("If-Modified-Since") == LAST_MODIFIED:
+        return 304, b""
+    return 200, RATES, {"Last-Modified": LAST_MODIFIED}
+
+
+class ConditionalRequestTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(
+            {
+                "/btc_usd/market/transactions_archive": etag_route,
+                "/btc_usd/market/transactions": etag_route,
+                "/historical/2019-01-01.json": last_modified_route,
+            }
+        ).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_etag(self):
+        client = Bitex.Public(base_url=self.server.url)
+        first = client.transactions_archive("btc_usd")
+        second = client.transactions_archive("btc_usd")
+        self.assertEqual(first, second)
+        self.assertEqual(len(second), len(TRANSACTIONS))
+        headers = [request["headers"] for request in self.server.requests]
+        self.assertNotIn("If-None-Match", headers[0])
+        self.assertEqual(headers[1]["If-None-Match"], '"v1"')
+
+    def test_only_declared_endpoints(self):
+        client = Bitex.Public(base_url=self.server.url)
+        client.transactions("btc_usd")
+        client.transactions("btc_usd")
+        for request in self.server.requests:
+            self.assertNotIn("If-None-Match", request["headers"])
+
+    def test_last_modified(self):
+        client = OXR("APP_ID", base_url=self.server.url)
+        for _ in range(2):
+            self.assertEqual(client.historical("2019-01-01"), RATES)
+        request = self.server.requests[-1]
+        self.assertEqual(request["headers"]["If-Modified-Since"], LAST_MODIFIED)
+
+    def test_shared_by_sub_clients(self):
+        client = CoinDesk()
+        self.assertIs(client.rate("USD")._bpi.validators, client.validators)
+
+    @unittest.skipUnless(aiohttp, "aiohttp is not installed")
+    def test_async(self):
+        async def main():
+            async with Bitex.AsyncPublic(base_url=self.server.url) as client:
+                return [await client.transactions_archive("btc_usd") for _ in range(2)]
+
+        first, second = asyncio.run(main())
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.requests[1]["headers"]["If-None-Match"], '"v1"')
@@ -0,0 +1,55 @@
+import json
+import unittest
+
+from trading_api_wrappers import Buda, DecodeError
+from trading_api_wrappers.decoders import DECODERS, get_decoder
+
+from tests.server import MockServer
+
+
+class DecodersTest(unittest.TestCase):
+    def test_default_decoder(self):
+        self.assertIs(get_decoder(), next(iter(DECODERS.values())))
+        self.assertIs(get_decoder("json"), json.loads)
+
+    def test_unknown_decoder(self):
+        with self.assertRaises(ValueError):
+            get_decoder("simplejson")
+
+    def test_backends_decode_bytes(self):
+        content = '{"message": "precio inválido", "values": [1, 2.5]}'.encode()
+        for name, loads in DECODERS.items():
+            with self.subTest(decoder=name):
+                self.assertEqual(
+                    loads(content),
+                    {"message": "precio inválido", "values": [1, 2.5]},
+                )
+                with self.assertRaises(ValueError):
+                    loads(b"")
+
+
+class ClientDecoderTest(unittest.TestCase):
+    routes = {
+        "/markets": (200, {"markets": []}),
+        "/markets/BTC-CLP/ticker": (404, {"message": "not found"}),
+        "/markets/BTC-CLP/order_book": (200, b""),
+    }
+
+    def test_client_decoders(self):
+        calls = []
+
+        def loads(content):
+            calls.append(content)
+            return json.loads(content)
+
+        with MockServer(self.routes) as server:
+            for decoder in [*DECODERS, loads]:
+                client = Buda.Public(
+                    base_url=server.url, json_decoder=decoder, max_retries=1
+                )
+                self.assertEqual(client.markets(), [])
+                with self.assertRaisesRegex(Exception, "message: not found"):
+                    client.ticker("BTC-CLP")
+                with self.assertRaises(DecodeError):
+                    client.order_book("BTC-CLP")
+        self.assertEqual(calls[0], b'{"markets": []}')
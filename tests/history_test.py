@@ -0,0 +1,253 @@
+import json
+import os
+import tempfile
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+from trading_api_wrappers import Bitfinex, Bitstamp, Buda, Kraken
+from trading_api_wrappers.history import HistoryStore, HistorySync, Record
+
+from tests.server import MockServer
+
+START = 1546300800
+
+
+def records(*timestamps):
+    return [Record(f"T{t}", START + t, {"t": t}) for t in timestamps]
+
+
+class HistoryStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(os.path.join(self.dir.name, "history.db"))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_append(self):
+        self.assertIsNone(self.store.cursor("main", "feed"))
+        self.assertEqual(self.store.append("main", "feed", records(2, 0, 1)), 3)
+        self.assertEqual(self.store.cursor("main", "feed"), START + 2)
+        stored = list(self.store.records("main", "feed"))
+        self.assertEqual([r.id for r in stored], ["T0", "T1", "T2"])
+        self.assertEqual(stored[0].data, {"t": 0})
+        since = self.store.records("main", "feed", since=START + 1, until=START + 2)
+        self.assertEqual([r.id for r in since], ["T1"])
+
+    def test_deduplicate(self):
+        self.store.append("main", "feed", records(0, 1))
+        self.assertEqual(self.store.append("main", "feed", records(1, 2)), 1)
+        self.assertEqual(self.store.count("main", "feed"), 3)
+        # Accounts and feeds are apart
+        self.assertEqual(self.store.append("other", "feed", records(1)), 1)
+        self.assertEqual(self.store.append("main", "other", records(1)), 1)
+        self.assertEqual(self.store.count("main", "feed"), 3)
+
+    def test_interrupted(self):
+        self.store.batch_size = 2
+        self.store.append("main", "feed", records(0))
+
+        def fetch():
+            yield from records(1, 2)
+            raise ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            self.store.append("main", "feed", fetch())
+        # Stored batches are kept, the next sync starts from the old cursor
+        self.assertEqual(self.store.count("main", "feed"), 3)
+        self.assertEqual(self.store.cursor("main", "feed"), START)
+        self.assertEqual(self.store.append("main", "feed", records(1, 2, 3)), 1)
+        self.assertEqual(self.store.cursor("main", "feed"), START + 3)
+
+
+class KrakenLedgers:
+    """Ledgers endpoint, newest first, two entries per page."""
+
+    def __init__(self, *timestamps):
+        self.ledger = {f"L{t}": {"time": START + t} for t in timestamps}
+        self.queries = []
+
+    def __call__(self, request):
+        query = {k: v[0] for k, v in parse_qs(request["body"].decode()).items()}
+        self.queries.append(query)
+        start = float(query.get("start", 0))
+        ofs = int(query.get("ofs", 0))
+        entries = sorted(
+            ((k, v) for k, v in self.ledger.items() if v["time"] > start),
+            key=lambda item: -item[1]["time"],
+        )
+        page = dict(entries[ofs : ofs + 2])
+        return 200, {"error": [], "result": {"ledger": page, "count": len(entries)}}
+
+
+class BudaBalanceEvents:
+    """`balance_events`, newest first in pages of 2."""
+
+    def __init__(self, *seconds):
+        self.events = [self.event(s) for s in sorted(seconds, reverse=True)]
+        self.pages = []
+
+    @staticmethod
+    def event(second: int):
+        return {
+            "id": second,
+            "created_at": f"2019-01-01T00:00:0{second}.000Z",
+            "currency": "BTC",
+            "event": "deposit_confirm",
+        }
+
+    def __call__(self, request):
+        query = parse_qs(urlsplit(request["url"]).query)
+        page = int(query.get("page", ["1"])[0])
+        self.pages.append(page)
+        return 200, {
+            "balance_events": self.events[(page - 1) * 2 : page * 2],
+            "total_count": len(self.events),
+        }
+
+
+class FeedsTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(os.path.join(self.dir.name, "history.db"))
+        self.history = HistorySync(self.store, "main")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_kraken(self):
+        ledgers = KrakenLedgers(0, 1, 2, 3, 4)
+        with MockServer({"/private/Ledgers": ledgers}) as server:
+            client = Kraken.Auth("KEY", "U0VDUkVU", base_url=server.url)
+            feed = Kraken.LedgersFeed(client, asset="XXBT")
+            self.assertEqual(feed.name, "kraken:ledgers:asset=XXBT")
+            self.assertEqual(self.history.sync(feed), 5)
+            self.assertEqual([q.get("ofs") for q in ledgers.queries], [None, "2", "4"])
+            self.assertNotIn("start", ledgers.queries[0])
+            ledgers.ledger["L5"] = {"time": START + 5}
+            ledgers.queries.clear()
+            self.assertEqual(self.history.sync(feed), 1)
+            self.assertEqual(ledgers.queries[0]["start"], str(START + 3))
+        ids = [r.id for r in self.history.records(feed, since=START + 4)]
+        self.assertEqual(ids, ["L4", "L5"])
+
+    def test_bitstamp(self):
+        transactions = [
+            {"id": i, "datetime": f"2019-01-01 00:00:0{i}", "type": 2}
+            for i in reversed(range(5))
+        ]
+
+        def user_transactions(request):
+            query = {k: v[0] for k, v in parse_qs(request["body"].decode()).items()}
+            offset, limit = int(query.get("offset", 0)), int(query["limit"])
+            self.assertEqual(query["sort"], "desc")
+            return 200, transactions[offset : offset + limit]
+
+        routes = {"/v2/user_transactions/": user_transactions}
+        with MockServer(routes) as server:
+            client = Bitstamp.Auth("KEY", "SECRET", "1", base_url=server.url)
+            feed = Bitstamp.UserTransactionsFeed(client)
+            feed.limit = 2
+            self.assertEqual(self.history.sync(feed), 5)
+            transactions.insert(
+                0, {"id": 5, "datetime": "2019-01-01 00:00:05.5", "type": 2}
+            )
+            server.requests.clear()
+            self.assertEqual(self.history.sync(feed), 1)
+            # Stops at the first transaction older than the cursor
+            self.assertEqual(len(server.requests), 2)
+        self.assertEqual(self.store.cursor("main", feed.name), START + 5.5)
+
+    def test_bitfinex(self):
+        entries = [
+            {"currency": "USD", "amount": "1.0", "balance": str(i), "timestamp": str(i)}
+            for i in reversed(range(START, START + 5))
+        ]
+        untils = []
+
+        def history(request):
+            body = json.loads(request["body"])
+            untils.append(body.get("until"))
+            page = [
+                e
+                for e in entries
+                if (body.get("until") is None or float(e["timestamp"]) <= body["until"])
+                and (
+                    body.get("since") is None or float(e["timestamp"]) >= body["since"]
+                )
+            ]
+            return 200, page[: body["limit"]]
+
+        with MockServer({"/history": history}) as server:
+            client = Bitfinex.Auth("KEY", "SECRET", base_url=server.url)
+            feed = Bitfinex.BalanceHistoryFeed(client, "usd")
+            feed.limit = 3
+            self.assertEqual(self.history.sync(feed), 5)
+            # Pages overlap at the oldest timestamp of the previous page
+            self.assertEqual(untils, [None, START + 2, START])
+            self.assertEqual(self.history.sync(feed), 0)
+        self.assertEqual(self.store.count("main", feed.name), 5)
+
+    def test_bitfinex_same_timestamp(self):
+        entry = {"currency": "USD", "amount": "1.0", "balance": "2.0"}
+        entries = [{**entry, "timestamp": str(START)}] * 2
+
+        def history(request):
+            return 200, entries[: json.loads(request["body"])["limit"]]
+
+        with MockServer({"/history": history}) as server:
+            client = Bitfinex.Auth("KEY", "SECRET", base_url=server.url)
+            feed = Bitfinex.BalanceHistoryFeed(client, "usd")
+            # Equal entries of the same timestamp are kept apart
+            self.assertEqual(self.history.sync(feed), 2)
+            self.assertEqual(self.history.sync(feed), 0)
+            entries.insert(0, {**entry, "timestamp": str(START)})
+            self.assertEqual(self.history.sync(feed), 1)
+            # A full page of one timestamp can't be paged past
+            feed.limit = 3
+            with self.assertRaises(RuntimeError):
+                self.history.sync(feed)
+        self.assertEqual(self.store.count("main", feed.name), 3)
+
+    def test_bitfinex_trades(self):
+        trades = [{"tid": t, "timestamp": str(START + t)} for t in range(4)]
+
+        def mytrades(request):
+            body = json.loads(request["body"])
+            self.assertTrue(body["reverse"])
+            page = [
+                t for t in trades if float(t["timestamp"]) >= body.get("timestamp", 0)
+            ]
+            return 200, page[: body["limit_trades"]]
+
+        with MockServer({"/mytrades": mytrades}) as server:
+            client = Bitfinex.Auth("KEY", "SECRET", base_url=server.url)
+            feed = Bitfinex.PastTradesFeed(client, "btcusd")
+            feed.limit = 2
+            self.assertEqual(self.history.sync(feed), 4)
+            trades[3:] = [{"tid": t, "timestamp": str(START + 4)} for t in [4, 5, 6]]
+            # Trades after the first full page of one second aren't dropped
+            with self.assertRaises(RuntimeError):
+                self.history.sync(feed)
+        self.assertEqual(self.store.cursor("main", feed.name), START + 3)
+
+    def test_buda(self):
+        for keep_json in [True, False]:
+            with self.subTest(keep_json=keep_json):
+                events = BudaBalanceEvents(0, 1, 2, 3, 4)
+                history = HistorySync(self.store, f"buda-{keep_json}")
+                with MockServer({"/balance_events": events}) as server:
+                    client = Buda.Auth(
+                        "KEY", "SECRET", base_url=server.url, keep_json=keep_json
+                    )
+                    feed = Buda.BalanceEventsFeed(client, ["BTC"], ["deposit_confirm"])
+                    self.assertEqual(history.sync(feed), 5)
+                    self.assertEqual(sorted(events.pages), [1, 2, 3])
+                    events.events.insert(0, events.event(5))
+                    events.pages.clear()
+                    self.assertEqual(history.sync(feed), 1)
+                    # Stops at the first event older than the cursor
+                    self.assertEqual(events.pages, [1, 2])
+                stored = list(history.records(feed))
+                self.assertEqual([r.id for r in stored], ["0", "1", "2", "3", "4", "5"])
+                self.assertEqual(stored[0].data, events.event(0))
@@ -0,0 +1,229 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import unittest
+
+from trading_api_wrappers import Kraken, RateLimitExceeded
+from trading_api_wrappers.base import parse_seconds
+from trading_api_wrappers.limiter import (
+    AdaptiveTokenBucket,
+    FileTokenBucket,
+    LeakyBucket,
+    RateLimiter,
+    TokenBucket,
+)
+
+from tests.server import MockServer
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def reserve_in_process(path, count, queue):
+    bucket = FileTokenBucket(rate=1, capacity=1, path=path)
+    queue.put([bucket.reserve() for _ in range(count)])
+
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def bucket(self, cls, *args, **kwargs):
+        bucket = cls.__new__(cls)
+        bucket.clock = self.clock
+        bucket.__init__(*args, **kwargs)
+        return bucket
+
+    def test_burst_capacity(self):
+        bucket = self.bucket(TokenBucket, rate=2, capacity=3)
+        delays = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(delays, [0, 0, 0, 0.5, 1.0])
+
+    def test_refill(self):
+        bucket = self.bucket(TokenBucket, rate=2, capacity=3)
+        for _ in range(3):
+            bucket.reserve()
+        self.clock.now = 1
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0.5)
+
+    def test_weights(self):
+        bucket = self.bucket(TokenBucket, rate=1, capacity=2)
+        self.assertEqual(bucket.reserve(2), 0)
+        self.assertEqual(bucket.reserve(2), 2)
+
+    def test_leaky_bucket_spacing(self):
+        bucket = self.bucket(LeakyBucket, rate=4)
+        delays = [bucket.reserve() for _ in range(3)]
+        self.assertEqual(delays, [0, 0.25, 0.5])
+
+    def test_thread_safe(self):
+        bucket = self.bucket(TokenBucket, rate=1, capacity=1)
+        delays = []
+
+        def reserve():
+            for _ in range(100):
+                delays.append(bucket.reserve())
+
+        threads = [threading.Thread(target=reserve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(delays), list(range(800)))
+
+    def test_retry_after_blocks(self):
+        bucket = self.bucket(TokenBucket, rate=2, capacity=3)
+        bucket.on_rate_limited(retry_after=5)
+        self.assertEqual(bucket.reserve(), 5)
+        self.assertEqual(bucket.reserve(), 5.5)
+
+    def test_quota(self):
+        bucket = self.bucket(TokenBucket, rate=1, capacity=10)
+        bucket.on_quota(remaining=2)
+        self.assertEqual(bucket.budget().tokens, 2)
+        bucket.on_quota(remaining=0, reset=30)
+        self.assertEqual(bucket.reserve(), 30)
+
+    def test_budget(self):
+        bucket = self.bucket(TokenBucket, rate=2, capacity=3)
+        bucket.reserve()
+        self.clock.now = 0.25
+        self.assertEqual(bucket.budget(), (2, 3, 2.5))
+
+
+class AdaptiveTokenBucketTest(TokenBucketTest):
+    def test_decrease_on_rate_limit(self):
+        bucket = self.bucket(AdaptiveTokenBucket, rate=8, min_rate=1, cooldown=1)
+        bucket.on_rate_limited()
+        self.assertEqual(bucket.rate, 4)
+        # Several errors from requests already in flight count once
+        bucket.on_rate_limited()
+        self.assertEqual(bucket.rate, 4)
+        for now in range(1, 5):
+            self.clock.now = now
+            bucket.on_rate_limited()
+        self.assertEqual(bucket.rate, 1)
+
+    def test_increase_over_time(self):
+        bucket = self.bucket(AdaptiveTokenBucket, rate=8, max_rate=10, increase=1)
+        bucket.on_rate_limited()
+        self.clock.now = 2
+        bucket.on_success()
+        self.assertEqual(bucket.rate, 6)
+        self.clock.now = 10
+        bucket.on_success()
+        self.assertEqual(bucket.rate, 10)
+
+
+class FileTokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_shared_across_processes(self):
+        queue = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=reserve_in_process, args=(self.path, 5, queue)
+            )
+            for _ in range(3)
+        ]
+        for process in processes:
+            process.start()
+        delays = sum((queue.get(timeout=10) for _ in processes), [])
+        for process in processes:
+            process.join()
+        # Every reservation queues behind the previous ones, ~1 second apart
+        delays.sort()
+        self.assertEqual(len(delays), 15)
+        self.assertEqual(delays[0], 0)
+        for previous, delay in zip(delays, delays[1:]):
+            self.assertGreater(delay - previous, 0.9)
+
+    def test_requires_name_or_path(self):
+        with self.assertRaises(ValueError):
+            FileTokenBucket(rate=1)
+
+
+class RecordingLimiter(RateLimiter):
+    def __init__(self):
+        self.weights = []
+
+    def reserve(self, weight=1):
+        self.weights.append(weight)
+        return 0
+
+
+class ClientLimiterTest(unittest.TestCase):
+    def test_default_limiter(self):
+        self.assertIsNone(Kraken.Public().limiter)
+        client = Kraken.Public(rate_limit=500)
+        self.assertIsInstance(client.limiter, LeakyBucket)
+        self.assertEqual(client.limiter.rate, 2)
+
+    def test_endpoint_weights(self):
+        limiter = RecordingLimiter()
+        ok = (200, {"error": [], "result": {}})
+        routes = {
+            "/private/Balance": ok,
+            "/private/Ledgers": ok,
+            "/private/AddOrder": ok,
+        }
+        with MockServer(routes) as server:
+            client = Kraken.Auth(
+                "KEY", "U0VDUkVU", base_url=server.url, limiter=limiter
+            )
+            client.balance()
+            client.ledgers()
+            client.add_order("XBTUSD", "buy", "market", 1)
+        self.assertEqual(limiter.weights, [1, 2])
+
+    def test_rate_limit_errors(self):
+        bucket = AdaptiveTokenBucket(rate=10, capacity=10)
+        routes = {
+            "/public/Time": (200, {"error": ["EAPI:Rate limit exceeded"]}),
+            "/public/Assets": (429, {"error": []}, {"Retry-After": "60"}),
+        }
+        with MockServer(routes) as server:
+            client = Kraken.Public(base_url=server.url, limiter=bucket, timeout=1)
+            client.retry_policy.max_tries = 1
+            with self.assertRaises(RateLimitExceeded):
+                client.server_time()
+            self.assertEqual(client.rate_budget.rate, 5)
+            # Retrying before Retry-After, within the client timeout, is pointless
+            client.retry_policy.max_tries = 3
+            with self.assertRaises(RateLimitExceeded) as cm:
+                client.assets()
+            self.assertEqual(cm.exception.retry_after, 60)
+            self.assertEqual(len(server.requests), 2)
+            self.assertLess(bucket.budget().tokens, -50 * bucket.rate)
+
+    def test_rate_limit_headers(self):
+        headers = {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1"}
+        routes = {"/public/Time": (200, {"error": [], "result": {}}, headers)}
+        with MockServer(routes) as server:
+            client = Kraken.Public(
+                base_url=server.url, limiter=TokenBucket(rate=1, capacity=10)
+            )
+            client.server_time()
+            self.assertLess(client.rate_budget.tokens, 4)
+
+    def test_parse_seconds(self):
+        now = 1600000000
+        self.assertEqual(parse_seconds("120", now), 120)
+        self.assertEqual(parse_seconds(str(now + 30), now), 30)
+        self.assertEqual(parse_seconds(str((now + 30) * 1000), now), 30)
+        self.assertEqual(parse_seconds("Sun, 13 Sep 2020 12:28:20 GMT", now), 100)
+        self.assertIsNone(parse_seconds("soon", now))
+        self.assertIsNone(parse_seconds(None, now))
@@ -0,0 +1,207 @@
+import asyncio
+import unittest
+
+from trading_api_wrappers import Buda, Ripio
+from trading_api_wrappers.aio import aiohttp
+from trading_api_wrappers.buda import models
+from trading_api_wrappers.lazy import LazyList, build_list
+from trading_api_wrappers.schema import without_payload
+
+from tests.server import MockServer
+
+ORDER = {
+    "id": 1,
+    "account_id": 1,
+    "amount": ["1.0", "BTC"],
+    "created_at": "2019-01-01T00:00:00.000Z",
+    "fee_currency": "BTC",
+    "limit": ["3000000.0", "CLP"],
+    "market_id": "BTC-CLP",
+    "original_amount": ["1.0", "BTC"],
+    "paid_fee": ["0.0", "BTC"],
+    "price_type": "limit",
+    "state": "traded",
+    "total_exchanged": ["3000000.0", "CLP"],
+    "traded_amount": ["1.0", "BTC"],
+    "type": "Bid",
+}
+ORDER_BOOK = {
+    "order_book": {
+        "asks": [["101.0", "1.0"], ["102.0", "2.0"]],
+        "bids": [["99.0", "1.5"]],
+    }
+}
+RIPIO_BOOK = {
+    "bids": [{"price": "99", "amount": "2", "orders": 1}],
+    "asks": [{"price": "101", "amount": "1", "orders": 1}],
+    "timestamp": 1546300800,
+    "last_price": "100",
+}
+ORDERS = {
+    "orders": [ORDER, {**ORDER, "id": 2}],
+    "meta": {"current_page": 1, "total_count": 2, "total_pages": 1},
+}
+
+
+class LazyListTest(unittest.TestCase):
+    def setUp(self):
+        self.built = []
+
+        def builder(item):
+            self.built.append(item)
+            return item * 10
+
+        self.items = LazyList([1, 2, 3], builder)
+
+    def test_on_access(self):
+        self.assertEqual(len(self.items), 3)
+        self.assertEqual(self.built, [])
+        self.assertEqual(self.items[0], 10)
+        self.assertEqual(self.items[-1], 30)
+        self.assertEqual(self.items[0], 10)
+        # Memoized
+        self.assertEqual(self.built, [1, 3])
+
+    def test_sequence(self):
+        self.assertEqual(list(self.items), [10, 20, 30])
+        self.assertEqual(self.items[1:], [20, 30])
+        self.assertEqual(self.items, [10, 20, 30])
+        self.assertIn(20, self.items)
+        self.assertEqual(self.built, [1, 2, 3])
+        with self.assertRaises(IndexError):
+            self.items[3]
+
+    def test_map(self):
+        self.assertEqual(list(self.items.map(str)), ["10", "20", "30"])
+
+
+class BuildWithoutJSONTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Buda.Public(keep_json=False)
+
+    def test_nested(self):
+        pages = self.client._build(
+            ORDERS,
+            lambda d: models.OrderPages.create_from_json(d["orders"], d["meta"]),
+        )
+        self.assertIsInstance(pages, models.OrderPages)
+        self.assertEqual([o.json for o in pages.orders], [None, None])
+        self.assertEqual(pages.orders[0].amount, models.Amount(1.0, "BTC"))
+        self.assertEqual(pages.meta.total_pages, 1)
+
+    def test_lazy(self):
+        self.client.lazy_models = True
+        pages = self.client._build(
+            ORDERS,
+            lambda d: models.OrderPages.create_from_json(
+                d["orders"], d["meta"], lazy=self.client.lazy_models
+            ),
+        )
+        self.assertIsInstance(pages.orders, LazyList)
+        # Built on access, after `_build` returned
+        self.assertEqual([o.json for o in pages.orders], [None, None])
+
+    def test_dict(self):
+        books = self.client._model(
+            {"BTC_ARS": RIPIO_BOOK},
+            lambda d: {
+                k: Ripio.models.OrderBook.create_from_json(v) for k, v in d.items()
+            },
+        )
+        self.assertIsNone(books["BTC_ARS"].json)
+        self.assertEqual(books["BTC_ARS"].bids[0].price, "99")
+
+    def test_keep_json(self):
+        order = Buda.Public()._model(ORDER, models.Order.create_from_json)
+        self.assertEqual(order.json, ORDER)
+
+
+class WithoutPayloadTest(unittest.TestCase):
+    def test_built_without_payload(self):
+        with without_payload():
+            order = models.Order.create_from_json(ORDER)
+            book = Ripio.models.OrderBook.create_from_json(RIPIO_BOOK)
+        self.assertIsNone(order.json)
+        self.assertIsNone(book.json)
+        self.assertEqual(order.id, 1)
+        # Back to keeping it
+        self.assertEqual(models.Order.create_from_json(ORDER).json, ORDER)
+
+    def test_lazy_list(self):
+        with without_payload():
+            orders = build_list([ORDER], models.Order.create_from_json, lazy=True)
+        # Built on access, out of the block
+        self.assertIsNone(orders[0].json)
+
+
+class ClientModelsTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(
+            {
+                "/markets/BTC-CLP/orders": (200, ORDERS),
+                "/markets/BTC-CLP/order_book": (200, ORDER_BOOK),
+            }
+        )
+        self.server.__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def client(self, cls=Buda.Auth, **kwargs):
+        return cls("KEY", "SECRET", base_url=self.server.url, **kwargs)
+
+    def test_default(self):
+        orders = self.client().order_pages("BTC-CLP")
+        self.assertEqual(orders.orders[0].json, ORDER)
+
+    def test_drop(self):
+        client = self.client(keep_json=False)
+        orders = client.order_pages("BTC-CLP").orders
+        self.assertEqual([o.id for o in orders], [1, 2])
+        self.assertIsNone(orders[0].json)
+        self.assertEqual(orders[0].amount, models.Amount(1.0, "BTC"))
+        orders = list(client.iter_orders("BTC-CLP"))
+        self.assertEqual([o.json for o in orders], [None, None])
+
+    def test_lazy(self):
+        client = self.client(lazy_models=True)
+        book = client.order_book("BTC-CLP")
+        self.assertIsInstance(book.asks, LazyList)
+        self.assertEqual(book.asks[0], models.OrderBookEntry(101.0, 1.0))
+        self.assertEqual(book, self.client().order_book("BTC-CLP"))
+        orders = client.order_pages("BTC-CLP").orders
+        self.assertEqual(orders[1].json, {**ORDER, "id": 2})
+
+    def test_lazy_drop(self):
+        client = self.client(lazy_models=True, keep_json=False)
+        orders = client.order_pages("BTC-CLP").orders
+        self.assertIsInstance(orders, LazyList)
+        self.assertEqual([o.json for o in orders], [None, None])
+
+    def test_built_once(self):
+        built = []
+
+        def builder(order):
+            built.append(order["id"])
+            return models.Order.create_from_json(order)
+
+        client = self.client(keep_json=False)
+        order = client._model(ORDER, builder)
+        self.assertIsNone(order.json)
+        self.assertEqual(built, [1])
+
+    def test_ripio_order_books(self):
+        with MockServer({"/book/": (200, {"BTC_ARS": RIPIO_BOOK})}) as server:
+            client = Ripio.Public(base_url=server.url, keep_json=False)
+            books = client.exchange.order_books()
+        self.assertIsNone(books["BTC_ARS"].json)
+        self.assertEqual(books["BTC_ARS"].bids[0].price, "99")
+
+    @unittest.skipUnless(aiohttp, "aiohttp is not installed")
+    def test_async(self):
+        async def main():
+            async with self.client(Buda.AsyncAuth, keep_json=False) as client:
+                return await client.order_pages("BTC-CLP")
+
+        orders = asyncio.run(main()).orders
+        self.assertIsNone(orders[0].json)
@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import unittest
+
+from trading_api_wrappers import Buda, CryptoMKT
+from trading_api_wrappers.nonce import FileNonceGenerator, NonceGenerator
+
+NOW = 1546300800000000
+
+
+def nonces_in_process(path: str, count: int, queue):
+    generator = FileNonceGenerator(path=path)
+    queue.put([generator.next(NOW) for _ in range(count)])
+
+
+class NonceGeneratorTest(unittest.TestCase):
+    def generator(self):
+        return NonceGenerator()
+
+    def test_follows_clock(self):
+        generator = self.generator()
+        self.assertEqual(generator.next(NOW), NOW)
+        self.assertEqual(generator.next(NOW + 10), NOW + 10)
+
+    def test_strictly_increasing(self):
+        generator = self.generator()
+        nonces = [generator.next(NOW) for _ in range(3)]
+        # Same clock value or a clock going back
+        nonces.append(generator.next(NOW - 100))
+        self.assertEqual(nonces, [NOW, NOW + 1, NOW + 2, NOW + 3])
+        self.assertEqual(generator.last, NOW + 3)
+
+    def test_thread_safe(self):
+        generator = self.generator()
+        nonces = []
+
+        def take():
+            for _ in range(100):
+                nonces.append(generator.next(NOW))
+
+        threads = [threading.Thread(target=take) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(nonces), list(range(NOW, NOW + 800)))
+
+
+class FileNonceGeneratorTest(NonceGeneratorTest):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def generator(self):
+        return FileNonceGenerator(path=self.path)
+
+    def test_persists_high_water_mark(self):
+        self.generator().next(NOW + 100)
+        # A new generator (ex. after a restart) with the clock behind
+        self.assertEqual(self.generator().next(NOW), NOW + 101)
+
+    def test_shared_across_processes(self):
+        queue = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=nonces_in_process, args=(self.path, 50, queue)
+            )
+            for _ in range(3)
+        ]
+        for process in processes:
+            process.start()
+        nonces = sum((queue.get(timeout=10) for _ in processes), [])
+        for process in processes:
+            process.join()
+        self.assertEqual(sorted(nonces), list(range(NOW, NOW + 150)))
+
+    def test_requires_name_or_path(self):
+        with self.assertRaises(ValueError):
+            FileNonceGenerator()
+
+
+class AuthNoncesTest(unittest.TestCase):
+    def test_shared_generator(self):
+        nonces = NonceGenerator()
+        clients = [Buda.Auth("KEY", "SECRET", nonces=nonces) for _ in range(2)]
+        for client in clients:
+            client.auth._nonce = lambda: NOW
+        issued = [int(client.auth.new_nonce()) for client in clients * 2]
+        self.assertEqual(issued, [NOW, NOW + 1, NOW + 2, NOW + 3])
+        self.assertEqual(clients[0].auth.last_nonce, NOW + 2)
+
+    def test_default_generator(self):
+        client = Buda.Auth("KEY", "SECRET")
+        self.assertIsInstance(client.auth.nonces, NonceGenerator)
+        self.assertIsNone(client.nonces)
+        first = int(client.auth.new_nonce())
+        self.assertGreater(int(client.auth.new_nonce()), first)
+
+    def test_cryptomkt_wall_clock(self):
+        client = CryptoMKT.Auth("KEY", "SECRET", nonces=NonceGenerator())
+        seconds = NOW // 1000000
+        client.auth._nonce = lambda: seconds
+        # A burst within the same second keeps the server time
+        issued = {int(client.auth.new_nonce()) for _ in range(50)}
+        self.assertEqual(issued, {seconds})
+        self.assertEqual(client.auth.nonces.last, 0)
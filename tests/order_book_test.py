@@ -0,0 +1,116 @@
+import asyncio
+import random
+import unittest
+
+from trading_api_wrappers import BitfinexV2
+from trading_api_wrappers.bitfinex.models_v2 import TradingBook
+
+from tests.server import MockServer
+
+SNAPSHOT = [
+    [3850.0, 2, 1.5],
+    [3849.5, 1, 0.25],
+    [3848.0, 3, 4.0],
+    [3851.0, 1, -0.5],
+    [3852.5, 4, -2.0],
+]
+
+
+class OrderBookTest(unittest.TestCase):
+    def setUp(self):
+        self.book = BitfinexV2.OrderBook(SNAPSHOT)
+
+    def test_snapshot(self):
+        self.assertEqual(len(self.book), 5)
+        self.assertEqual(self.book.best_bid, TradingBook(3850.0, 2, 1.5))
+        self.assertEqual(self.book.best_ask, TradingBook(3851.0, 1, -0.5))
+        self.assertEqual(self.book.spread, 1.0)
+
+    def test_depth(self):
+        bids, asks = self.book.depth(2)
+        self.assertEqual([b.PRICE for b in bids], [3850.0, 3849.5])
+        self.assertEqual([a.PRICE for a in asks], [3851.0, 3852.5])
+        bids, asks = self.book.depth()
+        self.assertEqual([b.PRICE for b in bids], [3850.0, 3849.5, 3848.0])
+        self.assertEqual(self.book.depth(0), ([], []))
+
+    def test_updates(self):
+        # New best bid, changed ask level, removed bid and ask levels
+        self.book.update([3850.5, 1, 0.1])
+        self.book.update(TradingBook(3852.5, 5, -3.0))
+        self.book.update([3849.5, 0, 1])
+        self.book.update([3851.0, 0, -1])
+        bids, asks = self.book.depth()
+        self.assertEqual([b.PRICE for b in bids], [3850.5, 3850.0, 3848.0])
+        self.assertEqual(asks, [TradingBook(3852.5, 5, -3.0)])
+        # Removing a missing level is a no-op
+        self.book.update([1000.0, 0, 1])
+        self.assertEqual(len(self.book), 4)
+
+    def test_level_switches_side(self):
+        self.book.update([3850.0, 1, -0.75])
+        bids, asks = self.book.depth()
+        self.assertEqual([b.PRICE for b in bids], [3849.5, 3848.0])
+        self.assertEqual(self.book.best_ask, TradingBook(3850.0, 1, -0.75))
+        self.assertEqual(len(self.book), 5)
+
+    def test_empty_side(self):
+        self.book.snapshot([[3850.0, 1, 1.0]])
+        self.assertIsNone(self.book.best_ask)
+        self.assertIsNone(self.book.spread)
+        self.assertEqual(len(self.book), 1)
+
+    def test_matches_reference_book(self):
+        rng = random.Random(575)
+        self.book.snapshot([])
+        levels = {}
+        for _ in range(2000):
+            price = rng.randrange(100) / 2
+            count = rng.choice([0, 0, 1, 3])
+            amount = rng.choice([1, -1]) * rng.random()
+            self.book.update([price, count, amount])
+            # One level per price, on the side of its last update
+            if count:
+                levels[price] = amount
+            elif (levels.get(price, 0) > 0) == (amount > 0):
+                levels.pop(price, None)
+        bids, asks = self.book.depth()
+        expected = sorted(p for p, a in levels.items() if a > 0)
+        self.assertEqual([b.PRICE for b in bids], expected[::-1])
+        self.assertEqual(
+            [a.PRICE for a in asks], sorted(p for p, a in levels.items() if a < 0)
+        )
+        self.assertEqual(len(self.book), len(levels))
+
+
+class ClientOrderBookTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(
+            {
+                "/book/tBTCUSD/P0": (200, SNAPSHOT),
+                "/book/tBTCUSD/R0": (200, [[123456789, 3800.5, -0.25]]),
+            }
+        ).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_order_book(self):
+        client = BitfinexV2.Public(base_url=self.server.url)
+        book = client.order_book("tBTCUSD", "P0", length=25)
+        self.assertEqual(book.best_bid.PRICE, 3850.0)
+        self.assertEqual(self.server.requests[0]["url"], "/book/tBTCUSD/P0?len=25")
+
+    def test_raw_book(self):
+        client = BitfinexV2.Public(base_url=self.server.url)
+        with self.assertRaises(ValueError):
+            client.order_book("tBTCUSD", "R0")
+        self.assertEqual(self.server.requests, [])
+
+    def test_async_order_book(self):
+        async def order_book():
+            async with BitfinexV2.AsyncPublic(base_url=self.server.url) as client:
+                return await client.order_book("tBTCUSD", "P0")
+
+        book = asyncio.run(order_book())
+        self.assertEqual(book.best_ask.PRICE, 3851.0)
@@ -0,0 +1,180 @@
+import asyncio
+import math
+import threading
+import time
+import unittest
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+from trading_api_wrappers import Buda
+
+from tests.server import MockServer
+
+PAGES = 6
+PER_PAGE = 3
+
+
+def order(order_id: int):
+    amount = ["1.0", "BTC"]
+    return {
+        "id": order_id,
+        "account_id": 1,
+        "amount": amount,
+        "created_at": "2019-01-01T00:00:00.000Z",
+        "fee_currency": "BTC",
+        "limit": ["3000000.0", "CLP"],
+        "market_id": "BTC-CLP",
+        "original_amount": amount,
+        "paid_fee": ["0.0", "BTC"],
+        "price_type": "limit",
+        "state": "traded",
+        "total_exchanged": ["3000000.0", "CLP"],
+        "traded_amount": amount,
+        "type": "Bid",
+    }
+
+
+def balance_event(event_id: int):
+    amounts = ["amount", "available_amount", "frozen_amount", "frozen_for_fee"]
+    amounts += ["pending_withdraw_amount"]
+    event = {
+        "id": event_id,
+        "account_id": 1,
+        "created_at": "2019-01-01T00:00:00.000Z",
+        "currency": "BTC",
+        "event": "deposit_confirm",
+        "event_ids": [event_id],
+        "transaction_type": "deposit",
+        "transfer_description": None,
+    }
+    for amount in amounts:
+        event[f"new_{amount}"] = ["1.0", "BTC"]
+        event[f"old_{amount}"] = ["0.0", "BTC"]
+    return event
+
+
+class PagedRoute:
+    """Paginated endpoint, slow enough to tell concurrent requests apart."""
+
+    def __init__(self, key, item, meta=True, delay=0.05, total=PAGES * PER_PAGE):
+        self.key, self.item, self.meta, self.delay = key, item, meta, delay
+        self.total = total
+        self.lock = threading.Lock()
+        self.active = self.max_active = 0
+        self.pages = []
+
+    def __call__(self, request):
+        query = parse_qs(urlsplit(request["url"]).query)
+        page = int(query.get("page", ["1"])[0])
+        with self.lock:
+            self.pages.append(page)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        per = int(query.get("per", [PER_PAGE])[0])
+        first = (page - 1) * per
+        ids = range(first, min(first + per, self.total))
+        body = {self.key: [self.item(i) for i in ids]}
+        if self.meta:
+            body["meta"] = {
+                "current_page": page,
+                "total_count": self.total,
+                "total_pages": math.ceil(self.total / per),
+            }
+        else:
+            body["total_count"] = self.total
+        return 200, body
+
+
+class IterPagesTest(unittest.TestCase):
+    def setUp(self):
+        self.orders = PagedRoute("orders", order)
+        self.deposits = PagedRoute("deposits", lambda i: {"id": i})
+        self.events = PagedRoute("balance_events", balance_event, meta=False)
+        self.server = MockServer(
+            {
+                "/markets/BTC-CLP/orders": self.orders,
+                "/currencies/BTC/deposits": self.deposits,
+                "/balance_events": self.events,
+            }
+        ).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def client(self, cls=Buda.Auth, **kwargs):
+        return cls("KEY", "SECRET", base_url=self.server.url, **kwargs)
+
+    def test_iter_orders(self):
+        orders = list(self.client().iter_orders("BTC-CLP", concurrency=3))
+        self.assertEqual([o.id for o in orders], list(range(PAGES * PER_PAGE)))
+        self.assertIsInstance(orders[0], Buda.models.Order)
+        self.assertEqual(sorted(self.orders.pages), list(range(1, PAGES + 1)))
+        self.assertEqual(self.orders.max_active, 3)
+
+    def test_return_json(self):
+        client = self.client(return_json=True)
+        deposits = list(client.iter_deposits("BTC", concurrency=2))
+        self.assertEqual([d["id"] for d in deposits], list(range(PAGES * PER_PAGE)))
+        events = client.iter_balance_events(["BTC"], ["deposit_confirm"])
+        self.assertEqual(len(list(events)), PAGES * PER_PAGE)
+        self.assertEqual(sorted(self.events.pages), list(range(1, PAGES + 1)))
+
+    def test_default_concurrency(self):
+        client = self.client()
+        orders = list(client.iter_orders("BTC-CLP"))
+        self.assertEqual([o.id for o in orders], list(range(PAGES * PER_PAGE)))
+        self.assertEqual(self.orders.max_active, client.page_concurrency)
+
+    def test_ordered_nonces(self):
+        client = self.client()
+        client.session.auth.ordered_nonces = True
+        orders = list(client.iter_orders("BTC-CLP"))
+        self.assertEqual(len(orders), PAGES * PER_PAGE)
+        # Signed requests go one at a time
+        self.assertEqual(self.orders.max_active, 1)
+        self.assertEqual(self.orders.pages, list(range(1, PAGES + 1)))
+
+    def test_balance_events_per_page(self):
+        for return_json in [True, False]:
+            with self.subTest(return_json=return_json):
+                self.events.pages.clear()
+                client = self.client(return_json=return_json)
+                events = client.iter_balance_events(
+                    ["BTC"], ["deposit_confirm"], per_page=4
+                )
+                ids = [e["id"] if return_json else e.id for e in events]
+                self.assertEqual(ids, list(range(PAGES * PER_PAGE)))
+                self.assertEqual(sorted(self.events.pages), [1, 2, 3, 4, 5])
+
+    def test_balance_events_empty(self):
+        self.events.total = 0
+        events = self.client().iter_balance_events(["BTC"], ["deposit_confirm"])
+        self.assertEqual(list(events), [])
+
+    def test_lazy(self):
+        client = self.client(return_json=True)
+        events = client.iter_balance_events(["BTC"], ["deposit_confirm"])
+        self.assertEqual(self.events.pages, [])
+        next(events)
+        self.assertEqual(self.events.pages[0], 1)
+
+    def test_stop_early(self):
+        orders = self.client().iter_orders("BTC-CLP", concurrency=2)
+        first = list(islice(orders, PER_PAGE + 1))
+        orders.close()
+        self.assertEqual([o.id for o in first], list(range(PER_PAGE + 1)))
+        time.sleep(0.2)
+        # First page, second one and the window of two after it at most
+        self.assertLessEqual(len(self.orders.pages), 4)
+
+    def test_async(self):
+        async def iter_orders():
+            async with self.client(Buda.AsyncAuth) as client:
+                return [o.id async for o in client.iter_orders("BTC-CLP")]
+
+        ids = asyncio.run(iter_orders())
+        self.assertEqual(ids, list(range(PAGES * PER_PAGE)))
+        self.assertEqual(self.orders.max_active, Buda.AsyncAuth.page_concurrency)
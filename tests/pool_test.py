@@ -0,0 +1,74 @@
+import asyncio
+import socket
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from trading_api_wrappers import Buda, Ripio
+from trading_api_wrappers.aio import aiohttp
+
+from tests.server import MockServer
+
+MARKETS = [f"M{i}-CLP" for i in range(32)]
+TICKER = {
+    "ticker": {
+        "last_price": ["100.0", "CLP"],
+        "min_ask": ["101.0", "CLP"],
+        "max_bid": ["99.0", "CLP"],
+        "volume": ["10.0", "BTC"],
+        "price_variation_24h": "0.01",
+        "price_variation_7d": "0.02",
+    }
+}
+
+
+class PoolTest(unittest.TestCase):
+    def test_pool_options(self):
+        client = Buda.Public(
+            pool_options={"pool_maxsize": 32, "pool_block": True, "keep_alive": True}
+        )
+        adapter = client.session.get_adapter(client.base_url)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+        # RetryPolicy is the only retry layer by default
+        self.assertEqual(adapter.max_retries.total, 0)
+
+    def test_adapter_retries(self):
+        client = Buda.Public(pool_options={"adapter_retries": 2})
+        adapter = client.session.get_adapter(client.base_url)
+        self.assertEqual(adapter.max_retries.total, 2)
+
+    def test_bounded_fan_out(self):
+        routes = {f"/markets/{market}/ticker": (200, TICKER) for market in MARKETS}
+        with MockServer(routes) as server:
+            client = Buda.Public(
+                base_url=server.url,
+                pool_options={"pool_maxsize": 4, "pool_block": True},
+            )
+            with ThreadPoolExecutor(16) as executor:
+                tickers = list(executor.map(client.ticker, MARKETS))
+            self.assertEqual(len(tickers), len(MARKETS))
+            # Connections are reused instead of discarded
+            connections = {request["client"] for request in server.requests}
+            self.assertLessEqual(len(connections), 4)
+
+    def test_shared_pool(self):
+        client = Ripio.Public()
+        exchange = client.exchange
+        url = exchange.base_url
+        self.assertIs(
+            exchange.session.get_adapter(url), client.session.get_adapter(url)
+        )
+        self.assertIs(exchange.session.pool_owner, client.session)
+
+    @unittest.skipUnless(aiohttp, "aiohttp is not installed")
+    def test_async_shared_pool(self):
+        async def main():
+            async with Ripio.AsyncPublic(pool_options={"pool_maxsize": 8}) as client:
+                connector = client.session.connector
+                self.assertIs(client.exchange.session.connector, connector)
+                self.assertEqual(connector.limit_per_host, 8)
+            return connector
+
+        self.assertTrue(asyncio.run(main()).closed)
@@ -0,0 +1,140 @@
+import json
+import math
+import os
+import unittest
+
+from trading_api_wrappers import SFOX, Buda
+from trading_api_wrappers.columnar import ColumnarOrderBook, np
+from trading_api_wrappers.fills import BookFills
+from trading_api_wrappers.sfox.quotations import best_price
+
+# Quotations worked out by hand from the documented semantics, in the server
+# JSON format. Not recorded from the server: they check the simulator against
+# known examples, not parity with Buda.
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "fixtures", "buda_quotations_hand_computed.json"
+)
+
+AMOUNT_FIELDS = [
+    "amount",
+    "base_balance_change",
+    "base_exchanged",
+    "fee",
+    "limit",
+    "order_amount",
+    "quote_balance_change",
+    "quote_exchanged",
+]
+
+
+class BookFillsTest(unittest.TestCase):
+    def setUp(self):
+        self.fills = BookFills([["100", "1"], ["101", "2"]])
+
+    def test_fill_base(self):
+        fill = self.fills.fill_base(2)
+        self.assertEqual(fill, (2.0, 201.0, 101.0, False))
+        self.assertEqual(fill.vwap, 100.5)
+        self.assertEqual(self.fills.fill_base(1), (1.0, 100.0, 100.0, False))
+        self.assertEqual(self.fills.fill_base(0), (0.0, 0.0, None, False))
+        self.assertEqual(self.fills.fill_base(5), (3.0, 302.0, 101.0, True))
+
+    def test_fill_quote(self):
+        self.assertEqual(self.fills.fill_quote(201), (2.0, 201.0, 101.0, False))
+        self.assertEqual(self.fills.fill_quote(400), (3.0, 302.0, 101.0, True))
+
+    def test_empty_book(self):
+        self.assertEqual(BookFills([]).fill_base(1), (0.0, 0.0, None, True))
+
+
+class QuotationSimulatorTest(unittest.TestCase):
+    """Local quotations must match the hand-computed examples of the
+    fixture."""
+
+    def setUp(self):
+        with open(FIXTURE) as f:
+            self.fixture = json.load(f)
+        self.order_book = Buda.models.OrderBook.create_from_json(
+            self.fixture["order_book"]
+        )
+
+    def simulator(self, order_book=None):
+        return Buda.QuotationSimulator(
+            order_book or self.order_book,
+            self.fixture["market_id"],
+            fee=self.fixture["fee"],
+        )
+
+    def assertSameQuotation(self, quotation, expected):
+        for field in AMOUNT_FIELDS:
+            value, expected_value = getattr(quotation, field), expected[field]
+            if expected_value is None:
+                self.assertIsNone(value, field)
+                continue
+            self.assertEqual(value.currency, expected_value[1], field)
+            self.assertTrue(
+                math.isclose(
+                    value.amount, float(expected_value[0]), rel_tol=1e-9, abs_tol=1e-9
+                ),
+                f"{field}: {value.amount} != {expected_value[0]}",
+            )
+        self.assertEqual(quotation.incomplete, expected["incomplete"])
+        self.assertEqual(quotation.type, expected["type"])
+
+    def test_hand_computed_quotations(self):
+        simulator = self.simulator()
+        for expected in self.fixture["quotations"]:
+            with self.subTest(type=expected["type"], amount=expected["amount"]):
+                limit = expected["limit"] and float(expected["limit"][0])
+                quotation = simulator.quotation(
+                    expected["type"], float(expected["amount"][0]), limit=limit
+                )
+                self.assertSameQuotation(quotation, expected)
+
+    def test_batch(self):
+        simulator = self.simulator()
+        amounts = [0.1 * i for i in range(50)]
+        quotations = simulator.quotations(Buda.QuotationType.BID_GIVEN_SIZE, amounts)
+        self.assertEqual(len(quotations), 50)
+        for amount, quotation in zip(amounts, quotations):
+            single = simulator.quotation("bid_given_size", amount)
+            self.assertEqual(quotation, single)
+        # Quotes grow with the amount until the book runs out
+        exchanged = [q.quote_exchanged.amount for q in quotations]
+        self.assertEqual(exchanged, sorted(exchanged))
+        self.assertTrue(quotations[-1].incomplete)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_columnar_book(self):
+        order_book = ColumnarOrderBook.create_from_json(self.fixture["order_book"])
+        simulator = self.simulator(order_book)
+        for expected in self.fixture["quotations"]:
+            with self.subTest(type=expected["type"], amount=expected["amount"]):
+                limit = expected["limit"] and float(expected["limit"][0])
+                quotation = simulator.quotation(
+                    expected["type"], float(expected["amount"][0]), limit=limit
+                )
+                self.assertSameQuotation(quotation, expected)
+
+
+class SFOXBestPriceTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book = SFOX.models.OrderBook.create_from_json(
+            {
+                "bids": [[99.0, 1.0, "gdax"], [98.0, 2.0, "bitstamp"]],
+                "asks": [[101.0, 1.0, "gdax"], [102.0, 3.0, "itbit"]],
+            }
+        )
+
+    def test_buy(self):
+        price = best_price(self.order_book, "buy", 2, fee=0.01)
+        self.assertEqual(price.quantity, 2.0)
+        self.assertEqual(price.price, 102.0)
+        self.assertEqual(price.vwap, 101.5)
+        self.assertAlmostEqual(price.fees, 2.03)
+        self.assertAlmostEqual(price.total, 205.03)
+
+    def test_sell(self):
+        price = best_price(self.order_book, SFOX.Side.SELL, 3, fee=0.01)
+        self.assertEqual(price.price, 98.0)
+        self.assertAlmostEqual(price.total, (99 + 196) * 0.99)
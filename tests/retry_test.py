@@ -0,0 +1,91 @@
+import asyncio
+import unittest
+
+from requests import Response
+
+from trading_api_wrappers import Buda, InvalidResponse, RateLimitExceeded
+from trading_api_wrappers.retry import RetryPolicy
+
+from tests.server import MockServer
+
+
+def invalid_response(status_code):
+    response = Response()
+    response.status_code = status_code
+    return InvalidResponse("error", response)
+
+
+class Target:
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(
+            max_tries=3, factor=0, retry_codes=[429, 500], jitter=None
+        )
+
+    def test_retries_until_success(self):
+        target = Target([invalid_response(500), invalid_response(429)])
+        self.assertEqual(self.policy.call(target), "ok")
+        self.assertEqual(target.calls, 3)
+
+    def test_gives_up_after_max_tries(self):
+        target = Target([invalid_response(500)] * 3)
+        with self.assertRaises(InvalidResponse):
+            self.policy.call(target)
+        self.assertEqual(target.calls, 3)
+
+    def test_gives_up_on_non_retry_code(self):
+        target = Target([invalid_response(404)])
+        with self.assertRaises(InvalidResponse):
+            self.policy.call(target)
+        self.assertEqual(target.calls, 1)
+
+    def test_max_time(self):
+        policy = self.policy.replace(factor=10, max_time=0)
+        target = Target([invalid_response(500)])
+        with self.assertRaises(InvalidResponse):
+            policy.call(target)
+        self.assertEqual(target.calls, 1)
+
+    def test_retry_after(self):
+        response = Response()
+        response.status_code = 200
+        e = RateLimitExceeded("EAPI:Rate limit exceeded", response, retry_after=2)
+        self.assertFalse(self.policy.give_up(e))
+        self.assertEqual(self.policy.wait(e, tries=1, elapsed=0), 2)
+        self.assertIsNone(self.policy.replace(max_time=1).wait(e, 1, 0))
+
+    def test_async_call(self):
+        target = Target([invalid_response(500)])
+
+        async def async_target():
+            return target()
+
+        self.assertEqual(asyncio.run(self.policy.acall(async_target)), "ok")
+        self.assertEqual(target.calls, 2)
+
+
+class ClientRetryTest(unittest.TestCase):
+    def test_endpoint_retry_override(self):
+        class Client(Buda.Public):
+            backoff_factor = 0
+            endpoint_retry = {"markets/*/ticker": {"max_tries": 1}}
+
+        with MockServer({}) as server:
+            client = Client(base_url=server.url)
+            with self.assertRaises(InvalidResponse):
+                client.ticker("BTC-CLP")
+            self.assertEqual(len(server.requests), 1)
+            with self.assertRaises(InvalidResponse):
+                client.markets()
+            self.assertEqual(len(server.requests), 1 + client.max_retries)
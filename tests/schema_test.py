@@ -0,0 +1,80 @@
+import unittest
+from collections import namedtuple
+from datetime import datetime
+
+from trading_api_wrappers.bitfinex import models_v2
+from trading_api_wrappers.buda import models
+from trading_api_wrappers.schema import PAYLOAD, Field, compile_decoder, schema
+
+
+@schema(
+    Field("id", "tid", int),
+    Field("prices", convert=float, many=True),
+    Field("side", 0),
+    Field("json", PAYLOAD),
+)
+class Sample(namedtuple("sample", ["id", "side", "prices", "json"])):
+    pass
+
+
+class SchemaTest(unittest.TestCase):
+    def test_decoder(self):
+        payload = {"tid": "7", "prices": ["1.5", "2"], 0: "buy"}
+        sample = Sample.create_from_json(payload)
+        self.assertEqual(sample, Sample(7, "buy", [1.5, 2.0], payload))
+        self.assertIsInstance(sample, Sample)
+        self.assertEqual(
+            [f.name for f in Sample.schema], ["id", "prices", "side", "json"]
+        )
+
+    def test_optional(self):
+        self.assertIsNone(models.Amount.create_from_json(None))
+        self.assertEqual(models.Amount.create_from_json([]), [])
+        self.assertEqual(
+            models.Amount.create_from_json(["1.5", "BTC"]), models.Amount(1.5, "BTC")
+        )
+
+    def test_mismatch(self):
+        with self.assertRaises(TypeError):
+            compile_decoder(Sample, [Field("id"), Field("side")])
+
+    def test_subclass(self):
+        class SubSample(Sample):
+            pass
+
+        payload = {"tid": "1", "prices": [], 0: "sell"}
+        self.assertIsInstance(SubSample.create_from_json(payload), SubSample)
+        self.assertIsInstance(Sample.create_from_json(payload), Sample)
+
+    def test_many_needs_convert(self):
+        with self.assertRaises(TypeError):
+            Field("prices", many=True)
+
+    def test_models(self):
+        entry = models.TradeEntry.create_from_json(
+            ["1546300800000", "0.5", "100", "buy", 1]
+        )
+        self.assertEqual(entry, models.TradeEntry(1546300800000, 0.5, 100.0, "buy"))
+        trade = models_v2.TradingTrade.create_from_json([1, 1546300800000, -0.5, 100.0])
+        self.assertEqual(trade.AMOUNT, -0.5)
+        order = {
+            "id": 1,
+            "account_id": 2,
+            "amount": ["1.0", "BTC"],
+            "created_at": "2019-01-01T00:00:00.000Z",
+            "fee_currency": "BTC",
+            "limit": None,
+            "market_id": "BTC-CLP",
+            "original_amount": ["1.0", "BTC"],
+            "paid_fee": ["0.0", "BTC"],
+            "price_type": "market",
+            "state": "traded",
+            "total_exchanged": ["3000000.0", "CLP"],
+            "traded_amount": ["1.0", "BTC"],
+            "type": "Bid",
+        }
+        order_model = models.Order.create_from_json(order)
+        self.assertEqual(order_model.created_at, datetime(2019, 1, 1))
+        self.assertEqual(order_model.total_exchanged, models.Amount(3e6, "CLP"))
+        self.assertIsNone(order_model.limit)
+        self.assertIs(order_model.json, order)
@@ -0,0 +1,77 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+class MockServer:
+    """Serve canned JSON responses from a background thread.
+
+    Requests record the client address, to tell connections apart.
+    Routes map a path (without query string) to a `(status, body)` tuple,
+    a `(status, body, headers)` tuple or a callable receiving the recorded
+    request and returning one of those.
+    """
+
+    def __init__(self, routes: dict):
+        self.routes = routes
+        self.requests = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections alive, as exchange APIs do
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request = {
+                    "method": self.command,
+                    "path": urlsplit(self.path).path,
+                    "url": self.path,
+                    "headers": dict(self.headers),
+                    "body": self.rfile.read(length) if length else b"",
+                    "client": self.client_address,
+                }
+                with mock.lock:
+                    mock.requests.append(request)
+                route = mock.routes.get(
+                    request["path"], (404, {"message": "Not Found"})
+                )
+                if callable(route):
+                    route = route(request)
+                status, body, headers = (route + ({},))[:3]
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+        return Handler
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from trading_api_wrappers import Buda, InvalidResponse
+from trading_api_wrappers.aio import aiohttp
+from trading_api_wrappers.singleflight import AsyncSingleFlight, SingleFlight
+
+from tests.server import MockServer
+
+TICKER = {
+    "ticker": {
+        "last_price": ["100.0", "CLP"],
+        "min_ask": ["101.0", "CLP"],
+        "max_bid": ["99.0", "CLP"],
+        "volume": ["10.0", "BTC"],
+        "price_variation_24h": "0.01",
+        "price_variation_7d": "0.02",
+    }
+}
+
+
+def slow(response, seconds=0.3):
+    def route(request):
+        time.sleep(seconds)
+        return response
+
+    return route
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_threads_share_call(self):
+        flights = SingleFlight()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def func():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        def call():
+            barrier.wait()
+            return flights.do("key", func)
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: call(), range(8)))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+        self.assertEqual(flights.shared, 7)
+        # Finished calls are not reused
+        flights.do("key", func)
+        self.assertEqual(len(calls), 2)
+
+    def test_threads_share_error(self):
+        flights = SingleFlight()
+        barrier = threading.Barrier(4)
+
+        def func():
+            time.sleep(0.2)
+            raise ValueError("boom")
+
+        def call():
+            barrier.wait()
+            with self.assertRaises(ValueError):
+                flights.do("key", func)
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: call(), range(4)))
+
+    def test_coroutines_share_call(self):
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def func(value):
+            calls.append(value)
+            await asyncio.sleep(0.1)
+            return value
+
+        async def main():
+            first = asyncio.ensure_future(flights.do("a", func, 1))
+            await asyncio.sleep(0)
+            # A cancelled caller does not cancel the shared call
+            first.cancel()
+            return await asyncio.gather(
+                flights.do("a", func, 1),
+                flights.do("a", func, 1),
+                flights.do("b", func, 2),
+            )
+
+        self.assertEqual(asyncio.run(main()), [1, 1, 2])
+        self.assertEqual(calls, [1, 2])
+
+
+class ClientSingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(
+            {
+                "/markets/BTC-CLP/ticker": slow((200, TICKER)),
+                "/markets/ETH-CLP/ticker": slow((200, TICKER)),
+                "/markets/BTC-ARS/ticker": slow((404, {"message": "not_found"})),
+            }
+        ).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def fan_out(self, client, markets):
+        with ThreadPoolExecutor(len(markets)) as executor:
+            return list(executor.map(client.ticker, markets))
+
+    def test_opt_in(self):
+        client = Buda.Public(base_url=self.server.url)
+        self.fan_out(client, ["BTC-CLP"] * 4)
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_threads(self):
+        client = Buda.Public(base_url=self.server.url, single_flight=True)
+        tickers = self.fan_out(client, ["BTC-CLP"] * 6 + ["ETH-CLP"] * 2)
+        self.assertEqual(len(tickers), 8)
+        paths = sorted(request["path"] for request in self.server.requests)
+        self.assertEqual(paths, ["/markets/BTC-CLP/ticker", "/markets/ETH-CLP/ticker"])
+
+    def test_errors(self):
+        client = Buda.Public(
+            base_url=self.server.url, single_flight=True, max_retries=1
+        )
+        with self.assertRaises(InvalidResponse):
+            self.fan_out(client, ["BTC-ARS"] * 4)
+        self.assertEqual(len(self.server.requests), 1)
+
+    @unittest.skipUnless(aiohttp, "aiohttp is not installed")
+    def test_coroutines(self):
+        async def main():
+            async with Buda.AsyncPublic(
+                base_url=self.server.url, single_flight=True
+            ) as client:
+                return await asyncio.gather(
+                    *[client.ticker("BTC-CLP") for _ in range(8)]
+                )
+
+        tickers = asyncio.run(main())
+        self.assertEqual(len(tickers), 8)
+        self.assertEqual(len(self.server.requests), 1)
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+
+from trading_api_wrappers.columnar import Candles, Trades, np
+from trading_api_wrappers.store import MarketStore
+
+START = 1546300800  # 2019-01-01 UTC
+DAY = 86400
+HOUR = 3600
+
+
+def candles(start, end):
+    return Candles.create_from_rows(
+        [[t, 1, 2, 0, 1, t % 7] for t in range(int(start), int(end), HOUR)]
+    )
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class MarketStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.store = MarketStore(self.dir.name)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_write_read(self):
+        self.store.write(
+            "Buda", "BTC-CLP", candles(START, START + 2 * DAY), START, START + 2 * DAY
+        )
+        path = self.store.path("Buda", "BTC-CLP", Candles)
+        self.assertEqual(
+            sorted(os.listdir(path)),
+            ["2019-01-01.npy", "2019-01-02.npy", "coverage.json"],
+        )
+        result = self.store.read(
+            "Buda", "BTC-CLP", Candles, START + 20 * HOUR, START + 30 * HOUR
+        )
+        self.assertIsInstance(result, Candles)
+        self.assertEqual(
+            result.timestamp.tolist(),
+            list(range(START + 20 * HOUR, START + 30 * HOUR, HOUR)),
+        )
+        self.assertEqual(result.timestamp.dtype, np.int64)
+        self.assertEqual(
+            result.volume.tolist(), [t % 7 for t in result.timestamp.tolist()]
+        )
+        empty = self.store.read(
+            "Buda", "BTC-CLP", Candles, START + 5 * DAY, START + 6 * DAY
+        )
+        self.assertEqual(len(empty.timestamp), 0)
+
+    def test_overwrite_range(self):
+        self.store.write(
+            "kraken", "XXBTZUSD", candles(START, START + DAY), START, START + DAY
+        )
+        # Refetched range, with one candle less
+        update = candles(START + 2 * HOUR, START + 4 * HOUR)
+        update = Candles(*(column[:1] for column in update))
+        self.store.write(
+            "kraken", "XXBTZUSD", update, START + 2 * HOUR, START + 4 * HOUR
+        )
+        result = self.store.read("kraken", "XXBTZUSD", Candles, START, START + DAY)
+        self.assertEqual(len(result.timestamp), 23)
+        self.assertNotIn(START + 3 * HOUR, result.timestamp.tolist())
+
+    def test_missing(self):
+        self.store.write(
+            "buda", "BTC-CLP", candles(START, START + DAY), START, START + DAY
+        )
+        self.store.write(
+            "buda",
+            "BTC-CLP",
+            candles(START + 2 * DAY, START + 3 * DAY),
+            START + 2 * DAY,
+            START + 3 * DAY,
+        )
+        self.assertEqual(
+            self.store.coverage("buda", "BTC-CLP", Candles),
+            [[START, START + DAY], [START + 2 * DAY, START + 3 * DAY]],
+        )
+        missing = self.store.missing(
+            "buda", "BTC-CLP", Candles, START + HOUR, START + 4 * DAY
+        )
+        self.assertEqual(
+            missing,
+            [(START + DAY, START + 2 * DAY), (START + 3 * DAY, START + 4 * DAY)],
+        )
+        # Adjacent ranges merge
+        self.store.write(
+            "buda",
+            "BTC-CLP",
+            candles(START + DAY, START + 2 * DAY),
+            START + DAY,
+            START + 2 * DAY,
+        )
+        self.assertEqual(
+            self.store.coverage("buda", "BTC-CLP", Candles), [[START, START + 3 * DAY]]
+        )
+
+    def test_get(self):
+        fetched = []
+
+        def fetch(start, end):
+            fetched.append((start, end))
+            return candles(start, end)
+
+        result = self.store.get("buda", "BTC-CLP", Candles, START, START + DAY, fetch)
+        self.assertEqual(len(result.timestamp), 24)
+        result = self.store.get(
+            "buda", "BTC-CLP", Candles, START + HOUR, START + 2 * DAY, fetch
+        )
+        self.assertEqual(len(result.timestamp), 47)
+        self.assertEqual(
+            fetched, [(START, START + DAY), (START + DAY, START + 2 * DAY)]
+        )
+
+    def test_trades(self):
+        entries = [
+            {"timestamp": (START + 10) * 1000, "price": "10", "amount": "1"},
+            {"timestamp": (START + 5) * 1000, "price": "11", "amount": "2"},
+            {"timestamp": (START + 5) * 1000, "price": "12", "amount": "3"},
+        ]
+        trades = Trades.create_from_json(
+            entries, "timestamp", "price", "amount", unit=0.001
+        )
+        self.assertEqual(trades.price.tolist(), [11.0, 12.0, 10.0])
+        self.store.write("bitfinex", "btc/usd", trades, START, START + 60)
+        result = self.store.read("bitfinex", "btc/usd", Trades, START, START + 60)
+        self.assertEqual(result.timestamp.tolist(), [START + 5, START + 5, START + 10])
+        self.assertEqual(result.amount.tolist(), [2.0, 3.0, 1.0])
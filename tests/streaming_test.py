@@ -0,0 +1,131 @@
+import asyncio
+import json
+import unittest
+
+from trading_api_wrappers import (
+    Bitex,
+    BitfinexV2,
+    CoinMarketCap,
+    DecodeError,
+    InvalidResponse,
+)
+from trading_api_wrappers.aio import aiohttp
+from trading_api_wrappers.bitex import models
+from trading_api_wrappers.streaming import JSONArrayParser, iter_json_array
+
+from tests.server import MockServer
+
+ITEMS = [
+    [1546300800, 1, 3850.5, 0.25],
+    {"id": "bitcoin", "name": "Bitcóin", "price_usd": "3850.5", "rank": None},
+    "a string with ] and , inside",
+    -12345.678e-3,
+    [],
+    {},
+    True,
+    None,
+]
+TRANSACTIONS = [[1546300800 - i, 100 - i, 3850.5 + i, 0.1] for i in range(100)]
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class JSONArrayParserTest(unittest.TestCase):
+    def test_every_chunk_size(self):
+        content = json.dumps(ITEMS, indent=1, ensure_ascii=False).encode()
+        for size in range(1, len(content) + 1):
+            with self.subTest(size=size):
+                items = list(iter_json_array(chunked(content, size)))
+                self.assertEqual(items, ITEMS)
+
+    def test_incremental(self):
+        parser = JSONArrayParser()
+        self.assertEqual(parser.feed(b' [1, {"a": '), [1])
+        self.assertEqual(parser.feed(b'"b"}, 12'), [{"a": "b"}])
+        # Numbers may continue in the next chunk
+        self.assertEqual(parser.feed(b"3"), [])
+        self.assertEqual(parser.feed(b" ] "), [123])
+        self.assertEqual(parser.close(), [])
+        self.assertIsNone(parser.document)
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array([b"[", b" ]"])), [])
+
+    def test_document(self):
+        parser = JSONArrayParser()
+        parser.feed(b'{"error": ')
+        parser.feed(b'"Invalid"}')
+        self.assertEqual(parser.close(), [])
+        self.assertEqual(parser.document, {"error": "Invalid"})
+
+    def test_invalid(self):
+        for content in [b"[1, 2", b"[1 2]", b"[1,]", b"[1] 2", b""]:
+            with self.subTest(content=content):
+                with self.assertRaises(ValueError):
+                    list(iter_json_array(chunked(content, 2)))
+
+
+class ClientStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(
+            {
+                "/btc_usd/market/transactions_archive": (200, TRANSACTIONS),
+                "/btc_ars/market/transactions_archive": (200, {"error": "Invalid"}),
+                "/btc_eur/market/transactions_archive": (404, {"error": "Missing"}),
+                "/ticker/": (200, [{"id": "bitcoin"}, {"id": "ethereum"}]),
+                "/global/": (200, {"total_market_cap_usd": 1e11}),
+                "/trades/tBTCUSD/hist": (200, [[1, 1546300800000, 0.5, 3850.5]]),
+            }
+        ).__enter__()
+        self.client = Bitex.Public(base_url=self.server.url, max_retries=1)
+        self.client.stream_chunk_size = 64
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_iter_models(self):
+        transactions = self.client.iter_transactions_archive("btc_usd")
+        self.assertEqual(self.server.requests, [])
+        transactions = list(transactions)
+        self.assertEqual(transactions, self.client.transactions_archive("btc_usd"))
+        self.assertIsInstance(transactions[0], models.Transaction)
+
+    def test_return_json(self):
+        self.client.return_json = True
+        transactions = self.client.iter_transactions_archive("btc_usd")
+        self.assertEqual(list(transactions), TRANSACTIONS)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(InvalidResponse, "Invalid"):
+            list(self.client.iter_transactions_archive("btc_ars"))
+        with self.assertRaisesRegex(InvalidResponse, "Missing"):
+            list(self.client.iter_transactions_archive("btc_eur"))
+        with self.assertRaises(DecodeError):
+            list(CoinMarketCap(base_url=self.server.url)._stream("GET", "global/"))
+
+    def test_other_clients(self):
+        ticker = CoinMarketCap(base_url=self.server.url).iter_ticker(limit=2)
+        self.assertEqual([t["id"] for t in ticker], ["bitcoin", "ethereum"])
+        self.assertEqual(self.server.requests[-1]["url"], "/ticker/?limit=2")
+        trades = BitfinexV2.Public(base_url=self.server.url).iter_trades("tBTCUSD")
+        self.assertEqual([t.PRICE for t in trades], [3850.5])
+
+    @unittest.skipUnless(aiohttp, "aiohttp is not installed")
+    def test_async(self):
+        async def main():
+            async with Bitex.AsyncPublic(base_url=self.server.url) as client:
+                client.stream_chunk_size = 64
+                transactions = client.iter_transactions_archive("btc_usd")
+                transactions = [tx async for tx in transactions]
+                with self.assertRaisesRegex(InvalidResponse, "Invalid"):
+                    async for _ in client.iter_transactions_archive("btc_ars"):
+                        pass
+                with self.assertRaisesRegex(InvalidResponse, "Missing"):
+                    async for _ in client.iter_transactions_archive("btc_eur"):
+                        pass
+            return transactions
+
+        transactions = asyncio.run(main())
+        self.assertEqual(transactions, self.client.transactions_archive("btc_usd"))
@@ -0,0 +1,71 @@
+import socket
+from typing import List, Tuple
+
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+SocketOption = Tuple[int, int, int]
+
+
+def keep_alive_options(
+    idle: int = 60, interval: int = 10, count: int = 6
+) -> List[SocketOption]:
+    """TCP keep-alive socket options, on top of urllib3 defaults.
+
+    Probes idle pooled connections so they are not silently dropped by
+    firewalls or NATs between requests.
+
+    Args:
+        idle (int): Seconds idle before the first probe.
+        interval (int): Seconds between probes.
+        count (int): Failed probes before dropping the connection.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Not every platform allows tuning the probes
+    for name, value in [
+        ("TCP_KEEPIDLE", idle),
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", count),
+    ]:
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PoolAdapter(HTTPAdapter):
+    """HTTPAdapter with configurable socket options.
+
+    Args:
+        pool_connections (int): Number of host pools to cache.
+        pool_maxsize (int): Max connections kept per host.
+        pool_block (bool): Wait for a free connection instead of opening
+            (and discarding) extra ones when a pool is full.
+        socket_options (list): Options set on every new socket.
+        max_retries: urllib3 retries of failed connections, as in
+            HTTPAdapter. Clients pass `adapter_retries` (0 by default),
+            leaving retries to their `RetryPolicy`.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_options"]
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        socket_options: List[SocketOption] = None,
+        **kwargs,
+    ):
+        self.socket_options: List[SocketOption] = socket_options
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            **kwargs,
+        )
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **pool_kwargs)
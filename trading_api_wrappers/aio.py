@@ -0,0 +1,261 @@
+import asyncio
+import inspect
+from collections import deque
+from itertools import islice
+
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .base import TIMEOUT, Client, ClientSession
+from .errors import DecodeError
+from .singleflight import AsyncSingleFlight
+from .streaming import JSONArrayParser
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncClientSession(ClientSession):
+    """Prepare requests with `requests` (so every auth hook keeps working)
+    and send them through a shared `aiohttp` connection pool."""
+
+    connection_limit: int = 100
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = TIMEOUT,
+        user_agent: str = None,
+        **pool_options,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required by async clients, install it with: "
+                "pip install trading-api-wrappers[async]"
+            )
+        super().__init__(base_url, timeout, user_agent, **pool_options)
+        # aiohttp waits for a free connection, unlimited per host by default
+        self.limit_per_host: int = pool_options.get("pool_maxsize", 0)
+        self._aio_session: "aiohttp.ClientSession" = None
+        self._connector: "aiohttp.TCPConnector" = None
+
+    @property
+    def connector(self):
+        """Connection pool, shared with other sessions via `share_pool`."""
+        owner = self.pool_owner
+        if owner is not self:
+            return owner.connector
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.limit_per_host,
+            )
+        return self._connector
+
+    @property
+    def aio_session(self):
+        # Created lazily, aiohttp sessions must be bound to a running loop
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=self.connector,
+                connector_owner=False,
+                # Per socket operation, as requests does: streamed bodies may
+                # take longer than `timeout` as long as data keeps coming
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self.timeout,
+                    sock_read=self.timeout,
+                ),
+            )
+        return self._aio_session
+
+    async def request(self, method, endpoint, **kwargs):
+        """Send the request after generating the complete URL."""
+        prep, r = await self.open(method, endpoint, **kwargs)
+        async with r:
+            content = await r.read()
+        return self.build_response(prep, r, content)
+
+    async def open(self, method, endpoint, **kwargs):
+        """Send the request, returning before the response body is read."""
+        allow_redirects = kwargs.pop("allow_redirects", True)
+        url, kwargs = self.prepare_kwargs(endpoint, kwargs)
+        prep = self.prepare_request(Request(method, url, **kwargs))
+        r = await self.aio_session.request(
+            prep.method,
+            URL(prep.url, encoded=True),
+            headers=prep.headers,
+            data=prep.body,
+            allow_redirects=allow_redirects,
+        )
+        return prep, r
+
+    @staticmethod
+    def build_response(prep, r, content: bytes) -> Response:
+        """Convert an aiohttp response into a `requests.Response`."""
+        response = Response()
+        response.status_code = r.status
+        response.reason = r.reason
+        response.headers = CaseInsensitiveDict(r.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(r.url)
+        response.request = prep
+        response._content = content
+        return response
+
+    def _release(self):
+        """Detach the aiohttp session and owned connector, to be closed."""
+        session, self._aio_session = self._aio_session, None
+        connector, self._connector = self._connector, None
+        return [
+            closable
+            for closable in [session, connector]
+            if closable is not None and not closable.closed
+        ]
+
+    async def aclose(self):
+        for closable in self._release():
+            await closable.close()
+        super().close()
+
+    def close(self):
+        super().close()
+        closables = self._release()
+        if not closables:
+            return
+        # Best effort: schedule the close if the loop is still running
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for closable in closables:
+            result = closable.close()
+            if inspect.isawaitable(result):
+                loop.create_task(result)
+
+
+class AsyncClient(Client):
+    """Asyncio version of `Client`.
+
+    Mix it in before any client class to get awaitable endpoints:
+
+        class BudaAsyncPublic(AsyncClient, BudaPublic):
+            pass
+
+        async with BudaAsyncPublic() as client:
+            ticker = await client.ticker("BTC-CLP")
+    """
+
+    session_cls = AsyncClientSession
+    flight_cls = AsyncSingleFlight
+
+    async def _send(self, method, endpoint, *args, **kwargs):
+        policy = self._retry_policy_for(endpoint)
+        if self.single_flight and method == "GET":
+            return await self.flights.do(
+                self._request_key(method, endpoint, kwargs),
+                policy.acall,
+                self._fetch_base,
+                method,
+                endpoint,
+                *args,
+                **kwargs,
+            )
+        return await policy.acall(self._fetch_base, method, endpoint, *args, **kwargs)
+
+    async def _fetch_base(self, method, endpoint, *args, **kwargs):
+        # Rate limit requests
+        await self.throttle(endpoint)
+        self.last_request_timestamp = self.timestamp.milliseconds()
+        validation = self._conditional(method, endpoint, kwargs)
+        # Send the request
+        response = await self.session.request(method, endpoint, *args, **kwargs)
+        return self._handle_response(response, validation)
+
+    async def _stream(self, method, endpoint, **kwargs):
+        policy = self._retry_policy_for(endpoint)
+        response, r = await policy.acall(self._open_stream, method, endpoint, **kwargs)
+        parser = JSONArrayParser()
+        async with r:
+            try:
+                async for chunk in r.content.iter_chunked(self.stream_chunk_size):
+                    for item in parser.feed(chunk):
+                        yield item
+                for item in parser.close():
+                    yield item
+            except ValueError as e:
+                error_msg = "Unable to decode JSON array from response"
+                raise DecodeError(error_msg, response) from e
+        self._check_stream(parser, response)
+
+    async def _open_stream(self, method, endpoint, **kwargs):
+        # Rate limit requests
+        await self.throttle(endpoint)
+        self.last_request_timestamp = self.timestamp.milliseconds()
+        # Send the request, the body is read by the caller
+        prep, r = await self.session.open(method, endpoint, **kwargs)
+        if r.status >= 400:
+            # Error bodies are small, read them and raise as usual
+            async with r:
+                content = await r.read()
+            self._handle_response(self.session.build_response(prep, r, content))
+        response = self.session.build_response(prep, r, None)
+        self._update_rate_limit(response)
+        return response, r
+
+    async def _iter_pages(self, fetch_page, items, total_pages, concurrency=None):
+        concurrency = self._page_concurrency(concurrency)
+        first = await fetch_page(1)
+        for item in items(first):
+            yield item
+        pages = iter(range(2, total_pages(first) + 1))
+        tasks = deque()
+        try:
+            for page in islice(pages, concurrency):
+                tasks.append(asyncio.ensure_future(fetch_page(page)))
+            while tasks:
+                data = await tasks.popleft()
+                for page in islice(pages, 1):
+                    tasks.append(asyncio.ensure_future(fetch_page(page)))
+                for item in items(data):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _map(self, items, func):
+        async def mapped():
+            async for item in items:
+                yield func(item)
+
+        return mapped()
+
+    def _then(self, result, callback):
+        async def then():
+            value = await result if inspect.isawaitable(result) else result
+            value = callback(value)
+            # Callbacks may chain further requests
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+
+        return then()
+
+    async def throttle(self, endpoint: str = None):
+        if self.limiter is not None and self.enable_rate_limit:
+            weight = self._weight_for(endpoint) if endpoint else 1
+            if weight:
+                await self.limiter.acquire_async(weight)
+
+    async def aclose(self):
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
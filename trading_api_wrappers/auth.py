@@ -4,9 +4,11 @@ import urllib.parse
 
 import requests.auth
 from requests import PreparedRequest as P
+from requests import Request
 from requests import Response as R
 
 from . import base
+from .nonce import NonceGenerator
 
 
 class AuthBase(requests.auth.AuthBase):
@@ -90,6 +92,9 @@ class HMACAuth(AuthBase):
     signature_delimiter: str = "\n"
     algorithm = "sha256"
     timestamp: base.Timestamp = base.timestamp
+    # The server rejects nonces lower than the last one it has seen, so
+    # signed requests can't overlap (ex. pages of a paginated endpoint)
+    ordered_nonces: bool = True
 
     def __init__(
         self,
@@ -99,28 +104,55 @@ class HMACAuth(AuthBase):
         nonce_header: str = None,
         signature_header: str = None,
         algorithm=None,
+        nonces: NonceGenerator = None,
     ):
-        # Set credentials
-        self.api_key: str = api_key
-        self.secret: str = secret
         # Override defaults
         if api_key_header is not None:
-            self.api_key_header = self.api_key_header
+            self.api_key_header = api_key_header
         if nonce_header is not None:
-            self.nonce_header = self.nonce_header
+            self.nonce_header = nonce_header
         if signature_header is not None:
-            self.signature_header = self.signature_header
+            self.signature_header = signature_header
         if algorithm is not None:
-            self.algorithm = self.algorithm
+            self.algorithm = algorithm
+        # Set credentials, after the algorithm they are keyed with
+        self.api_key: str = api_key
+        self.secret: str = secret
+        # Nonces, share one generator between every auth using the same key
+        self.nonces: NonceGenerator = nonces or NonceGenerator()
         # Set counters
         self.last_nonce: int = 0
         self.num_401_calls: int = 0
 
+    @property
+    def secret(self) -> str:
+        return self._secret
+
+    @secret.setter
+    def secret(self, secret: str):
+        self._secret = secret
+        # Keyed HMAC state, prepared now so no request pays for it
+        self._hmac = None
+        if secret is not None:
+            self._hmac = hmac.new(self.secret_key(), digestmod=self.algorithm)
+
+    def secret_key(self) -> bytes:
+        """Secret as the HMAC key"""
+        return self.secret.encode()
+
+    def new_hmac(self):
+        """HMAC keyed with the secret, ready to sign a message.
+
+        The key is processed once, when the secret is set, and every
+        signature copies that state.
+        """
+        return self._hmac.copy()
+
     def _nonce(self):
         return self.timestamp.microseconds()
 
     def new_nonce(self, nonce: int = None):
-        nonce = nonce or self._nonce()
+        nonce = self.nonces.next(nonce or self._nonce())
         self.last_nonce = nonce
         return str(nonce)
 
@@ -147,9 +179,8 @@ class HMACAuth(AuthBase):
         """Sign the message"""
         encoded_msg = msg.encode() if isinstance(msg, str) else msg
 
-        h = hmac.new(
-            key=self.secret.encode(), msg=encoded_msg, digestmod=self.algorithm
-        )
+        h = self.new_hmac()
+        h.update(encoded_msg)
 
         signature = h.hexdigest()
 
@@ -161,6 +192,27 @@ class HMACAuth(AuthBase):
         self.add_nonce(r, nonce)
         self.add_signature(r, nonce)
 
+    def prepare_payload(self, request: Request):
+        """Pre-encode signing hook, called by ClientSession.
+
+        Gets the request before its payload dicts are encoded, so fields can
+        be added and signed without parsing the encoded body back, and
+        returns the auth callable for the prepared request. By default the
+        prepared request is signed as a whole.
+        """
+        return self
+
+    def _finish(self, sign):
+        """Auth callable running `sign` on the prepared request."""
+
+        def finish(r: P):
+            sign(r)
+            r.register_hook("response", self.handle_401)
+            r.register_hook("response", self.handle_redirect)
+            return r
+
+        return finish
+
     def handle_redirect(self, r: R, **kwargs):
         """Reset num_401_calls counter on redirects."""
         if r.is_redirect:
@@ -174,7 +226,7 @@ class HMACAuth(AuthBase):
             self.num_401_calls += 1
 
             # Renew nonce
-            nonce = self.new_nonce(max(self._nonce(), self.last_nonce + 1))
+            nonce = self.new_nonce()
 
             # Consume content and release the original connection
             # to allow our new request to reuse the same one.
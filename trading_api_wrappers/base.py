@@ -1,20 +1,34 @@
-import asyncio
 import json as j
+import math
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from json.decoder import JSONDecodeError
-from typing import Iterable
+from fnmatch import fnmatchcase
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Union
 from urllib.parse import urljoin
 
-import backoff
 import requests
-from requests import Response, Session
+from requests import PreparedRequest, Request, Response, Session
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
 from requests.auth import AuthBase
 from requests_toolbelt import user_agent as ua
+from urllib3.util.retry import Retry
 
 from ._version import __version__
+from .adapters import PoolAdapter, SocketOption, keep_alive_options
+from .cache import Cache, MemoryCache
 from .common import clean_empty
-from .errors import DecodeError, InvalidResponse, RequestException
+from .decoders import Decoder, get_decoder
+from .errors import DecodeError, InvalidResponse, RateLimitExceeded
+from .limiter import Budget, LeakyBucket, RateLimiter
+from .nonce import NonceGenerator
+from .retry import RetryPolicy
+from .schema import without_payload
+from .singleflight import SingleFlight
+from .streaming import JSONArrayParser
 
 TIMEOUT = 30
 RETRY_CODES = [
@@ -48,10 +62,44 @@ class Timestamp:
 timestamp = Timestamp()
 
 
+def parse_seconds(value: str, now: float = None):
+    """Parse a delay from a rate limit header, in seconds from now.
+
+    Accepts delays in seconds, epoch timestamps (seconds or milliseconds)
+    and HTTP dates, ex. the values of Retry-After or X-RateLimit-Reset.
+    """
+    if value is None:
+        return None
+    now = time.time() if now is None else now
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+        except (TypeError, ValueError):
+            return None
+    if seconds > 1e12:
+        seconds /= 1e3
+    if seconds > 1e9:
+        seconds -= now
+    return max(0.0, seconds)
+
+
 class ClientSession(Session):
     user_agent = ua("trading-api-wrappers", __version__)
 
-    def __init__(self, base_url: str, timeout: int = TIMEOUT, user_agent: str = None):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = TIMEOUT,
+        user_agent: str = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: bool = False,
+        socket_options: List[SocketOption] = None,
+        adapter_retries: Union[int, Retry] = 0,
+    ):
         # Init session
         super().__init__()
         # Instance attributes
@@ -62,10 +110,70 @@ class ClientSession(Session):
         self.last_request_timestamp: int = 0
         if user_agent is not None:
             self.user_agent = user_agent
+        # Connection pool
+        self.pool_connections: int = pool_connections
+        self.pool_maxsize: int = pool_maxsize
+        self.pool_block: bool = pool_block
+        if keep_alive:
+            socket_options = keep_alive_options() + list(socket_options or [])
+        self.socket_options: List[SocketOption] = socket_options
+        # urllib3 retries below `Client.retry_policy`, off by default so the
+        # policy is the only retry layer and its backoff is not multiplied
+        self.adapter_retries: Union[int, Retry] = adapter_retries
+        self.pool_owner: ClientSession = self
+        self.mount_adapters()
+
+    def mount_adapters(self):
+        adapter = PoolAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            socket_options=self.socket_options,
+            max_retries=self.adapter_retries,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def share_pool(self, session: "ClientSession"):
+        """Send requests through the connection pool of another session."""
+        self.pool_owner = session.pool_owner
+        for prefix, adapter in self.pool_owner.adapters.items():
+            self.mount(prefix, adapter)
+
+    def close(self):
+        # Shared pools are closed by their owner only
+        if self.pool_owner is self:
+            super().close()
 
     def request(self, method, endpoint, *args, **kwargs):
         """Send the request after generating the complete URL."""
         kwargs.setdefault("allow_redirects", True)
+        url, kwargs = self.prepare_kwargs(endpoint, kwargs)
+        # Send the request
+        return super().request(
+            method,
+            url,
+            auth=self.auth,
+            timeout=self.timeout,
+            *args,
+            **kwargs,
+        )
+
+    def prepare_request(self, request: Request) -> PreparedRequest:
+        """Let the auth sign the payload before it is encoded.
+
+        Auths with a `prepare_payload` hook get the original request (payload
+        dicts still in `data`/`json`) and return the auth callable to apply
+        once it is prepared.
+        """
+        auth = request.auth or self.auth
+        prepare_payload = getattr(auth, "prepare_payload", None)
+        if prepare_payload is not None:
+            request.auth = prepare_payload(request)
+        return super().prepare_request(request)
+
+    def prepare_kwargs(self, endpoint: str, kwargs: dict):
+        """Generate the complete URL and clean the request arguments."""
         url = self.url_for(endpoint)
         # Clean empty values
         for key in ["data", "json", "params"]:
@@ -76,16 +184,8 @@ class ClientSession(Session):
         # Set default user-agent
         headers = kwargs.pop("headers", {})
         headers["User-Agent"] = self.user_agent
-        # Send the request
-        return super().request(
-            method,
-            url,
-            headers=headers,
-            auth=self.auth,
-            timeout=self.timeout,
-            *args,
-            **kwargs,
-        )
+        kwargs["headers"] = headers
+        return url, kwargs
 
     def url_for(self, endpoint: str):
         """Create the URL based off this partial endpoint."""
@@ -97,10 +197,35 @@ class Client:
     error_keys: Iterable[str] = []
     rate_limit: int = 0  # in milliseconds
     session_cls = ClientSession
+    flight_cls = SingleFlight
     timestamp: Timestamp = timestamp
     retry_codes: Iterable[int] = RETRY_CODES
+    # Retry settings overrides by endpoint pattern, ex: {"private/*": {...}}
+    endpoint_retry: Dict[str, dict] = {}
+    # Rate limiter tokens taken by endpoint pattern (default: 1)
+    endpoint_weights: Dict[str, float] = {}
+    # Error messages flagging a rate limit hit, besides 429 status codes
+    rate_limit_errors: Iterable[str] = []
+    # Response headers reporting the remaining quota and its reset time
+    rate_limit_headers: Dict[str, str] = {
+        "remaining": "X-RateLimit-Remaining",
+        "reset": "X-RateLimit-Reset",
+    }
+    # Cache TTL in seconds by endpoint pattern, for GETs (needs a cache)
+    endpoint_ttl: Dict[str, float] = {}
+    # GETs revalidated with ETag/Last-Modified by endpoint pattern
+    conditional_endpoints: Iterable[str] = []
+    conditional_cache_size: int = 32  # responses kept for revalidation
+    # Connection pool settings, see ClientSession
+    pool_options: Dict[str, Any] = {}
+    # Bytes read at a time from streamed responses
+    stream_chunk_size: int = 64 * 1024
+    # Pages fetched at once by paginated iterators, clients signed with
+    # `ordered_nonces` fetch one at a time unless told otherwise
+    page_concurrency: int = 4
     # Client defaults
     enable_rate_limit: bool = True
+    single_flight: bool = False  # share identical GETs in flight
     backoff_factor: float = 1.5  # in seconds
     max_retries: int = 3
     timeout: int = TIMEOUT
@@ -113,6 +238,12 @@ class Client:
         rate_limit: int = None,
         user_agent: str = None,
         base_url: str = None,
+        retry_policy: RetryPolicy = None,
+        limiter: RateLimiter = None,
+        json_decoder: Union[str, Decoder] = None,
+        pool_options: Dict[str, Any] = None,
+        single_flight: bool = None,
+        cache: Cache = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -127,10 +258,37 @@ class Client:
             self.backoff_factor = backoff_factor
         if base_url is not None:
             self.base_url = base_url
+        if single_flight is not None:
+            self.single_flight = single_flight
         # Create session
+        if pool_options is not None:
+            self.pool_options = {**self.pool_options, **pool_options}
         self.session: ClientSession = self.session_cls(
-            self.base_url, self.timeout, user_agent
+            self.base_url, self.timeout, user_agent, **self.pool_options
         )
+        # Retry policies
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy(
+            max_tries=self.max_retries,
+            factor=self.backoff_factor,
+            max_time=self.timeout,
+            retry_codes=self.retry_codes,
+        )
+        self.endpoint_retry_policies: Dict[str, RetryPolicy] = {
+            pattern: self.retry_policy.replace(**settings)
+            for pattern, settings in self.endpoint_retry.items()
+        }
+        # Rate limiter, share one instance to limit several clients together
+        if limiter is None and self.rate_limit:
+            limiter = LeakyBucket(rate=1e3 / self.rate_limit)
+        self.limiter: RateLimiter = limiter
+        # Requests in flight, shared by identical concurrent GETs
+        self.flights = self.flight_cls()
+        # Decoded responses cache, for endpoints with a TTL
+        self.cache: Cache = cache
+        # Validators and decoded body of the last conditional GETs
+        self.validators: Cache = MemoryCache(self.conditional_cache_size)
+        # JSON backend, decodes the raw response content
+        self.json_loads: Decoder = get_decoder(json_decoder)
         # Attributes
         self.last_request_timestamp: int = 0
 
@@ -149,84 +307,285 @@ class Client:
     def delete(self, endpoint, **kwargs):
         return self._fetch("DELETE", endpoint, **kwargs)
 
-    def _retry(self, target):
-        # Verify that sync version is not being run from coroutine
-        # Backoff can't run inside a coroutine.
-        try:
-            asyncio.get_event_loop()
-        except RuntimeError:
-            # Event loop not set for this thread.
-            return target
-
-        def give_up_retry(e: RequestException):
-            give_up = False
-            if e.response:
-                code = e.response.status_code
-                give_up = code not in self.retry_codes
-            return give_up
-
-        return backoff.on_exception(
-            backoff.expo,
-            RequestException,
-            factor=self.backoff_factor,
-            max_time=self.timeout,
-            max_tries=self.max_retries,
-            giveup=give_up_retry,
-        )(target)
+    def share_pool(self, client: "Client"):
+        """Reuse the connection pool of another client, ex. same host."""
+        self.session.share_pool(client.session)
+
+    def _retry_policy_for(self, endpoint: str) -> RetryPolicy:
+        for pattern, policy in self.endpoint_retry_policies.items():
+            if fnmatchcase(endpoint, pattern):
+                return policy
+        return self.retry_policy
+
+    def _weight_for(self, endpoint: str) -> float:
+        for pattern, weight in self.endpoint_weights.items():
+            if fnmatchcase(endpoint, pattern):
+                return weight
+        return 1
+
+    def _request_key(self, method, endpoint, kwargs):
+        """Identify a request by its method, URL and arguments."""
+        arguments = j.dumps(kwargs, sort_keys=True, default=str)
+        return method, self.session.url_for(endpoint), arguments
+
+    def _ttl_for(self, method, endpoint: str) -> float:
+        if self.cache is None or method != "GET":
+            return None
+        for pattern, ttl in self.endpoint_ttl.items():
+            if fnmatchcase(endpoint, pattern):
+                return ttl
+        return None
 
     def _fetch(self, method, endpoint, *args, **kwargs):
-        @self._retry
-        def fetch():
-            return self._fetch_base(method, endpoint, *args, **kwargs)
-
-        return fetch()
+        ttl = self._ttl_for(method, endpoint)
+        if not ttl:
+            return self._send(method, endpoint, *args, **kwargs)
+        key = self._request_key(method, endpoint, kwargs)
+        found, data = self.cache.get(key)
+        if found:
+            # Still awaitable for async clients
+            return self._then(data, lambda d: d)
+
+        def store(data):
+            self.cache.set(key, data, ttl)
+            return data
+
+        return self._then(self._send(method, endpoint, *args, **kwargs), store)
+
+    def _send(self, method, endpoint, *args, **kwargs):
+        policy = self._retry_policy_for(endpoint)
+        if self.single_flight and method == "GET":
+            return self.flights.do(
+                self._request_key(method, endpoint, kwargs),
+                policy.call,
+                self._fetch_base,
+                method,
+                endpoint,
+                *args,
+                **kwargs,
+            )
+        return policy.call(self._fetch_base, method, endpoint, *args, **kwargs)
 
     def _fetch_base(self, method, endpoint, *args, **kwargs):
         # Rate limit requests
-        if self.rate_limit:
-            self.throttle()
+        self.throttle(endpoint)
         self.last_request_timestamp = self.timestamp.milliseconds()
+        validation = self._conditional(method, endpoint, kwargs)
         # Send the request
         response = self.session.request(method, endpoint, *args, **kwargs)
+        return self._handle_response(response, validation)
+
+    def _conditional(self, method, endpoint, kwargs):
+        """Add the validators of the last response to a conditional GET.
+
+        Returns the key and last (etag, last_modified, json) of the request,
+        None if the endpoint is not revalidated.
+        """
+        if method != "GET" or not any(
+            fnmatchcase(endpoint, pattern) for pattern in self.conditional_endpoints
+        ):
+            return None
+        key = self._request_key(method, endpoint, kwargs)
+        found, last = self.validators.get(key)
+        if not found:
+            return key, None
+        etag, last_modified, _ = last
+        headers = dict(kwargs.get("headers") or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        kwargs["headers"] = headers
+        return key, last
+
+    def _stream(self, method, endpoint, **kwargs):
+        """Yield the items of a JSON array response while it downloads.
+
+        The request is sent on the first iteration, only that first step
+        is retried.
+        """
+        policy = self._retry_policy_for(endpoint)
+        response = policy.call(self._open_stream, method, endpoint, **kwargs)
+        parser = JSONArrayParser()
+        with response:
+            try:
+                for chunk in response.iter_content(self.stream_chunk_size):
+                    yield from parser.feed(chunk)
+                yield from parser.close()
+            except ValueError as e:
+                error_msg = "Unable to decode JSON array from response"
+                raise DecodeError(error_msg, response) from e
+        self._check_stream(parser, response)
+
+    def _iter_pages(self, fetch_page, items, total_pages, concurrency: int = None):
+        """Yield the items of every page of a paginated endpoint, in order.
+
+        The first page tells the number of pages, the rest are fetched
+        `concurrency` at a time (each request still goes through the rate
+        limiter) while the items of the earlier ones are consumed.
+
+        Args:
+            fetch_page: Function fetching a page by number, from 1.
+            items: Function returning the items of a fetched page.
+            total_pages: Function returning the number of pages.
+            concurrency (int): Pages in flight, see `_page_concurrency`.
+        """
+        concurrency = self._page_concurrency(concurrency)
+        first = fetch_page(1)
+        yield from items(first)
+        pages = iter(range(2, total_pages(first) + 1))
+        executor = ThreadPoolExecutor(concurrency)
+        futures = deque()
+        try:
+            for page in islice(pages, concurrency):
+                futures.append(executor.submit(fetch_page, page))
+            while futures:
+                data = futures.popleft().result()
+                for page in islice(pages, 1):
+                    futures.append(executor.submit(fetch_page, page))
+                yield from items(data)
+        finally:
+            # Stopped early, don't fetch the pages left
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _page_concurrency(self, concurrency: int = None) -> int:
+        """Pages in flight: `concurrency` if given, 1 for clients signed with
+        `ordered_nonces` and `page_concurrency` otherwise.
+
+        Concurrent signed requests may reach the server out of nonce order,
+        exchanges that reject that get one request at a time.
+        """
+        if concurrency:
+            return concurrency
+        if getattr(self.session.auth, "ordered_nonces", False):
+            return 1
+        return self.page_concurrency
+
+    def _open_stream(self, method, endpoint, **kwargs):
+        # Rate limit requests
+        self.throttle(endpoint)
+        self.last_request_timestamp = self.timestamp.milliseconds()
+        # Send the request, the body is read by the caller
+        response = self.session.request(method, endpoint, stream=True, **kwargs)
+        if not response.ok:
+            # Error bodies are small, read them and raise as usual
+            self._handle_response(response)
+        self._update_rate_limit(response)
+        return response
+
+    def _check_stream(self, parser: JSONArrayParser, response: Response):
+        """Raise for streamed responses that were not JSON arrays."""
+        if parser.document is not None:
+            error_msg = self._get_error_message(parser.document)
+            if error_msg:
+                raise self._invalid_response(error_msg, response)
+            raise DecodeError("Expected a JSON array in response", response)
+
+    def _handle_response(self, response: Response, validation=None):
+        if validation is not None:
+            key, last = validation
+            # Not modified, reuse the last decoded body
+            if last is not None and response.status_code == 304:
+                self._update_rate_limit(response)
+                return last[2]
         # Check response for errors
         try:
             response.raise_for_status()
         except requests.HTTPError:
             error_msg = self._get_error_message(response)
-            raise InvalidResponse(error_msg, response)
+            raise self._invalid_response(error_msg, response)
         # Decode the response
         json = self._decode_response(response)
+        self._update_rate_limit(response)
+        if validation is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.validators.set(key, (etag, last_modified, json), ttl=math.inf)
         return json
 
+    def _invalid_response(self, error_msg, response: Response):
+        rate_limited = response.status_code == 429 or any(
+            error in (error_msg or "") for error in self.rate_limit_errors
+        )
+        if not rate_limited:
+            return InvalidResponse(error_msg, response)
+        retry_after = parse_seconds(response.headers.get("Retry-After"))
+        if self.limiter is not None:
+            self.limiter.on_rate_limited(retry_after)
+        return RateLimitExceeded(error_msg, response, retry_after)
+
+    def _update_rate_limit(self, response: Response):
+        """Feed the limiter with the quota reported by the server."""
+        if self.limiter is None:
+            return
+        self.limiter.on_success()
+        headers = self.rate_limit_headers
+        remaining = response.headers.get(headers.get("remaining"))
+        if remaining is not None:
+            try:
+                remaining = float(remaining)
+            except ValueError:
+                return
+            reset = parse_seconds(response.headers.get(headers.get("reset")))
+            self.limiter.on_quota(remaining, reset)
+
+    @property
+    def rate_budget(self) -> Budget:
+        """Current rate limit budget (rate, capacity and available tokens)."""
+        if self.limiter is None:
+            return None
+        return self.limiter.budget()
+
     def _get_error_message(self, data):
+        if isinstance(data, Response):
+            try:
+                data = self.json_loads(data.content)
+            except ValueError:
+                return None
         for error_key in self.error_keys:
             try:
-                json = data.json() if isinstance(data, Response) else data
-                message = json[error_key]
+                message = data[error_key]
                 if message:
                     msg = j.dumps(message).replace('"', "").rstrip(".")
                     msg = f"{error_key}: {msg}"
                     return msg
-            except (JSONDecodeError, KeyError, TypeError):
+            except (KeyError, TypeError):
                 continue
 
     def _decode_response(self, response):
         try:
-            json = response.json()
-        except JSONDecodeError as e:
+            json = self.json_loads(response.content)
+        except ValueError as e:
             error_msg = "Unable to decode JSON from response (no content)"
             raise DecodeError(error_msg, response) from e
         error_msg = self._get_error_message(json)
         if error_msg:
-            raise InvalidResponse(error_msg, response)
+            raise self._invalid_response(error_msg, response)
         return json
 
-    def throttle(self):
-        now = float(self.timestamp.milliseconds())
-        elapsed = now - self.last_request_timestamp
-        if elapsed < self.rate_limit:
-            delay = self.rate_limit - elapsed
-            time.sleep(delay / 1e3)
+    def _then(self, result, callback):
+        """Apply callback to the result of a request.
+
+        Sync clients get the decoded result right away, async clients
+        override this to chain the callback after awaiting the request.
+        """
+        return callback(result)
+
+    def _map(self, items, func):
+        """Apply func to every item of a streamed response.
+
+        Async clients override this to map over async iterators.
+        """
+        return map(func, items)
+
+    def throttle(self, endpoint: str = None):
+        if self.limiter is not None and self.enable_rate_limit:
+            weight = self._weight_for(endpoint) if endpoint else 1
+            if weight:
+                self.limiter.acquire(weight)
 
     def __del__(self):
         if self.session:
@@ -236,6 +595,11 @@ class Client:
 class AuthMixin:
     auth_cls = None
 
+    def __init__(self, nonces: NonceGenerator = None, **kwargs):
+        super().__init__(**kwargs)
+        # Share one generator to sign with the same key from several clients
+        self.nonces: NonceGenerator = nonces
+
     @property
     def auth(self):
         return self.session.auth
@@ -245,16 +609,47 @@ class AuthMixin:
         self.session.auth = auth
 
     def add_auth(self, *credentials):
-        self.auth = self.auth_cls(*credentials)
+        self.auth = self.auth_cls(*credentials, nonces=self.nonces)
 
 
 class ModelMixin:
     return_json: bool = False
+    keep_json: bool = True  # raw payload in the `json` field of models
+    lazy_models: bool = False  # build nested model lists on access
 
-    def __init__(self, return_json: bool = None):
-        super().__init__()
+    def __init__(
+        self,
+        return_json: bool = None,
+        keep_json: bool = None,
+        lazy_models: bool = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
         if return_json is not None:
             self.return_json = return_json
+        if keep_json is not None:
+            self.keep_json = keep_json
+        if lazy_models is not None:
+            self.lazy_models = lazy_models
+
+    def _build(self, data, builder):
+        """Build models from the fetched data, unless return_json is set."""
+        return self._then(data, lambda d: self._model(d, builder))
+
+    def _build_iter(self, items, builder):
+        """Build a model from every streamed item, unless return_json is set."""
+        if self.return_json:
+            return items
+        return self._map(items, lambda item: self._model(item, builder))
+
+    def _model(self, data, builder):
+        if self.return_json:
+            return data
+        if self.keep_json:
+            return builder(data)
+        # Don't hold the payload twice, parsed and raw
+        with without_payload():
+            return builder(data)
 
 
 class _Enum(Enum):
@@ -1,5 +1,6 @@
-from .client import Bitcoinity
+from .client import Bitcoinity, BitcoinityAsync
 
 __all__ = [
     "Bitcoinity",
+    "BitcoinityAsync",
 ]
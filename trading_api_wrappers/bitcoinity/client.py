@@ -1,3 +1,4 @@
+from ..aio import AsyncClient
 from ..base import Client
 
 
@@ -14,3 +15,7 @@ class Bitcoinity(Client):
                 "span": span,
             },
         )
+
+
+class BitcoinityAsync(AsyncClient, Bitcoinity):
+    pass
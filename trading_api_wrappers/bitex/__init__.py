@@ -1,5 +1,5 @@
 from . import models as _m
-from .client_public import BitexPublic
+from .client_public import BitexAsyncPublic, BitexPublic
 
 __all__ = [
     "Bitex",
@@ -12,3 +12,4 @@ class Bitex:
     # Enum Types
     # Clients
     Public = BitexPublic
+    AsyncPublic = BitexAsyncPublic
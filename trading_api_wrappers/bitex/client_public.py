@@ -1,5 +1,7 @@
 from . import models as _m
+from ..aio import AsyncClient
 from ..base import Client, ModelMixin
+from ..columnar import ColumnarOrderBook
 
 
 class BitexPublic(Client, ModelMixin):
@@ -7,26 +9,29 @@ class BitexPublic(Client, ModelMixin):
 
     base_url = "https://bitex.la/api-v1/rest/"
     error_keys = ["error"]
+    # The archive only changes once an hour
+    conditional_endpoints = ["*/market/transactions_archive"]
 
     def ticker(self, market_id: str):
         """Overview of current market prices and trade volume."""
         data = self.get(f"{market_id}/market/ticker")
-        if self.return_json:
-            return data
-        return _m.Ticker.create_from_json(data)
+        return self._build(data, _m.Ticker.create_from_json)
 
-    def order_book(self, market_id: str):
-        """Return bids and asks represented as a list of price and amount."""
+    def order_book(self, market_id: str, columnar: bool = False):
+        """Return bids and asks represented as a list of price and amount.
+
+        Or as price and amount arrays with `columnar=True`.
+        """
         data = self.get(f"{market_id}/market/order_book")
-        if self.return_json:
-            return data
-        return _m.OrderBook.create_from_json(data)
+        if columnar:
+            return self._then(data, ColumnarOrderBook.create_from_json)
+        return self._build(data, _m.OrderBook.create_from_json)
 
     def _transactions(self, market_id: str, endpoint: str):
         data = self.get(f"{market_id}/market/{endpoint}")
-        if self.return_json:
-            return data
-        return [_m.Transaction.create_from_json(tx) for tx in data]
+        return self._build(
+            data, lambda d: [_m.Transaction.create_from_json(tx) for tx in d]
+        )
 
     def transactions(self, market_id: str):
         """
@@ -45,3 +50,15 @@ class BitexPublic(Client, ModelMixin):
         times per hour. Don't worry though, it only changes once an hour.
         """
         return self._transactions(market_id, "transactions_archive")
+
+    def iter_transactions_archive(self, market_id: str):
+        """
+        Same as `transactions_archive`, but yield each trade while the
+        archive downloads instead of loading it whole into memory.
+        """
+        items = self._stream("GET", f"{market_id}/market/transactions_archive")
+        return self._build_iter(items, _m.Transaction.create_from_json)
+
+
+class BitexAsyncPublic(AsyncClient, BitexPublic):
+    pass
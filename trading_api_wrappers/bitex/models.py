@@ -1,5 +1,7 @@
 from collections import namedtuple
 
+from ..schema import payload
+
 
 class Ticker(
     namedtuple(
@@ -30,7 +32,7 @@ class Ticker(
             volume=ticker["volume"],
             bid=ticker["bid"],
             ask=ticker["ask"],
-            json=ticker,
+            json=payload(ticker),
         )
 
 
@@ -70,7 +72,7 @@ class OrderBook(
             bids=[
                 OrderBookEntry.create_from_json(entry) for entry in order_book["bids"]
             ],
-            json=order_book,
+            json=payload(order_book),
         )
 
 
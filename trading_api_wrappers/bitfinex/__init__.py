@@ -1,9 +1,13 @@
 from . import constants_v1 as _c1
 from . import constants_v2 as _c2
 from . import models_v2 as _m2
-from .client_auth_v1 import BitfinexAuth
-from .client_public_v1 import BitfinexPublic
+from .candles import CandleDownloader as CandleDownloaderV2
+from .client_auth_v1 import BitfinexAsyncAuth, BitfinexAuth
+from .client_public_v1 import BitfinexAsyncPublic, BitfinexPublic
+from .client_public_v2 import BitfinexAsyncPublic as BitfinexAsyncPublicV2
 from .client_public_v2 import BitfinexPublic as BitfinexPublicV2
+from .history import BalanceHistoryFeed, PastTradesFeed
+from .order_book import OrderBook as OrderBookV2
 
 __all__ = [
     "Bitfinex",
@@ -15,14 +19,21 @@ class Bitfinex:
     # Enum Types
     Currency = _c1.Currency
     Symbol = _c1.Symbol
+    # History feeds
+    BalanceHistoryFeed = BalanceHistoryFeed
+    PastTradesFeed = PastTradesFeed
     # Clients V1
     Auth = BitfinexAuth
     Public = BitfinexPublic
+    AsyncAuth = BitfinexAsyncAuth
+    AsyncPublic = BitfinexAsyncPublic
 
 
 class BitfinexV2:
     # Models
     models = _m2
+    OrderBook = OrderBookV2
+    CandleDownloader = CandleDownloaderV2
     # Enum Types
     BookPrecision = _c2.BookPrecision
     Symbol = _c2.Symbol
@@ -30,3 +41,4 @@ class BitfinexV2:
     # TODO: Implement Bitfinex v2 Auth client
     # Auth = BitfinexAuthV2
     Public = BitfinexPublicV2
+    AsyncPublic = BitfinexAsyncPublicV2
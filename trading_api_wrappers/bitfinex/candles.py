@@ -0,0 +1,58 @@
+from ..candles import CandleDownloader as _CandleDownloader
+
+# Candle duration in seconds by time frame
+TIME_FRAMES = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "3h": 3 * 3600,
+    "6h": 6 * 3600,
+    "12h": 12 * 3600,
+    "1D": 86400,
+    "7D": 7 * 86400,
+    "14D": 14 * 86400,
+    "1M": 31 * 86400,
+}
+
+
+class CandleDownloader(_CandleDownloader):
+    """Download `BitfinexPublic.candles_hist` (v2) over any time range.
+
+    Each window holds `limit` candles, the most a request returns.
+
+    Args:
+        client: `BitfinexV2.Public` client.
+        symbol (str): Trading symbol, ex. "tBTCUSD".
+        time_frame (str): Candle time frame, ex. "1m" or "1D".
+        limit (int): Candles per request.
+    """
+
+    def __init__(
+        self,
+        client,
+        symbol: str,
+        time_frame: str,
+        limit: int = 10000,
+        concurrency: int = None,
+        retries: int = 2,
+    ):
+        super().__init__(client, concurrency, retries)
+        self.symbol: str = str(symbol)
+        self.time_frame: str = time_frame
+        self.limit: int = limit
+        self.window: float = limit * TIME_FRAMES[time_frame]
+
+    def fetch_window(self, start: float, end: float):
+        candles = self.client.candles_hist(
+            self.symbol,
+            self.time_frame,
+            limit=self.limit,
+            start=int(start * 1000),
+            # `end` is inclusive, in milliseconds
+            end=int(end * 1000) - 1,
+            sort=True,
+        )
+        # MTS, OPEN, CLOSE, HIGH, LOW, VOLUME (models or raw JSON)
+        return [(c[0] / 1000, c[1], c[3], c[4], c[2], c[5]) for c in candles]
@@ -1,8 +1,10 @@
 import base64
 
 from requests import PreparedRequest as P
+from requests import Request
 
 from .client_public_v1 import BitfinexPublic
+from ..aio import AsyncClient
 from ..auth import HMACAuth
 from ..base import AuthMixin
 
@@ -23,9 +25,24 @@ class BitfinexHMACAuth(HMACAuth):
         signature = self.sign(message)
         r.headers[self.signature_header] = signature
 
+    def prepare_payload(self, request: Request):
+        # Keep the JSON payload dict, the signed message is built from it
+        nonce = self.new_nonce()
+        payload = request.json or {}
+
+        def sign(r: P):
+            self.add_api_key(r)
+            message = self._message(dict(payload), r.path_url, nonce)
+            r.headers[self.payload_header] = message
+            r.headers[self.signature_header] = self.sign(message)
+
+        return self._finish(sign)
+
     def build_message(self, r: P, nonce: str):
-        body = self.load_json(r.body)
-        body["request"] = r.path_url
+        return self._message(self.load_json(r.body), r.path_url, nonce)
+
+    def _message(self, body: dict, path_url: str, nonce: str):
+        body["request"] = path_url
         body["nonce"] = nonce
         encoded_msg = base64.b64encode(self.encode_json(body))
         return encoded_msg
@@ -261,3 +278,7 @@ class BitfinexAuth(BitfinexPublic, AuthMixin):
     # View your active offers.
     def active_offers(self):
         return self.post("offers")
+
+
+class BitfinexAsyncAuth(AsyncClient, BitfinexAuth):
+    pass
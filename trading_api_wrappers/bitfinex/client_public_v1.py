@@ -1,9 +1,11 @@
+from ..aio import AsyncClient
 from ..base import Client
 
 
 class BitfinexPublic(Client):
     base_url = "https://api.bitfinex.com/v1/"
     error_keys = ["message"]
+    endpoint_ttl = {"symbols": 3600, "symbols_details": 3600}
 
     def ticker(self, symbol: str):
         """Gets the innermost bid and asks and information on the most recent trade.
@@ -290,3 +292,7 @@ class BitfinexPublic(Client):
 
         """
         return self.get("symbols_details")
+
+
+class BitfinexAsyncPublic(AsyncClient, BitfinexPublic):
+    pass
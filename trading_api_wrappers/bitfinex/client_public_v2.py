@@ -1,7 +1,10 @@
 from datetime import datetime
 
 from . import models_v2 as _m
+from .order_book import OrderBook
+from ..aio import AsyncClient
 from ..base import Client, ModelMixin
+from ..columnar import structured_array
 
 
 class BitfinexPublic(Client, ModelMixin):
@@ -10,9 +13,7 @@ class BitfinexPublic(Client, ModelMixin):
 
     def ticker(self, symbol: str):
         data = self.get(f"ticker/{symbol}")
-        if self.return_json:
-            return data
-        return _m.TradingTicker.create_from_json(data)
+        return self._build(data, _m.TradingTicker.create_from_json)
 
     def tickers(self, symbols: list):
         data = self.get(
@@ -21,11 +22,10 @@ class BitfinexPublic(Client, ModelMixin):
                 "symbols": [str(symbol) for symbol in symbols],
             },
         )
-        if self.return_json:
-            return data
-        return {
-            ticker[0]: _m.TradingTicker.create_from_json(ticker[1:]) for ticker in data
-        }
+        return self._build(
+            data,
+            lambda d: {t[0]: _m.TradingTicker.create_from_json(t[1:]) for t in d},
+        )
 
     def trades(
         self,
@@ -34,31 +34,78 @@ class BitfinexPublic(Client, ModelMixin):
         start: float = None,
         end: float = None,
         sort: bool = None,
+        columnar: bool = False,
+    ):
+        """Columnar trades (`columnar=True`) are a NumPy structured array with
+        the `TradingTrade` fields."""
+        data = self.get(
+            f"trades/{symbol}/hist", params=self._trades_params(limit, start, end, sort)
+        )
+        if columnar:
+            return self._then(
+                data, lambda d: structured_array(d, _m.TradingTrade.schema)
+            )
+        return self._build(
+            data, lambda d: [_m.TradingTrade.create_from_json(trade) for trade in d]
+        )
+
+    def iter_trades(
+        self,
+        symbol: str,
+        limit: int = None,
+        start: float = None,
+        end: float = None,
+        sort: bool = None,
     ):
+        """Same as `trades`, but yield each trade while the response downloads."""
+        items = self._stream(
+            "GET",
+            f"trades/{symbol}/hist",
+            params=self._trades_params(limit, start, end, sort),
+        )
+        return self._build_iter(items, _m.TradingTrade.create_from_json)
+
+    @staticmethod
+    def _trades_params(limit, start, end, sort):
         if isinstance(start, datetime):
             start = start.timestamp() * 1000
         if isinstance(end, datetime):
             end = end.timestamp() * 1000
         if sort:
             sort = 1 if sort is True else -1
-        data = self.get(
-            f"trades/{symbol}/hist",
-            params={
-                "limit": limit,
-                "start": start,
-                "end": end,
-                "sort": sort,
-            },
-        )
-        if self.return_json:
-            return data
-        return [_m.TradingTrade.create_from_json(trade) for trade in data]
+        return {
+            "limit": limit,
+            "start": start,
+            "end": end,
+            "sort": sort,
+        }
 
-    def books(self, symbol: str, precision: str, length: int = None):
+    def books(
+        self,
+        symbol: str,
+        precision: str,
+        length: int = None,
+        columnar: bool = False,
+    ):
+        """Levels as `TradingBook` models, or orders as `TradingRawBook` for
+        raw books (precision "R0"). Columnar books (`columnar=True`) are a
+        NumPy structured array with the fields of those models."""
         data = self.get(f"book/{symbol}/{precision}", params={"len": length})
-        if self.return_json:
-            return data
-        return [_m.TradingBook.create_from_json(book) for book in data]
+        model = _m.TradingRawBook if precision == "R0" else _m.TradingBook
+        if columnar:
+            return self._then(data, lambda d: structured_array(d, model.schema))
+        return self._build(data, lambda d: [model.create_from_json(b) for b in d])
+
+    def order_book(self, symbol: str, precision: str, length: int = None):
+        """Local `OrderBook` seeded with a `books` snapshot.
+
+        `OrderBook` keeps price levels, so raw books (precision "R0"), which
+        list orders, are rejected.
+        """
+        if precision == "R0":
+            raise ValueError("Raw books (precision 'R0') can't seed an OrderBook")
+        data = self.get(f"book/{symbol}/{precision}", params={"len": length})
+        return self._then(data, OrderBook)
 
     def stats(
         self,
@@ -74,12 +121,11 @@ class BitfinexPublic(Client, ModelMixin):
         data = self.get(
             f"stats1/{key}:{size}:{symbol}:{side}/{section}", params={"sort": sort}
         )
-        if self.return_json:
-            return data
         if section == "last":
-            return _m.Stat.create_from_json(data)
-        else:
-            return [_m.Stat.create_from_json(stat) for stat in data]
+            return self._build(data, _m.Stat.create_from_json)
+        return self._build(
+            data, lambda d: [_m.Stat.create_from_json(stat) for stat in d]
+        )
 
     def stats_last(
         self, symbol: str, key: str, size: str, side: str, sort: bool = None
@@ -100,7 +146,10 @@ class BitfinexPublic(Client, ModelMixin):
         start: float = None,
         end: float = None,
         sort: bool = None,
+        columnar: bool = False,
     ):
+        """Columnar candles (`columnar=True`) are a NumPy structured array
+        with the `Candle` fields, of a single row for the "last" section."""
         if isinstance(start, datetime):
             start = start.timestamp() * 1000
         if isinstance(end, datetime):
@@ -116,12 +165,18 @@ class BitfinexPublic(Client, ModelMixin):
                 "sort": sort,
             },
         )
-        if self.return_json:
-            return data
+        if columnar:
+            return self._then(
+                data,
+                lambda d: structured_array(
+                    [d] if section == "last" else d, _m.Candle.schema
+                ),
+            )
         if section == "last":
-            return _m.Candle.create_from_json(data)
-        else:
-            return [_m.Candle.create_from_json(candle) for candle in data]
+            return self._build(data, _m.Candle.create_from_json)
+        return self._build(
+            data, lambda d: [_m.Candle.create_from_json(candle) for candle in d]
+        )
 
     def candles_last(
         self,
@@ -142,5 +197,12 @@ class BitfinexPublic(Client, ModelMixin):
         start: float = None,
         end: float = None,
         sort: bool = None,
+        columnar: bool = False,
     ):
-        return self.candles(symbol, "hist", time_frame, limit, start, end, sort)
+        return self.candles(
+            symbol, "hist", time_frame, limit, start, end, sort, columnar
+        )
+
+
+class BitfinexAsyncPublic(AsyncClient, BitfinexPublic):
+    pass
@@ -0,0 +1,93 @@
+from itertools import groupby
+
+from ..history import Feed, Record
+
+
+class PastTradesFeed(Feed):
+    """`BitfinexAuth.past_trades` of a symbol, read oldest first from `since`.
+
+    Pages can only start at a timestamp, so more than `limit` trades in the
+    same second can't be read past: the sync raises `RuntimeError` instead
+    of skipping them (a larger `limit` gets through).
+
+    Args:
+        symbol (str): Trades symbol, ex. "btcusd".
+    """
+
+    name = "bitfinex:past_trades"
+    limit: int = 1000
+
+    def __init__(self, client, symbol: str, name: str = None):
+        super().__init__(client, name, symbol=str(symbol))
+
+    def fetch(self, since: float = None):
+        timestamp = since or 0
+        while True:
+            trades = self.client.past_trades(
+                timestamp=timestamp,
+                limit_trades=self.limit,
+                reverse=True,
+                **self.params,
+            )
+            for trade in trades:
+                yield Record(trade["tid"], float(trade["timestamp"]), trade)
+            if len(trades) < self.limit:
+                break
+            # `timestamp` is inclusive, the store drops the repeated trades
+            last = float(trades[-1]["timestamp"])
+            if last == timestamp:
+                raise RuntimeError(
+                    f"More than {self.limit} trades at {timestamp}, "
+                    "increase the feed limit"
+                )
+            timestamp = last
+
+
+class BalanceHistoryFeed(Feed):
+    """`BitfinexAuth.balance_history` of a currency, read newest first.
+
+    Entries have no id, they are identified by their content and their
+    position among the entries of the same timestamp, counted oldest first
+    so it doesn't change when newer entries arrive. More than `limit`
+    entries in the same second raise `RuntimeError`.
+
+    Args:
+        currency (str): Currency, ex. "usd".
+        wallet (str): Wallet, all of them by default.
+    """
+
+    name = "bitfinex:balance_history"
+    limit: int = 500
+
+    def __init__(self, client, currency: str, wallet: str = None, name: str = None):
+        super().__init__(client, name, currency=str(currency), wallet=wallet)
+
+    def fetch(self, since: float = None):
+        until = None
+        while True:
+            entries = self.client.balance_history(
+                since=since, until=until, limit=self.limit, **self.params
+            )
+            full = len(entries) == self.limit
+            groups = [
+                (float(timestamp), list(group))
+                for timestamp, group in groupby(entries, lambda e: e["timestamp"])
+            ]
+            if full:
+                if len(groups) == 1:
+                    raise RuntimeError(
+                        f"More than {self.limit} entries at {groups[0][0]}, "
+                        "increase the feed limit"
+                    )
+                # `until` is inclusive, the oldest timestamp may be cut short
+                # so it is read whole with the next page
+                until = groups.pop()[0]
+            for timestamp, group in groups:
+                for position, entry in enumerate(reversed(group)):
+                    entry_id = ":".join(
+                        str(entry.get(key))
+                        for key in ["timestamp", "amount", "balance", "description"]
+                    )
+                    yield Record(f"{entry_id}:{position}", timestamp, entry)
+            if not full:
+                break
@@ -1,5 +1,7 @@
 from collections import namedtuple
 
+from ..schema import Field, schema
+
 
 class TradingTicker(
     namedtuple(
@@ -73,6 +75,12 @@ class FoundingTicker(
         )
 
 
+@schema(
+    Field("ID", 0, dtype="i8"),
+    Field("MTS", 1, dtype="i8"),
+    Field("AMOUNT", 2, dtype="f8"),
+    Field("PRICE", 3, dtype="f8"),
+)
 class TradingTrade(
     namedtuple(
         "trading_trade",
@@ -84,14 +92,7 @@ class TradingTrade(
         ],
     )
 ):
-    @classmethod
-    def create_from_json(cls, trade):
-        return cls(
-            ID=trade[0],
-            MTS=trade[1],
-            AMOUNT=trade[2],
-            PRICE=trade[3],
-        )
+    pass
 
 
 class FoundingTrade(
@@ -117,6 +118,11 @@ class FoundingTrade(
         )
 
 
+@schema(
+    Field("PRICE", 0, dtype="f8"),
+    Field("COUNT", 1, dtype="i8"),
+    Field("AMOUNT", 2, dtype="f8"),
+)
 class TradingBook(
     namedtuple(
         "trading_book",
@@ -127,13 +133,25 @@ class TradingBook(
         ],
     )
 ):
-    @classmethod
-    def create_from_json(cls, book):
-        return cls(
-            PRICE=book[0],
-            COUNT=book[1],
-            AMOUNT=book[2],
-        )
+    pass
+
+
+@schema(
+    Field("ORDER_ID", 0, dtype="i8"),
+    Field("PRICE", 1, dtype="f8"),
+    Field("AMOUNT", 2, dtype="f8"),
+)
+class TradingRawBook(
+    namedtuple(
+        "trading_raw_book",
+        [
+            "ORDER_ID",
+            "PRICE",
+            "AMOUNT",
+        ],
+    )
+):
+    pass
 
 
 class FoundingBook(
@@ -174,6 +192,14 @@ class Stat(
         )
 
 
+@schema(
+    Field("MTS", 0, dtype="i8"),
+    Field("OPEN", 1, dtype="f8"),
+    Field("CLOSE", 2, dtype="f8"),
+    Field("HIGH", 3, dtype="f8"),
+    Field("LOW", 4, dtype="f8"),
+    Field("VOLUME", 5, dtype="f8"),
+)
 class Candle(
     namedtuple(
         "candle",
@@ -187,13 +213,4 @@ class Candle(
         ],
     )
 ):
-    @classmethod
-    def create_from_json(cls, candle):
-        return cls(
-            MTS=candle[0],
-            OPEN=candle[1],
-            CLOSE=candle[2],
-            HIGH=candle[3],
-            LOW=candle[4],
-            VOLUME=candle[5],
-        )
+    pass
@@ -0,0 +1,113 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Tuple
+
+from .models_v2 import TradingBook
+
+
+class _Side:
+    """Price levels of one side of the book.
+
+    Prices are kept in a sorted list (negated for asks) with the best level
+    last. Finding a level is O(log n), and inserting or deleting it moves
+    the better levels after it, O(n) in the worst case. Most updates hit
+    the top of the book, where few levels are moved, and P0-P4 books have
+    at most 250 levels per side. A tree would cost more than it saves at
+    that size.
+    """
+
+    def __init__(self, sign: int):
+        self.sign: int = sign
+        self.keys: List[float] = []
+        self.levels: Dict[float, TradingBook] = {}
+
+    def set(self, level: TradingBook):
+        if level.PRICE not in self.levels:
+            insort(self.keys, self.sign * level.PRICE)
+        self.levels[level.PRICE] = level
+
+    def delete(self, price: float):
+        if self.levels.pop(price, None) is not None:
+            del self.keys[bisect_left(self.keys, self.sign * price)]
+
+    def best(self) -> TradingBook:
+        return self.levels[self.sign * self.keys[-1]] if self.keys else None
+
+    def depth(self, length: int = None) -> List[TradingBook]:
+        start = 0 if length is None else max(0, len(self.keys) - length)
+        keys = self.keys[start:]
+        return [self.levels[self.sign * key] for key in reversed(keys)]
+
+    def clear(self):
+        self.keys.clear()
+        self.levels.clear()
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class OrderBook:
+    """Local trading order book, kept up to date with level updates.
+
+    Seed it with a `BitfinexPublic.books` snapshot (P0-P4 precisions, as
+    models or raw JSON) and apply the level updates streamed by the `book`
+    channel. A positive AMOUNT is a bid and a negative one an ask, and a
+    level with COUNT 0 is removed.
+    """
+
+    def __init__(self, levels: Iterable = None):
+        self.bids = _Side(1)
+        self.asks = _Side(-1)
+        if levels is not None:
+            self.update_many(levels)
+
+    def snapshot(self, levels: Iterable):
+        """Replace every level with a new snapshot."""
+        self.bids.clear()
+        self.asks.clear()
+        self.update_many(levels)
+
+    def update(self, level):
+        """Apply a `[PRICE, COUNT, AMOUNT]` level update."""
+        if not isinstance(level, TradingBook):
+            level = TradingBook.create_from_json(level)
+        side, other = (
+            (self.bids, self.asks) if level.AMOUNT > 0 else (self.asks, self.bids)
+        )
+        if level.COUNT > 0:
+            # A price level can cross to the other side
+            other.delete(level.PRICE)
+            side.set(level)
+        else:
+            side.delete(level.PRICE)
+
+    def update_many(self, levels: Iterable):
+        for level in levels:
+            self.update(level)
+
+    @property
+    def best_bid(self) -> TradingBook:
+        return self.bids.best()
+
+    @property
+    def best_ask(self) -> TradingBook:
+        return self.asks.best()
+
+    @property
+    def spread(self) -> float:
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+        return ask.PRICE - bid.PRICE
+
+    def depth(self, length: int = None) -> Tuple[List, List]:
+        """Top `length` levels of each side (all by default), best first."""
+        return self.bids.depth(length), self.asks.depth(length)
+
+    def __len__(self):
+        return len(self.bids) + len(self.asks)
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(bid={self.best_bid}, ask={self.best_ask}, "
+            f"levels={len(self)})"
+        )
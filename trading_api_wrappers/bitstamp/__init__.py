@@ -1,6 +1,7 @@
 from . import constants as _c
-from .client_auth import BitstampAuth
-from .client_public import BitstampPublic
+from .client_auth import BitstampAsyncAuth, BitstampAuth
+from .client_public import BitstampAsyncPublic, BitstampPublic
+from .history import UserTransactionsFeed
 
 __all__ = [
     "Bitstamp",
@@ -11,6 +12,10 @@ class Bitstamp:
     # Enum Types
     CurrencyPair = _c.CurrencyPair
     TimeInterval = _c.TimeInterval
+    # History feeds
+    UserTransactionsFeed = UserTransactionsFeed
     # Clients
     Auth = BitstampAuth
     Public = BitstampPublic
+    AsyncAuth = BitstampAsyncAuth
+    AsyncPublic = BitstampAsyncPublic
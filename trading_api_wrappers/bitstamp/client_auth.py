@@ -1,6 +1,8 @@
 from requests import PreparedRequest as P
+from requests import Request
 
 from .client_public import BitstampPublic
+from ..aio import AsyncClient
 from ..auth import HMACAuth
 from ..base import AuthMixin
 
@@ -29,6 +31,19 @@ class BitstampHMACAuth(HMACAuth):
         super().auth_request(r, nonce)
         r.prepare_body(data=r.body, files=None)
 
+    def prepare_payload(self, request: Request):
+        # Every auth field goes in the body and the signature doesn't depend
+        # on it: sign before encoding
+        nonce = self.new_nonce()
+        signature = self.sign(self.build_message(None, nonce))
+        request.data = {
+            **(request.data or {}),
+            "key": self.api_key,
+            "nonce": nonce,
+            "signature": signature.upper(),
+        }
+        return self._finish(lambda r: None)
+
     def build_message(self, r: P, nonce: str):
         components = [nonce, self.customer_id, self.api_key]
         message = self.signature_delimiter.join(components)
@@ -371,3 +386,7 @@ class BitstampAuth(BitstampPublic, AuthMixin):
         return self._transfer("transfer-from-main", amount, currency, sub_account)
 
     # TODO: Bank methods
+
+
+class BitstampAsyncAuth(AsyncClient, BitstampAuth):
+    pass
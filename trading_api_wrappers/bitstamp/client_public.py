@@ -1,9 +1,11 @@
+from ..aio import AsyncClient
 from ..base import Client
 
 
 class BitstampPublic(Client):
     base_url = "https://www.bitstamp.net/api/"
     error_keys = ["error", "reason"]
+    endpoint_ttl = {"v2/trading-pairs-info/": 3600}
 
     @staticmethod
     def _endpoint_for(endpoint, version=2):
@@ -73,3 +75,7 @@ class BitstampPublic(Client):
         """
         endpoint = self._endpoint_for("eur_usd", version=1)
         return self.get(endpoint)
+
+
+class BitstampAsyncPublic(AsyncClient, BitstampPublic):
+    pass
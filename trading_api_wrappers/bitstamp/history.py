@@ -0,0 +1,30 @@
+from ..history import Feed, Record, utc_timestamp
+
+
+class UserTransactionsFeed(Feed):
+    """`BitstampAuth.user_transactions`, read newest first until `since`.
+
+    Args:
+        currency_pair (str): Pair, all of them by default.
+    """
+
+    name = "bitstamp:user_transactions"
+    limit: int = 1000
+
+    def __init__(self, client, currency_pair: str = None, name: str = None):
+        super().__init__(client, name, currency_pair=currency_pair)
+
+    def fetch(self, since: float = None):
+        offset = 0
+        while True:
+            transactions = self.client.user_transactions(
+                offset=offset or None, limit=self.limit, sort_desc=True, **self.params
+            )
+            for transaction in transactions:
+                timestamp = utc_timestamp(transaction["datetime"])
+                if since is not None and timestamp < since:
+                    return
+                yield Record(transaction["id"], timestamp, transaction)
+            if len(transactions) < self.limit:
+                break
+            offset += len(transactions)
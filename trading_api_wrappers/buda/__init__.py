@@ -1,7 +1,10 @@
 from . import constants as _c
 from . import models as _m
-from .client_auth import BudaAuth
-from .client_public import BudaPublic
+from .candles import CandleDownloader
+from .client_auth import BudaAsyncAuth, BudaAuth
+from .client_public import BudaAsyncPublic, BudaPublic
+from .history import BalanceEventsFeed
+from .quotations import QuotationSimulator
 
 __all__ = [
     "Buda",
@@ -11,6 +14,9 @@ __all__ = [
 class Buda:
     # Models
     models = _m
+    QuotationSimulator = QuotationSimulator
+    CandleDownloader = CandleDownloader
+    BalanceEventsFeed = BalanceEventsFeed
     # Enum Types
     BalanceEvent = _c.BalanceEvent
     Currency = _c.Currency
@@ -23,3 +29,5 @@ class Buda:
     # Clients
     Auth = BudaAuth
     Public = BudaPublic
+    AsyncAuth = BudaAsyncAuth
+    AsyncPublic = BudaAsyncPublic
@@ -0,0 +1,38 @@
+from ..candles import CandleDownloader as _CandleDownloader
+
+
+class CandleDownloader(_CandleDownloader):
+    """Download `BudaPublic.report_candlestick` over any time range.
+
+    Args:
+        client: `Buda.Public` client.
+        market_id (str): Market, ex. "BTC-CLP".
+        window (float): Seconds requested at a time, a week by default.
+    """
+
+    window: float = 7 * 86400
+
+    def __init__(
+        self,
+        client,
+        market_id: str,
+        window: float = None,
+        concurrency: int = None,
+        retries: int = 2,
+    ):
+        super().__init__(client, concurrency, retries)
+        self.market_id: str = str(market_id)
+        if window is not None:
+            self.window = window
+
+    def fetch_window(self, start: float, end: float):
+        data = self.client.report_candlestick(self.market_id, int(start), int(end))
+        reports = data["reports"] if isinstance(data, dict) else data
+        # Datetime, open, high, low, close, volume (models or raw JSON)
+        return [(_seconds(r[0]), r[1], r[2], r[3], r[4], r[5]) for r in reports]
+
+
+def _seconds(timestamp) -> float:
+    timestamp = float(timestamp)
+    # Report timestamps may come in milliseconds
+    return timestamp / 1000 if timestamp > 1e11 else timestamp
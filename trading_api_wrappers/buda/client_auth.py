@@ -5,6 +5,7 @@ from requests import PreparedRequest as P
 from . import constants as _c
 from . import models as _m
 from .client_public import BudaPublic
+from ..aio import AsyncClient
 from ..auth import HMACAuth
 from ..base import AuthMixin
 
@@ -16,6 +17,9 @@ class BudaHMACAuth(HMACAuth):
     signature_header = "X-SBTC-SIGNATURE"
     signature_delimiter = " "
     algorithm = "sha384"
+    # Pages are fetched concurrently, pass `concurrency=1` to the `iter_*`
+    # methods if the server rejects nonces that arrive out of order
+    ordered_nonces = False
 
     def build_message(self, r: P, nonce: str):
         components = [r.method, r.path_url]
@@ -37,9 +41,7 @@ class BudaAuth(BudaPublic, AuthMixin):
     # BALANCES-----------------------------------------------------------------
     def balance(self, currency: str):
         data = self.get(f"balances/{currency}")
-        if self.return_json:
-            return data
-        return _m.Balance.create_from_json(data["balance"])
+        return self._build(data, lambda d: _m.Balance.create_from_json(d["balance"]))
 
     def balance_event_pages(
         self,
@@ -49,7 +51,29 @@ class BudaAuth(BudaPublic, AuthMixin):
         per_page: int = None,
         relevant: bool = None,
     ):
-        data = self.get(
+        data = self._balance_events(currencies, event_names, page, per_page, relevant)
+        # TODO: Response only contains a 'total_count' field instead of meta
+        return self._build(
+            data,
+            lambda d: _m.BalanceEventPages.create_from_json(
+                d["balance_events"],
+                d["total_count"],
+                page,
+                self.lazy_models,
+                per_page,
+            ),
+        )
+
+    def _balance_events(
+        self,
+        currencies: list,
+        event_names: list,
+        page: int = None,
+        per_page: int = None,
+        relevant: bool = None,
+    ):
+        """Page of `balance_event_pages` as JSON, whatever `return_json`."""
+        return self.get(
             "balance_events",
             params={
                 "currencies[]": [str(c) for c in currencies],
@@ -59,19 +83,44 @@ class BudaAuth(BudaPublic, AuthMixin):
                 "relevant": relevant,
             },
         )
-        if self.return_json:
-            return data
-        # TODO: Response only contains a 'total_count' field instead of meta
-        return _m.BalanceEventPages.create_from_json(
-            data["balance_events"], data["total_count"], page
+
+    def iter_balance_events(
+        self,
+        currencies: list,
+        event_names: list,
+        per_page: int = None,
+        relevant: bool = None,
+        concurrency: int = None,
+    ):
+        """Yield the balance events of every page, see `Client._iter_pages`."""
+
+        def total_pages(d):
+            if not isinstance(d, dict):
+                return d.meta.total_pages
+            return _m.balance_event_pages(
+                d["total_count"], per_page, d["balance_events"]
+            )
+
+        return self._iter_pages(
+            lambda page: self.balance_event_pages(
+                currencies, event_names, page, per_page, relevant
+            ),
+            lambda d: d["balance_events"] if isinstance(d, dict) else d.balance_events,
+            total_pages,
+            concurrency,
         )
 
+    @staticmethod
+    def _total_pages(data) -> int:
+        meta = data.get("meta") if isinstance(data, dict) else data.meta
+        if not meta:
+            return 1
+        return meta["total_pages"] if isinstance(meta, dict) else meta.total_pages
+
     # ORDERS ------------------------------------------------------------------
     def new_order_payload(self, market_id: str, payload):
         data = self.post(f"markets/{market_id}/orders", json=payload)
-        if self.return_json:
-            return data
-        return _m.Order.create_from_json(data["order"])
+        return self._build(data, lambda d: _m.Order.create_from_json(d["order"]))
 
     def new_order(
         self,
@@ -111,9 +160,30 @@ class BudaAuth(BudaPublic, AuthMixin):
                 "minimum_exchanged": minimum_exchanged,
             },
         )
-        if self.return_json:
-            return data
-        return _m.OrderPages.create_from_json(data["orders"], data.get("meta"))
+        return self._build(
+            data,
+            lambda d: _m.OrderPages.create_from_json(
+                d["orders"], d.get("meta"), self.lazy_models
+            ),
+        )
+
+    def iter_orders(
+        self,
+        market_id: str,
+        per_page: int = None,
+        state: str = None,
+        minimum_exchanged: float = None,
+        concurrency: int = None,
+    ):
+        """Yield the orders of every page, see `Client._iter_pages`."""
+        return self._iter_pages(
+            lambda page: self.order_pages(
+                market_id, page, per_page, state, minimum_exchanged
+            ),
+            lambda d: d["orders"] if isinstance(d, dict) else d.orders,
+            self._total_pages,
+            concurrency,
+        )
 
     def batch_orders(self, cancel_list: list = None, place_list: list = None):
         diff = {"diff": []}
@@ -128,9 +198,7 @@ class BudaAuth(BudaPublic, AuthMixin):
 
     def order_details(self, order_id: int):
         data = self.get(f"orders/{order_id}")
-        if self.return_json:
-            return data
-        return _m.Order.create_from_json(data["order"])
+        return self._build(data, lambda d: _m.Order.create_from_json(d["order"]))
 
     def cancel_order(self, order_id: int):
         data = self.put(
@@ -139,9 +207,7 @@ class BudaAuth(BudaPublic, AuthMixin):
                 "state": _c.OrderState.CANCELING.value,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Order.create_from_json(data["order"])
+        return self._build(data, lambda d: _m.Order.create_from_json(d["order"]))
 
     # PAYMENTS ----------------------------------------------------------------
     def _transfers(
@@ -164,9 +230,10 @@ class BudaAuth(BudaPublic, AuthMixin):
                 "state": str(state) if state else None,
             },
         )
-        if self.return_json:
-            return data
-        return model.create_from_json(data[key], data.get("meta"))
+        return self._build(
+            data,
+            lambda d: model.create_from_json(d[key], d.get("meta"), self.lazy_models),
+        )
 
     def withdrawal_pages(self, currency: str, page: int = None, per_page: int = None):
         return self._transfers(
@@ -179,9 +246,20 @@ class BudaAuth(BudaPublic, AuthMixin):
 
     def withdrawals(self, currency: str, page: int = None, per_page: int = None):
         data = self.withdrawal_pages(currency, page, per_page)
-        if isinstance(data, dict):
-            return data["withdrawals"]
-        return data.withdrawals
+        return self._then(
+            data, lambda d: d["withdrawals"] if isinstance(d, dict) else d.withdrawals
+        )
+
+    def iter_withdrawals(
+        self, currency: str, per_page: int = None, concurrency: int = None
+    ):
+        """Yield the withdrawals of every page, see `Client._iter_pages`."""
+        return self._iter_pages(
+            lambda page: self.withdrawal_pages(currency, page, per_page),
+            lambda d: d["withdrawals"] if isinstance(d, dict) else d.withdrawals,
+            self._total_pages,
+            concurrency,
+        )
 
     def deposit_pages(self, currency: str, page: int = None, per_page: int = None):
         return self._transfers(
@@ -194,9 +272,20 @@ class BudaAuth(BudaPublic, AuthMixin):
 
     def deposits(self, currency: str, page: int = None, per_page: int = None):
         data = self.deposit_pages(currency, page, per_page)
-        if isinstance(data, dict):
-            return data["deposits"]
-        return data.deposits
+        return self._then(
+            data, lambda d: d["deposits"] if isinstance(d, dict) else d.deposits
+        )
+
+    def iter_deposits(
+        self, currency: str, per_page: int = None, concurrency: int = None
+    ):
+        """Yield the deposits of every page, see `Client._iter_pages`."""
+        return self._iter_pages(
+            lambda page: self.deposit_pages(currency, page, per_page),
+            lambda d: d["deposits"] if isinstance(d, dict) else d.deposits,
+            self._total_pages,
+            concurrency,
+        )
 
     def withdrawal(
         self,
@@ -218,9 +307,9 @@ class BudaAuth(BudaPublic, AuthMixin):
                 "amount_includes_fee": amount_includes_fee,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Withdrawal.create_from_json(data["withdrawal"])
+        return self._build(
+            data, lambda d: _m.Withdrawal.create_from_json(d["withdrawal"])
+        )
 
     def simulate_withdrawal(
         self, currency: str, amount: float, amount_includes_fee: bool = True
@@ -232,3 +321,7 @@ class BudaAuth(BudaPublic, AuthMixin):
             amount_includes_fee=amount_includes_fee,
             simulate=True,
         )
+
+
+class BudaAsyncAuth(AsyncClient, BudaAuth):
+    pass
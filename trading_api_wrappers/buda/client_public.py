@@ -2,38 +2,53 @@ from datetime import datetime
 
 from . import constants as _c
 from . import models as _m
+from ..aio import AsyncClient
 from ..base import Client, ModelMixin
+from ..columnar import ColumnarOrderBook
 
 
 class BudaPublic(Client, ModelMixin):
     base_url = "https://www.buda.com/api/v2/"
     error_keys = ["message"]
+    endpoint_ttl = {"markets": 3600}
 
     def markets(self):
         data = self.get("markets")
-        if self.return_json:
-            return data
-        return [_m.Market.create_from_json(market) for market in data["markets"]]
+        return self._build(
+            data, lambda d: [_m.Market.create_from_json(m) for m in d["markets"]]
+        )
 
     def market_details(self, market_id: str):
         data = self.get(f"markets/{market_id}")
-        if self.return_json:
-            return data
-        return _m.Market.create_from_json(data["market"])
+        return self._build(data, lambda d: _m.Market.create_from_json(d["market"]))
 
     def ticker(self, market_id: str):
         data = self.get(f"markets/{market_id}/ticker")
-        if self.return_json:
-            return data
-        return _m.Ticker.create_from_json(data["ticker"])
+        return self._build(data, lambda d: _m.Ticker.create_from_json(d["ticker"]))
 
-    def order_book(self, market_id: str):
+    def order_book(self, market_id: str, columnar: bool = False):
+        """Columnar books (`columnar=True`) are built straight from the JSON."""
         data = self.get(f"markets/{market_id}/order_book")
-        if self.return_json:
-            return data
-        return _m.OrderBook.create_from_json(data["order_book"])
+        if columnar:
+            return self._then(
+                data, lambda d: ColumnarOrderBook.create_from_json(d["order_book"])
+            )
+        return self._build(
+            data,
+            lambda d: _m.OrderBook.create_from_json(d["order_book"], self.lazy_models),
+        )
+
+    def trades(
+        self,
+        market_id: str,
+        timestamp: int = None,
+        limit: int = None,
+        columnar: bool = False,
+    ):
+        """Columnar entries (`columnar=True`) are a NumPy structured array.
 
-    def trades(self, market_id: str, timestamp: int = None, limit: int = None):
+        Still a `Trades` model, so `return_json` and `keep_json` apply.
+        """
         data = self.get(
             f"markets/{market_id}/trades",
             params={
@@ -41,9 +56,13 @@ class BudaPublic(Client, ModelMixin):
                 "limit": limit,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Trades.create_from_json(data["trades"])
+        if columnar:
+            return self._build(
+                data, lambda d: _m.Trades.create_from_json(d["trades"], columnar=True)
+            )
+        return self._build(
+            data, lambda d: _m.Trades.create_from_json(d["trades"], self.lazy_models)
+        )
 
     def quotation(
         self, market_id: str, quotation_type: str, amount: float, limit: float = None
@@ -58,9 +77,9 @@ class BudaPublic(Client, ModelMixin):
                 },
             },
         )
-        if self.return_json:
-            return data
-        return _m.Quotation.create_from_json(data["quotation"])
+        return self._build(
+            data, lambda d: _m.Quotation.create_from_json(d["quotation"])
+        )
 
     def quotation_market(self, market_id: str, quotation_type: str, amount: float):
         return self.quotation(market_id, quotation_type, amount, limit=None)
@@ -95,14 +114,18 @@ class BudaPublic(Client, ModelMixin):
         self, market_id: str, start_at: datetime = None, end_at: datetime = None
     ):
         data = self._report(market_id, _c.ReportType.AVERAGE_PRICES, start_at, end_at)
-        if self.return_json:
-            return data
-        return [_m.AveragePrice.create_from_json(report) for report in data["reports"]]
+        return self._build(
+            data, lambda d: [_m.AveragePrice.create_from_json(r) for r in d["reports"]]
+        )
 
     def report_candlestick(
         self, market_id: str, start_at: datetime = None, end_at: datetime = None
     ):
         data = self._report(market_id, _c.ReportType.CANDLESTICK, start_at, end_at)
-        if self.return_json:
-            return data
-        return [_m.Candlestick.create_from_json(report) for report in data["reports"]]
+        return self._build(
+            data, lambda d: [_m.Candlestick.create_from_json(r) for r in d["reports"]]
+        )
+
+
+class BudaAsyncPublic(AsyncClient, BudaPublic):
+    pass
@@ -0,0 +1,54 @@
+from .models import balance_event_pages
+from ..history import Feed, Record, utc_timestamp
+
+
+class BalanceEventsFeed(Feed):
+    """`BudaAuth.balance_event_pages`, read newest first until `since`.
+
+    Args:
+        currencies (list): Currencies of the events.
+        event_names (list): Event names, ex. "deposit_confirm".
+        relevant (bool): Only relevant events.
+    """
+
+    name = "buda:balance_events"
+
+    def __init__(
+        self,
+        client,
+        currencies: list,
+        event_names: list,
+        relevant: bool = None,
+        name: str = None,
+    ):
+        super().__init__(
+            client,
+            name,
+            currencies=",".join(sorted(str(c) for c in currencies)),
+            event_names=",".join(sorted(str(e) for e in event_names)),
+            relevant=relevant,
+        )
+        self.currencies = [str(c) for c in currencies]
+        self.event_names = [str(e) for e in event_names]
+        self.relevant = relevant
+
+    def fetch(self, since: float = None):
+        # Raw events, the client may build models without their payload
+        events = self.client._iter_pages(
+            lambda page: self.client._balance_events(
+                self.currencies, self.event_names, page, relevant=self.relevant
+            ),
+            lambda d: d["balance_events"],
+            lambda d: balance_event_pages(d["total_count"], None, d["balance_events"]),
+            # Incremental syncs stop early, don't fetch pages ahead
+            concurrency=1 if since is not None else None,
+        )
+        try:
+            for event in events:
+                timestamp = utc_timestamp(event["created_at"])
+                if since is not None and timestamp < since:
+                    break
+                yield Record(event["id"], timestamp, event)
+        finally:
+            # Don't fetch the older pages left
+            events.close()
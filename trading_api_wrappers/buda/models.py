@@ -1,11 +1,10 @@
 import math
 from collections import namedtuple
-from datetime import datetime
 
-
-def parse_datetime(datetime_str):
-    if datetime_str:
-        return datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S.%fZ")
+from ..columnar import structured_array
+from ..common import parse_datetime
+from ..lazy import build_list
+from ..schema import PAYLOAD, Field, payload, schema
 
 
 def int_or_none(value):
@@ -18,6 +17,11 @@ def float_or_none(value):
         return float(value)
 
 
+@schema(
+    Field("amount", 0, float),
+    Field("currency", 1),
+    optional=True,
+)
 class Amount(
     namedtuple(
         "amount",
@@ -27,14 +31,7 @@ class Amount(
         ],
     )
 ):
-    @classmethod
-    def create_from_json(cls, amount):
-        if amount:
-            amount = cls(
-                amount=float(amount[0]),
-                currency=amount[1],
-            )
-        return amount
+    pass
 
 
 class PagesMeta(
@@ -81,7 +78,7 @@ class Market(
             minimum_order_amount=Amount.create_from_json(
                 market["minimum_order_amount"]
             ),
-            json=market,
+            json=payload(market),
         )
 
 
@@ -108,7 +105,7 @@ class Ticker(
             volume=Amount.create_from_json(ticker["volume"]),
             price_variation_24h=float_or_none(ticker["price_variation_24h"]),
             price_variation_7d=float_or_none(ticker["price_variation_7d"]),
-            json=ticker,
+            json=payload(ticker),
         )
 
 
@@ -147,7 +144,7 @@ class Quotation(
             ),
             quote_exchanged=Amount.create_from_json(quotation["quote_exchanged"]),
             type=quotation["type"],
-            json=quotation,
+            json=payload(quotation),
         )
 
 
@@ -179,15 +176,11 @@ class OrderBook(
     )
 ):
     @classmethod
-    def create_from_json(cls, order_book):
+    def create_from_json(cls, order_book, lazy: bool = False):
         return cls(
-            asks=[
-                OrderBookEntry.create_from_json(entry) for entry in order_book["asks"]
-            ],
-            bids=[
-                OrderBookEntry.create_from_json(entry) for entry in order_book["bids"]
-            ],
-            json=order_book,
+            asks=build_list(order_book["asks"], OrderBookEntry.create_from_json, lazy),
+            bids=build_list(order_book["bids"], OrderBookEntry.create_from_json, lazy),
+            json=payload(order_book),
         )
 
 
@@ -231,10 +224,27 @@ class Balance(
             pending_withdraw_amount=Amount.create_from_json(
                 balance["pending_withdraw_amount"]
             ),
-            json=balance,
+            json=payload(balance),
         )
 
 
+@schema(
+    Field("id"),
+    Field("account_id"),
+    Field("amount", convert=Amount.create_from_json),
+    Field("created_at", convert=parse_datetime),
+    Field("fee_currency"),
+    Field("limit", convert=Amount.create_from_json),
+    Field("market_id"),
+    Field("original_amount", convert=Amount.create_from_json),
+    Field("paid_fee", convert=Amount.create_from_json),
+    Field("price_type"),
+    Field("state"),
+    Field("total_exchanged", convert=Amount.create_from_json),
+    Field("traded_amount", convert=Amount.create_from_json),
+    Field("type"),
+    Field("json", PAYLOAD),
+)
 class Order(
     namedtuple(
         "order",
@@ -257,25 +267,7 @@ class Order(
         ],
     )
 ):
-    @classmethod
-    def create_from_json(cls, order):
-        return cls(
-            id=order["id"],
-            account_id=order["account_id"],
-            amount=Amount.create_from_json(order["amount"]),
-            created_at=parse_datetime(order["created_at"]),
-            fee_currency=order["fee_currency"],
-            limit=Amount.create_from_json(order["limit"]),
-            market_id=order["market_id"],
-            original_amount=Amount.create_from_json(order["original_amount"]),
-            paid_fee=Amount.create_from_json(order["paid_fee"]),
-            price_type=order["price_type"],
-            state=order["state"],
-            total_exchanged=Amount.create_from_json(order["total_exchanged"]),
-            traded_amount=Amount.create_from_json(order["traded_amount"]),
-            type=order["type"],
-            json=order,
-        )
+    pass
 
 
 class OrderPages(
@@ -288,13 +280,34 @@ class OrderPages(
     )
 ):
     @classmethod
-    def create_from_json(cls, orders, pages_meta):
+    def create_from_json(cls, orders, pages_meta, lazy: bool = False):
         return cls(
-            orders=[Order.create_from_json(order) for order in orders],
+            orders=build_list(orders, Order.create_from_json, lazy),
             meta=PagesMeta.create_from_json(pages_meta),
         )
 
 
+@schema(
+    Field("id"),
+    Field("account_id"),
+    Field("created_at", convert=parse_datetime),
+    Field("currency"),
+    Field("event"),
+    Field("event_ids"),
+    Field("new_amount"),
+    Field("new_available_amount"),
+    Field("new_frozen_amount"),
+    Field("new_frozen_for_fee"),
+    Field("new_pending_withdraw_amount"),
+    Field("old_amount"),
+    Field("old_available_amount"),
+    Field("old_frozen_amount"),
+    Field("old_frozen_for_fee"),
+    Field("old_pending_withdraw_amount"),
+    Field("transaction_type"),
+    Field("transfer_description"),
+    Field("json", PAYLOAD),
+)
 class BalanceEvent(
     namedtuple(
         "balance_event",
@@ -321,29 +334,14 @@ class BalanceEvent(
         ],
     )
 ):
-    @classmethod
-    def create_from_json(cls, event):
-        return cls(
-            id=event["id"],
-            account_id=event["account_id"],
-            created_at=parse_datetime(event["created_at"]),
-            currency=event["currency"],
-            event=event["event"],
-            event_ids=event["event_ids"],
-            new_amount=event["new_amount"],
-            new_available_amount=event["new_available_amount"],
-            new_frozen_amount=event["new_frozen_amount"],
-            new_frozen_for_fee=event["new_frozen_for_fee"],
-            new_pending_withdraw_amount=event["new_pending_withdraw_amount"],
-            old_amount=event["old_amount"],
-            old_available_amount=event["old_available_amount"],
-            old_frozen_amount=event["old_frozen_amount"],
-            old_frozen_for_fee=event["old_frozen_for_fee"],
-            old_pending_withdraw_amount=event["old_pending_withdraw_amount"],
-            transaction_type=event["transaction_type"],
-            transfer_description=event["transfer_description"],
-            json=event,
-        )
+    pass
+
+
+def balance_event_pages(total_count: int, per_page: int, events: list) -> int:
+    """Pages of balance events, which only come with a total count. Without
+    `per_page` the size of the page at hand is assumed."""
+    per_page = per_page or len(events)
+    return math.ceil(total_count / per_page) if per_page else 1
 
 
 class BalanceEventPages(
@@ -356,13 +354,15 @@ class BalanceEventPages(
     )
 ):
     @classmethod
-    def create_from_json(cls, events, total_count, page):
+    def create_from_json(
+        cls, events, total_count, page, lazy: bool = False, per_page: int = None
+    ):
         return cls(
-            balance_events=[BalanceEvent.create_from_json(event) for event in events],
+            balance_events=build_list(events, BalanceEvent.create_from_json, lazy),
             meta=PagesMeta(
                 current_page=page or 1,
                 total_count=total_count,
-                total_pages=math.ceil(total_count / len(events)),
+                total_pages=balance_event_pages(total_count, per_page, events),
             ),
         )
 
@@ -400,7 +400,7 @@ class TradeTransaction(
             ask_order=Order.create_from_json(transaction["ask"]),
             bid_order=Order.create_from_json(transaction["bid"]),
             triggering_order=Order.create_from_json(transaction["triggering_order"]),
-            json=transaction,
+            json=payload(transaction),
         )
 
 
@@ -414,16 +414,21 @@ class TradeTransactionPages(
     )
 ):
     @classmethod
-    def create_from_json(cls, transactions, pages_meta):
+    def create_from_json(cls, transactions, pages_meta, lazy: bool = False):
         return cls(
-            trade_transactions=[
-                TradeTransaction.create_from_json(transaction)
-                for transaction in transactions
-            ],
+            trade_transactions=build_list(
+                transactions, TradeTransaction.create_from_json, lazy
+            ),
             meta=PagesMeta.create_from_json(pages_meta),
         )
 
 
+@schema(
+    Field("timestamp", 0, int, dtype="i8"),
+    Field("amount", 1, float, dtype="f8"),
+    Field("price", 2, float, dtype="f8"),
+    Field("direction", 3, dtype="U4"),
+)
 class TradeEntry(
     namedtuple(
         "trade_transaction_pages",
@@ -435,14 +440,7 @@ class TradeEntry(
         ],
     )
 ):
-    @classmethod
-    def create_from_json(cls, entry):
-        return cls(
-            timestamp=int(entry[0]),
-            amount=float(entry[1]),
-            price=float(entry[2]),
-            direction=entry[3],
-        )
+    pass
 
 
 class Trades(
@@ -457,12 +455,18 @@ class Trades(
     )
 ):
     @classmethod
-    def create_from_json(cls, trades):
+    def create_from_json(cls, trades, lazy: bool = False, columnar: bool = False):
+        """With `columnar`, entries are a NumPy structured array with the
+        `TradeEntry` fields."""
+        if columnar:
+            entries = structured_array(trades["entries"], TradeEntry.schema)
+        else:
+            entries = build_list(trades["entries"], TradeEntry.create_from_json, lazy)
         return cls(
             timestamp=int_or_none(trades["timestamp"]),
             last_timestamp=int_or_none(trades["last_timestamp"]),
-            entries=[TradeEntry.create_from_json(entry) for entry in trades["entries"]],
-            json=trades,
+            entries=entries,
+            json=payload(trades),
         )
 
 
@@ -516,7 +520,7 @@ class Transfer(
             currency=transfer["currency"],
             state=transfer["state"],
             data=TransferData.create_from_json(transfer[cls.data_key], cls.address_key),
-            json=transfer,
+            json=payload(transfer),
         )
 
 
@@ -540,11 +544,9 @@ class WithdrawalPages(
     )
 ):
     @classmethod
-    def create_from_json(cls, withdrawals, pages_meta):
+    def create_from_json(cls, withdrawals, pages_meta, lazy: bool = False):
         return cls(
-            withdrawals=[
-                Withdrawal.create_from_json(withdrawal) for withdrawal in withdrawals
-            ],
+            withdrawals=build_list(withdrawals, Withdrawal.create_from_json, lazy),
             meta=PagesMeta.create_from_json(pages_meta),
         )
 
@@ -559,9 +561,9 @@ class DepositPages(
     )
 ):
     @classmethod
-    def create_from_json(cls, deposits, pages_meta):
+    def create_from_json(cls, deposits, pages_meta, lazy: bool = False):
         return cls(
-            deposits=[Deposit.create_from_json(deposit) for deposit in deposits],
+            deposits=build_list(deposits, Deposit.create_from_json, lazy),
             meta=PagesMeta.create_from_json(pages_meta),
         )
 
@@ -582,7 +584,7 @@ class AveragePrice(
         return cls(
             datetime=report[0],
             amount=report[1],
-            json=report,
+            json=payload(report),
         )
 
 
@@ -610,5 +612,5 @@ class Candlestick(
             low=report[3],
             close=report[4],
             volume=report[5],
-            json=report,
+            json=payload(report),
         )
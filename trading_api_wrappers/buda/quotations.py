@@ -0,0 +1,93 @@
+from itertools import takewhile
+from typing import Iterable, List
+
+from . import constants as _c
+from . import models as _m
+from ..fills import BookFills, Fill, iter_levels
+
+
+class QuotationSimulator:
+    """Compute `BudaPublic.quotation` locally from a fresh order book.
+
+    Fills walk the asks (bid quotations) or the bids (ask quotations), up to
+    `limit` if given, and the taker fee is charged on the currency received,
+    as the server does.
+
+    Args:
+        order_book: `OrderBook` model (or `ColumnarOrderBook`) of the market.
+        market_id (str): Market of the book, ex. "BTC-CLP".
+        fee (float): Taker fee rate, ex. 0.008 for 0.8%.
+    """
+
+    def __init__(self, order_book, market_id: str, fee: float):
+        self.base, self.quote = str(market_id).upper().split("-")
+        self.fee: float = fee
+        self.asks = BookFills(order_book.asks)
+        self.bids = BookFills(order_book.bids)
+        self._levels = {"bid": order_book.asks, "ask": order_book.bids}
+
+    def quotation(
+        self, quotation_type: str, amount: float, limit: float = None
+    ) -> _m.Quotation:
+        return self.quotations(quotation_type, [amount], limit)[0]
+
+    def quotations(
+        self, quotation_type: str, amounts: Iterable[float], limit: float = None
+    ) -> List[_m.Quotation]:
+        """Quotations of the same type for many amounts at once."""
+        quotation_type = str(_c.QuotationType.check(quotation_type))
+        side = quotation_type.split("_", 1)[0]
+        fills = self._fills(side, limit)
+        return [
+            self._quotation(quotation_type, side, fills, amount, limit)
+            for amount in amounts
+        ]
+
+    def _fills(self, side: str, limit: float = None) -> BookFills:
+        if limit is None:
+            return self.asks if side == "bid" else self.bids
+        levels = iter_levels(self._levels[side])
+        if side == "bid":
+            return BookFills(takewhile(lambda lv: float(lv[0]) <= limit, levels))
+        return BookFills(takewhile(lambda lv: float(lv[0]) >= limit, levels))
+
+    def _quotation(self, quotation_type, side, fills, amount, limit):
+        amount = float(amount)
+        if quotation_type == _c.QuotationType.BID_GIVEN_SPENT_QUOTE.value:
+            fill = fills.fill_quote(amount)
+            order_amount = fill.base
+        elif quotation_type == _c.QuotationType.ASK_GIVEN_EARNED_QUOTE.value:
+            fill = fills.fill_quote(amount / (1 - self.fee))
+            order_amount = fill.base
+        elif quotation_type == _c.QuotationType.BID_GIVEN_EARNED_BASE.value:
+            order_amount = amount / (1 - self.fee)
+            fill = fills.fill_base(order_amount)
+        else:
+            order_amount = amount
+            fill = fills.fill_base(order_amount)
+        return _m.Quotation.create_from_json(
+            self._json(quotation_type, side, fill, amount, order_amount, limit)
+        )
+
+    def _json(self, quotation_type, side, fill: Fill, amount, order_amount, limit):
+        """Quotation in the server JSON format"""
+        base, quote = self.base, self.quote
+        if side == "bid":
+            fee = [str(fill.base * self.fee), base]
+            base_change, quote_change = fill.base * (1 - self.fee), -fill.quote
+        else:
+            fee = [str(fill.quote * self.fee), quote]
+            base_change, quote_change = -fill.base, fill.quote * (1 - self.fee)
+        currency = quote if "quote" in quotation_type else base
+        return {
+            "amount": [str(amount), currency],
+            "base_balance_change": [str(base_change), base],
+            "base_exchanged": [str(fill.base), base],
+            "fee": fee,
+            "incomplete": fill.incomplete,
+            "limit": [str(float(limit)), quote] if limit is not None else None,
+            "order_amount": [str(order_amount), base],
+            "quote_balance_change": [str(quote_change), quote],
+            "quote_exchanged": [str(fill.quote), quote],
+            "type": quotation_type,
+        }
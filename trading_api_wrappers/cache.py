@@ -0,0 +1,146 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import closing
+from typing import Any, Hashable, Tuple
+
+CacheInfo = namedtuple("cache_info", ["hits", "misses", "size", "maxsize"])
+
+
+class Cache:
+    """Decoded responses cache, with a TTL per entry and LRU eviction.
+
+    Cached values are shared between callers, don't mutate them.
+    """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value), counting the hit or miss."""
+        found, value = self._get(key, self.clock())
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found, value
+
+    def set(self, key: Hashable, value, ttl: float):
+        self._set(key, value, self.clock() + ttl)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, len(self), self.maxsize)
+
+    def _get(self, key, now: float) -> Tuple[bool, Any]:
+        raise NotImplementedError
+
+    def _set(self, key, value, expires: float):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+
+class MemoryCache(Cache):
+    """In-process cache, shared by every thread using it."""
+
+    def __init__(self, maxsize: int = 256):
+        super().__init__(maxsize)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key, now):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires, value = entry
+            if expires <= now:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def _set(self, key, value, expires):
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache(Cache):
+    """SQLite backed cache, survives restarts and is shared across processes.
+
+    Values are stored as JSON.
+
+    Args:
+        path (str): Database file.
+        maxsize (int): Max number of entries.
+    """
+
+    def __init__(self, path: str, maxsize: int = 1024):
+        super().__init__(maxsize)
+        self.path: str = path
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT, expires REAL, used REAL)"
+            )
+
+    def _connect(self):
+        # One connection per operation, safe across threads and forks
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    @staticmethod
+    def _dumps_key(key) -> str:
+        return json.dumps(key, sort_keys=True, default=str)
+
+    def _get(self, key, now):
+        key = self._dumps_key(key)
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return False, None
+            db.execute("UPDATE cache SET used = ? WHERE key = ?", (now, key))
+        return True, json.loads(row[0])
+
+    def _set(self, key, value, expires):
+        now = self.clock()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (self._dumps_key(key), json.dumps(value), expires, now),
+            )
+            db.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+            db.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM cache")
+
+    def __len__(self):
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Tuple, Union
+
+from .columnar import Candles
+from .errors import RequestException
+
+Time = Union[datetime, float]
+
+
+def to_seconds(value: Time) -> float:
+    """Epoch seconds of a datetime or of a timestamp in seconds."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class CandleDownloader:
+    """Download a long range of candles as `Candles` columns.
+
+    The [start, end) range is split into windows of at most `window`
+    seconds, one request each, fetched `concurrency` at a time. Every request
+    still goes through the client rate limiter and retry policy, and windows
+    that fail anyway are fetched again, up to `retries` more rounds, once the
+    rest are done. Candles are stitched in time order, one per timestamp.
+
+    Args:
+        client: Public (sync) client of the exchange.
+        concurrency (int): Windows in flight, default `page_concurrency`.
+        retries (int): Rounds of retries of the failed windows.
+    """
+
+    window: float = 0  # in seconds
+
+    def __init__(self, client, concurrency: int = None, retries: int = 2):
+        self.client = client
+        self.concurrency: int = concurrency or client.page_concurrency
+        self.retries: int = retries
+
+    def download(self, start: Time, end: Time) -> Candles:
+        start, end = to_seconds(start), to_seconds(end)
+        rows = self.fetch_windows(self.windows(start, end))
+        return Candles.create_from_rows(rows).between(start, end)
+
+    def windows(self, start: float, end: float) -> List[Tuple[float, float]]:
+        """Split [start, end) in consecutive windows of `window` seconds."""
+        bounds = []
+        while start < end:
+            bounds.append((start, min(start + self.window, end)))
+            start += self.window
+        return bounds
+
+    def fetch_windows(self, windows: List[Tuple[float, float]]) -> List:
+        rows, pending = [], list(windows)
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            for _ in range(self.retries + 1):
+                futures = [
+                    (window, executor.submit(self.fetch_window, *window))
+                    for window in pending
+                ]
+                pending, error = [], None
+                for window, future in futures:
+                    try:
+                        rows.extend(future.result())
+                    except RequestException as e:
+                        pending.append(window)
+                        error = e
+                if not pending:
+                    return rows
+        raise error
+
+    def fetch_window(self, start: float, end: float) -> List:
+        """Candles of a window, as `(timestamp, open, high, low, close,
+        volume)` rows with timestamps in seconds."""
+        raise NotImplementedError
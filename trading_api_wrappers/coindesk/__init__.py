@@ -1,5 +1,6 @@
-from .client import CoinDesk
+from .client import CoinDesk, CoinDeskAsync
 
 __all__ = [
     "CoinDesk",
+    "CoinDeskAsync",
 ]
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 
+from ..aio import AsyncClient
 from ..base import Client
 from ..common import current_utc_date, date_range
 
@@ -7,6 +8,7 @@ from ..common import current_utc_date, date_range
 class CoinDesk(Client):
     base_url = "http://api.coindesk.com/v1/"
     timeout = 15
+    conditional_endpoints = ["bpi/historical/*"]
 
     def bpi(self, currency: str):
         return _BPI(self, currency)
@@ -19,6 +21,8 @@ class _BPI(CoinDesk):
     def __init__(self, parent, currency: str):
         super().__init__(timeout=parent.timeout)
         self.currency = currency.upper()
+        # Revalidate with the responses seen by the parent client
+        self.validators = parent.validators
 
     def current(self):
         return self.get(f"bpi/currentprice/{self.currency}.json")
@@ -38,9 +42,13 @@ class _BPI(CoinDesk):
         self._validate_historical_date(end)
         # If start date is today, return only current BPI
         if start == today:
-            current = self.bpi(self.currency).current()
-            current["bpi"] = {str(today): current["bpi"][self.currency]["rate_float"]}
-            return current
+
+            def only_today(current):
+                rate = current["bpi"][self.currency]["rate_float"]
+                current["bpi"] = {str(today): rate}
+                return current
+
+            return self._then(self.bpi(self.currency).current(), only_today)
         # Normal call for historical BPI
         response = self.get(
             "bpi/historical/close.json",
@@ -50,15 +58,26 @@ class _BPI(CoinDesk):
                 "end": end,
             },
         )
-        # If end date is today, add current BPI
-        if end == today and include_today:
-            response["bpi"][str(today)] = self.rate(self.currency).current()
-        # Validate response
-        historical_bpi = response["bpi"]
-        for d in date_range(start, end):
-            assert historical_bpi[str(d)], f"{d} is not present in BPI!"
 
-        return response
+        def validate(response):
+            historical_bpi = response["bpi"]
+            for d in date_range(start, end):
+                assert historical_bpi[str(d)], f"{d} is not present in BPI!"
+            return response
+
+        def add_today(response):
+            # If end date is today, add current BPI
+            if end == today and include_today:
+
+                def add_rate(rate):
+                    # Copy, the response may be reused on the next request
+                    bpi = {**response["bpi"], str(today): rate}
+                    return validate({**response, "bpi": bpi})
+
+                return self._then(self.rate(self.currency).current(), add_rate)
+            return validate(response)
+
+        return self._then(response, add_today)
 
     @staticmethod
     def _validate_historical_date(date):
@@ -73,26 +92,24 @@ class _Rate(CoinDesk):
     def __init__(self, parent, currency: str):
         super().__init__(timeout=parent.timeout)
         self.currency = currency.upper()
+        self.validators = parent.validators
         self._bpi = self.bpi(self.currency)
 
     def current(self):
         response = self._bpi.current()
-        rate = response["bpi"][self.currency]["rate_float"]
-        return rate
+        return self._then(response, lambda r: r["bpi"][self.currency]["rate_float"])
 
     def historical(
         self, start: datetime, end: datetime = None, include_today: bool = False
     ):
         response = self._bpi.historical(start, end, include_today)
-        rate_dict = response["bpi"]
-        return rate_dict
+        return self._then(response, lambda r: r["bpi"])
 
     def for_date(self, date_for: datetime):
         if isinstance(date_for, datetime):
             date_for = date_for.date()
         rate_dict = self.historical(start=date_for, end=date_for)
-        rate = rate_dict[str(date_for)]
-        return rate
+        return self._then(rate_dict, lambda r: r[str(date_for)])
 
     def since_date(self, date_since: datetime, include_today: bool = False):
         if isinstance(date_since, datetime):
@@ -104,3 +121,19 @@ class _Rate(CoinDesk):
         start = current_utc_date() - timedelta(days=n_days)
         rate_dict = self.historical(start, None, include_today)
         return rate_dict
+
+
+class CoinDeskAsync(AsyncClient, CoinDesk):
+    def bpi(self, currency: str):
+        return _AsyncBPI(self, currency)
+
+    def rate(self, currency: str):
+        return _AsyncRate(self, currency)
+
+
+class _AsyncBPI(CoinDeskAsync, _BPI):
+    pass
+
+
+class _AsyncRate(CoinDeskAsync, _Rate):
+    pass
@@ -1,5 +1,6 @@
-from .client import CoinMarketCap
+from .client import CoinMarketCap, CoinMarketCapAsync
 
 __all__ = [
     "CoinMarketCap",
+    "CoinMarketCapAsync",
 ]
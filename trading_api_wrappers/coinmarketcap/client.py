@@ -1,3 +1,4 @@
+from ..aio import AsyncClient
 from ..base import Client
 
 
@@ -20,15 +21,31 @@ class CoinMarketCap(Client):
         }
         if currency:
             if len(currency) == 3:
-                currency = self._get_symbol(currency)["value"]
-            data = self.get(f"ticker/{currency}/", params=params)[0]
-        else:
-            data = self.get("ticker/", params=params)
-        return data
+                symbol = self._get_symbol(currency)
+                return self._then(
+                    symbol, lambda s: self._currency_ticker(s["value"], params)
+                )
+            return self._currency_ticker(currency, params)
+        return self.get("ticker/", params=params)
+
+    def iter_ticker(self, convert: str = None, start: int = None, limit: int = None):
+        """Same as `ticker()`, but yield each currency while the list downloads."""
+        params = {
+            "start": start,
+            "limit": limit,
+            "convert": convert,
+        }
+        return self._stream("GET", "ticker/", params=params)
+
+    def _currency_ticker(self, currency: str, params: dict):
+        data = self.get(f"ticker/{currency}/", params=params)
+        return self._then(data, lambda d: d[0])
 
     def price(self, currency: str, convert: str = None):
         ticker = self.ticker(currency, convert)
-        return float(ticker[f"price_{convert or 'usd'}".lower()])
+        return self._then(
+            ticker, lambda t: float(t[f"price_{convert or 'usd'}".lower()])
+        )
 
     def stats(self, convert: str = None):
         data = self.get("global/", params={"convert": convert})
@@ -36,12 +53,24 @@ class CoinMarketCap(Client):
 
     def _get_currencies(self):
         ticker = self.ticker()
-        return {
-            currency["symbol"]: dict(value=currency["id"], decimals=8)
-            for currency in ticker
-        }
+        return self._then(
+            ticker,
+            lambda t: {
+                currency["symbol"]: dict(value=currency["id"], decimals=8)
+                for currency in t
+            },
+        )
 
     def _get_symbol(self, currency: str):
         if self.currencies is None:
-            self.currencies = self._get_currencies()
+
+            def store(currencies):
+                self.currencies = currencies
+                return currencies[currency.upper()]
+
+            return self._then(self._get_currencies(), store)
         return self.currencies[currency.upper()]
+
+
+class CoinMarketCapAsync(AsyncClient, CoinMarketCap):
+    pass
@@ -0,0 +1,185 @@
+from collections import namedtuple
+from typing import Hashable, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _check_numpy():
+    if np is None:
+        raise ImportError(
+            "numpy is required by columnar market data, install it with: "
+            "pip install trading-api-wrappers[numpy]"
+        )
+
+
+def structured_array(rows: List, fields: Iterable):
+    """Decode fixed-position rows, ex. trades or candles, into a NumPy
+    structured array in one go.
+
+    Each column is converted by NumPy from the decoded values, numbers or
+    strings, instead of building a model per row.
+
+    Args:
+        rows (list): Decoded rows, ex. `[[ID, MTS, AMOUNT, PRICE], ...]`.
+        fields: `schema.Field` of each column, with its index as `source`.
+            Fields without a `dtype` are left out.
+    """
+    _check_numpy()
+    fields = [field for field in fields if field.dtype is not None]
+    array = np.empty(len(rows), dtype=[(f.name, f.dtype) for f in fields])
+    for field in fields:
+        source = field.source
+        array[field.name] = [row[source] for row in rows]
+    return array
+
+
+class BookSide(namedtuple("book_side", ["price", "amount"])):
+    """One side of an order book as float64 `price` and `amount` arrays,
+    best level first."""
+
+    @classmethod
+    def create_from_json(
+        cls,
+        entries: List,
+        price: Hashable = 0,
+        amount: Hashable = 1,
+        descending: bool = False,
+    ):
+        """Build the columns straight from the decoded entries.
+
+        Args:
+            entries (list): Levels, as lists or dicts (numbers or strings).
+            price: Index or key of the price in each level.
+            amount: Index or key of the amount in each level.
+            descending (bool): Sort prices high to low (bids).
+        """
+        _check_numpy()
+        prices = np.array([entry[price] for entry in entries], dtype=np.float64)
+        amounts = np.array([entry[amount] for entry in entries], dtype=np.float64)
+        # Stable sort, keeps the exchange order between equal prices
+        order = np.argsort(-prices if descending else prices, kind="stable")
+        return cls(price=prices[order], amount=amounts[order])
+
+    def cumulative_amount(self):
+        """Amount available up to each level."""
+        return np.cumsum(self.amount)
+
+    def cumulative_quote(self):
+        """Quote amount (price * amount) up to each level."""
+        return np.cumsum(self.price * self.amount)
+
+    def vwap(self, size):
+        """Average price to fill `size` (a number or an array of them)
+        walking the book, NaN when the book is not deep enough."""
+        size = np.asarray(size, dtype=np.float64)
+        levels = len(self.price)
+        if not levels:
+            return np.full(size.shape, np.nan)[()]
+        amounts = np.concatenate(([0.0], self.cumulative_amount()))
+        quotes = np.concatenate(([0.0], self.cumulative_quote()))
+        # Level where the fill completes, partially taking it
+        index = np.searchsorted(amounts, size)
+        valid = (index > 0) & (index <= levels)
+        index = np.clip(index, 1, levels)
+        filled = quotes[index - 1] + (size - amounts[index - 1]) * self.price[index - 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(valid, filled / size, np.nan)[()]
+
+
+class ColumnarOrderBook(namedtuple("columnar_order_book", ["bids", "asks"])):
+    """Order book with both sides as `BookSide` columns, shared by every
+    exchange. Bids go high to low and asks low to high."""
+
+    @classmethod
+    def create_from_json(cls, order_book: dict, price: Hashable = 0, amount=1):
+        return cls(
+            bids=BookSide.create_from_json(
+                order_book["bids"], price, amount, descending=True
+            ),
+            asks=BookSide.create_from_json(order_book["asks"], price, amount),
+        )
+
+    @property
+    def spread(self) -> float:
+        if not self.bids.price.size or not self.asks.price.size:
+            return float("nan")
+        return float(self.asks.price[0] - self.bids.price[0])
+
+    def vwap(self, side: str, size):
+        """Average price to buy (walking the asks) or sell (the bids) `size`.
+
+        Args:
+            side (str): "buy" or "bid" to buy, "sell" or "ask" to sell.
+        """
+        buying = str(side).lower() in ("buy", "bid")
+        return (self.asks if buying else self.bids).vwap(size)
+
+
+class Candles(
+    namedtuple("candles", ["timestamp", "open", "high", "low", "close", "volume"])
+):
+    """OHLCV candles as columns, oldest first and one per timestamp.
+
+    `timestamp` holds int64 epoch seconds of the candle opening and the
+    other columns float64 values.
+    """
+
+    @classmethod
+    def create_from_rows(cls, rows: List):
+        """Stitch `(timestamp, open, high, low, close, volume)` rows, numbers
+        or strings, in any order and possibly repeated."""
+        _check_numpy()
+        values = np.array(rows, dtype=np.float64).reshape(-1, len(cls._fields))
+        timestamps = values[:, 0].astype(np.int64)
+        # Sorted unique timestamps, the first row fetched of each is kept
+        timestamps, index = np.unique(timestamps, return_index=True)
+        columns = [np.ascontiguousarray(values[index, i]) for i in range(1, 6)]
+        return cls(timestamps, *columns)
+
+    def between(self, start: float = None, end: float = None):
+        """Candles opened in [start, end)."""
+        mask = np.ones(self.timestamp.shape, dtype=bool)
+        if start is not None:
+            mask &= self.timestamp >= start
+        if end is not None:
+            mask &= self.timestamp < end
+        return type(self)(*(column[mask] for column in self))
+
+
+class Trades(namedtuple("trades", ["timestamp", "price", "amount"])):
+    """Trades as float64 columns, oldest first, with epoch seconds
+    timestamps."""
+
+    @classmethod
+    def create_from_json(
+        cls,
+        entries: List,
+        timestamp: Hashable = 0,
+        price: Hashable = 1,
+        amount: Hashable = 2,
+        unit: float = 1,
+    ):
+        """Build the columns straight from the decoded trades.
+
+        Args:
+            entries (list): Trades, as lists or dicts (numbers or strings).
+            timestamp: Index or key of the timestamp in each trade.
+            price: Index or key of the price in each trade.
+            amount: Index or key of the amount in each trade.
+            unit (float): Seconds per timestamp unit, ex. 0.001 for ms.
+        """
+        _check_numpy()
+        timestamps = np.array([e[timestamp] for e in entries], dtype=np.float64)
+        prices = np.array([e[price] for e in entries], dtype=np.float64)
+        amounts = np.array([e[amount] for e in entries], dtype=np.float64)
+        # Stable sort, keeps the exchange order of simultaneous trades
+        order = np.argsort(timestamps, kind="stable")
+        return cls(timestamps[order] * unit, prices[order], amounts[order])
+
+    @classmethod
+    def create_from_rows(cls, rows: List):
+        """From `(timestamp, price, amount)` rows."""
+        return cls.create_from_json(rows)
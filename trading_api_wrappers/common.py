@@ -1,4 +1,21 @@
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover
+    ciso8601 = None
+
+# Fallback layouts of the exchanges, for strings off the fast path
+DATETIME_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+]
 
 
 def clean_empty(d: (dict, list)):
@@ -36,3 +53,80 @@ def format_datetime_iso(date_value):
     if isinstance(date_value, datetime):
         date_value = date_value.isoformat()
     return date_value
+
+
+def parse_datetime(value: str):
+    """Naive datetime of an ISO-8601 string in the exchanges layouts, ex.
+    "2019-01-01T12:30:00.000Z" or "2019-01-01 12:30", None if empty.
+
+    Strings with a UTC offset ("+03:00" or "+0300") are converted to UTC,
+    with or without ciso8601. Repeated strings (ex. trades of the same
+    second) are parsed once.
+    """
+    if value:
+        return _parse_datetime(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    if ciso8601 is not None:
+        try:
+            parsed = ciso8601.parse_datetime(value)
+        except ValueError:
+            pass
+        else:
+            offset = parsed.utcoffset()
+            if offset is None:
+                return parsed
+            return (parsed - offset).replace(tzinfo=None)
+    value, offset = _split_offset(value)
+    try:
+        return _parse_fixed(value) - offset
+    except ValueError:
+        pass
+    for fmt in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt) - offset
+        except ValueError:
+            continue
+    raise ValueError(f"Unknown datetime format: {value!r}")
+
+
+def _split_offset(value: str):
+    """Split a trailing "+HH:MM" or "+HHMM" UTC offset off a datetime."""
+    for size in (6, 5):
+        sign = value[-size : 1 - size]
+        # After the time of day, not the dashes of the date
+        if len(value) < 16 + size or sign not in ("+", "-"):
+            continue
+        digits = value[1 - size :].replace(":", "")
+        if len(digits) == 4 and digits.isdigit():
+            offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+            return value[:-size], offset if sign == "+" else -offset
+    return value, timedelta(0)
+
+
+def _parse_fixed(value: str) -> datetime:
+    """Slice `YYYY-MM-DD[T ]HH:MM[:SS[.ffffff]][Z]` by position."""
+    if value[-1] == "Z":
+        value = value[:-1]
+    size = len(value)
+    if size not in (16, 19) and not 21 <= size <= 26:
+        raise ValueError(value)
+    separators = value[4] + value[7] + value[10] + value[13] + value[16:17]
+    if separators not in ("--T:", "-- :", "--T::", "-- ::"):
+        raise ValueError(value)
+    if size > 19 and value[19] != ".":
+        raise ValueError(value)
+    second = int(value[17:19]) if size > 16 else 0
+    # Fractions of 1 to 6 digits, as %f
+    microsecond = int(value[20:].ljust(6, "0")) if size > 19 else 0
+    return datetime(
+        int(value[:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        second,
+        microsecond,
+    )
@@ -1,7 +1,7 @@
 from . import constants as _c
 from . import models as _m
-from .client_auth import CryptoMKTAuth
-from .client_public import CryptoMKTPublic
+from .client_auth import CryptoMKTAsyncAuth, CryptoMKTAuth
+from .client_public import CryptoMKTAsyncPublic, CryptoMKTPublic
 
 __all__ = [
     "CryptoMKT",
@@ -18,3 +18,5 @@ class CryptoMKT:
     # Clients
     Auth = CryptoMKTAuth
     Public = CryptoMKTPublic
+    AsyncAuth = CryptoMKTAsyncAuth
+    AsyncPublic = CryptoMKTAsyncPublic
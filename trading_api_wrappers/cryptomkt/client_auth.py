@@ -1,12 +1,13 @@
-import json
 from urllib.parse import urlsplit
 
 from requests import PreparedRequest as P
+from requests import Request
 
 from . import constants as _c
 from . import models as _m
 from .client_public import CryptoMKTPublic
 from ..auth import HMACAuth
+from ..aio import AsyncClient
 from ..base import AuthMixin
 
 
@@ -21,9 +22,32 @@ class CryptoMKTHMACAuth(HMACAuth):
     def _nonce(self):
         return self.timestamp.seconds()
 
+    def new_nonce(self, nonce: int = None):
+        # X-MKT-TIMESTAMP is checked against the server clock in seconds,
+        # strictly increasing values would run ahead of it in bursts
+        nonce = nonce or self._nonce()
+        self.last_nonce = nonce
+        return str(nonce)
+
+    def prepare_payload(self, request: Request):
+        # Sign the JSON payload dict, not its encoding
+        nonce = self.new_nonce()
+        path = urlsplit(request.url).path
+        message = self._message(nonce, path, request.json or {})
+        signature = self.sign(message)
+
+        def sign(r: P):
+            self.add_api_key(r)
+            self.add_nonce(r, nonce)
+            r.headers[self.signature_header] = signature
+
+        return self._finish(sign)
+
     def build_message(self, r: P, nonce: str):
         path = urlsplit(r.path_url).path
-        body = json.loads(r.body) if r.body else {}
+        return self._message(nonce, path, self.load_json(r.body))
+
+    def _message(self, nonce: str, path: str, body: dict):
         components = [nonce, path]
         for key in sorted(body.keys()):
             value = str(body[key])
@@ -42,13 +66,11 @@ class CryptoMKTAuth(CryptoMKTPublic, AuthMixin):
     # BALANCE------------------------------------------------------------------
     def balance(self):
         data = self.get("balance")
-        if self.return_json:
-            return data
-        return _m.Balance.create_from_json(data["data"])
+        return self._build(data, lambda d: _m.Balance.create_from_json(d["data"]))
 
     def wallet_balance(self, currency: str):
         balance = self.balance()
-        return getattr(balance, str(currency))
+        return self._then(balance, lambda b: getattr(b, str(currency)))
 
     # ORDERS-------------------------------------------------------------------
     def active_orders(
@@ -62,9 +84,9 @@ class CryptoMKTAuth(CryptoMKTPublic, AuthMixin):
                 "limit": limit,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Orders.create_from_json(data["data"], data["pagination"])
+        return self._build(
+            data, lambda d: _m.Orders.create_from_json(d["data"], d["pagination"])
+        )
 
     def executed_orders(
         self, market_id: str, page: int = None, limit: int = _c.ORDERS_LIMIT
@@ -77,9 +99,9 @@ class CryptoMKTAuth(CryptoMKTPublic, AuthMixin):
                 "limit": limit,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Orders.create_from_json(data["data"], data["pagination"])
+        return self._build(
+            data, lambda d: _m.Orders.create_from_json(d["data"], d["pagination"])
+        )
 
     def create_order(
         self, market_id: str, order_type: str, amount: float, price: float
@@ -93,9 +115,7 @@ class CryptoMKTAuth(CryptoMKTPublic, AuthMixin):
                 "price": price,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Order.create_from_json(data["data"])
+        return self._build(data, lambda d: _m.Order.create_from_json(d["data"]))
 
     def order_status(self, order_id: str):
         data = self.get(
@@ -104,9 +124,7 @@ class CryptoMKTAuth(CryptoMKTPublic, AuthMixin):
                 "id": order_id,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Order.create_from_json(data["data"])
+        return self._build(data, lambda d: _m.Order.create_from_json(d["data"]))
 
     def cancel_order(self, order_id: str):
         data = self.get(
@@ -115,9 +133,7 @@ class CryptoMKTAuth(CryptoMKTPublic, AuthMixin):
                 "id": order_id,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Order.create_from_json(data["data"])
+        return self._build(data, lambda d: _m.Order.create_from_json(d["data"]))
 
     # PAYMENTS-----------------------------------------------------------------
     # TODO: Not tested
@@ -158,3 +174,7 @@ class CryptoMKTAuth(CryptoMKTPublic, AuthMixin):
             },
         )
         return data
+
+
+class CryptoMKTAsyncAuth(AsyncClient, CryptoMKTAuth):
+    pass
@@ -2,7 +2,9 @@ from datetime import datetime
 
 from . import constants as _c
 from . import models as _m
+from ..aio import AsyncClient
 from ..base import Client, ModelMixin
+from ..columnar import BookSide
 
 
 class CryptoMKTPublic(Client, ModelMixin):
@@ -11,13 +13,11 @@ class CryptoMKTPublic(Client, ModelMixin):
 
     def markets(self):
         data = self.get("market")
-        return data["data"]
+        return self._then(data, lambda d: d["data"])
 
     def ticker(self, market_id: str):
         data = self.get("ticker", params={"market": str(market_id)})
-        if self.return_json:
-            return data
-        return _m.Ticker.create_from_json(data["data"])
+        return self._build(data, lambda d: _m.Ticker.create_from_json(d["data"]))
 
     def order_book(
         self,
@@ -25,7 +25,9 @@ class CryptoMKTPublic(Client, ModelMixin):
         order_type: str,
         page: int = None,
         limit: int = _c.ORDERS_LIMIT,
+        columnar: bool = False,
     ):
+        """Orders of one side of the book, as a `BookSide` with `columnar=True`."""
         data = self.get(
             "book",
             params={
@@ -35,9 +37,18 @@ class CryptoMKTPublic(Client, ModelMixin):
                 "limit": limit,
             },
         )
-        if self.return_json:
-            return data
-        return _m.OrderBook.create_from_json(data["data"], data["pagination"])
+        if columnar:
+            descending = str(order_type) == _c.OrderType.BUY.value
+            return self._then(
+                data,
+                lambda d: BookSide.create_from_json(
+                    d["data"], "price", "amount", descending
+                ),
+            )
+        return self._build(
+            data,
+            lambda d: _m.OrderBook.create_from_json(d["data"], d["pagination"]),
+        )
 
     def trades(
         self,
@@ -61,6 +72,11 @@ class CryptoMKTPublic(Client, ModelMixin):
                 "limit": limit,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Trades.create_from_json(data["data"], data.get("pagination"))
+        return self._build(
+            data,
+            lambda d: _m.Trades.create_from_json(d["data"], d.get("pagination")),
+        )
+
+
+class CryptoMKTAsyncPublic(AsyncClient, CryptoMKTPublic):
+    pass
@@ -1,15 +1,10 @@
 from collections import namedtuple
-from datetime import datetime
 
+from ..common import parse_datetime
+from ..schema import payload
 
-def parse_datetime(datetime_str):
-    if datetime_str:
-        return datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-
-
-def parse_iso_datetime(datetime_str):
-    if datetime_str:
-        return datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S.%f")
+# Former helper of the ISO timestamps, kept for backwards compatibility
+parse_iso_datetime = parse_datetime
 
 
 def check_null(value):
@@ -66,8 +61,8 @@ class Ticker(
             last_price=float(ticker["last_price"]),
             volume=float(ticker["volume"]),
             market=ticker["market"],
-            timestamp=parse_iso_datetime(ticker["timestamp"]),
-            json=ticker,
+            timestamp=parse_datetime(ticker["timestamp"]),
+            json=payload(ticker),
         )
 
 
@@ -87,8 +82,8 @@ class OrderBookEntry(
         return cls(
             price=float(book_entry["price"]),
             amount=float(book_entry["amount"]),
-            timestamp=parse_iso_datetime(book_entry["timestamp"]),
-            json=book_entry,
+            timestamp=parse_datetime(book_entry["timestamp"]),
+            json=payload(book_entry),
         )
 
 
@@ -128,11 +123,11 @@ class TradesEntry(
     def create_from_json(cls, trades_entry):
         return cls(
             market_taker=trades_entry["market_taker"],
-            timestamp=parse_iso_datetime(trades_entry["timestamp"]),
+            timestamp=parse_datetime(trades_entry["timestamp"]),
             price=float(trades_entry["price"]),
             amount=float(trades_entry["amount"]),
             market=trades_entry["market"],
-            json=trades_entry,
+            json=payload(trades_entry),
         )
 
 
@@ -172,7 +167,7 @@ class WalletBalance(
             available=float(balance["available"]),
             balance=float(balance["balance"]),
             wallet=balance["wallet"],
-            json=balance,
+            json=payload(balance),
         )
 
 
@@ -258,13 +253,13 @@ class Order(
             # Market pair
             market=order["market"],
             # Order creation timestamp
-            created_at=parse_iso_datetime(order["created_at"]),
+            created_at=parse_datetime(order["created_at"]),
             # Order update timestamp. Only on active orders
-            updated_at=parse_iso_datetime(order.get("created_at")),
+            updated_at=parse_datetime(order.get("created_at")),
             # Order execution timestamp. Only on executed orders
-            executed_at=parse_iso_datetime(order.get("executed_at")),
+            executed_at=parse_datetime(order.get("executed_at")),
             # Order JSON data
-            json=order,
+            json=payload(order),
         )
 
 
@@ -1,5 +1,6 @@
-from .client import CurrencyLayer
+from .client import CurrencyLayer, CurrencyLayerAsync
 
 __all__ = [
     "CurrencyLayer",
+    "CurrencyLayerAsync",
 ]
@@ -1,3 +1,4 @@
+from ..aio import AsyncClient
 from ..auth import ApiKeyAuth
 from ..base import AuthMixin, Client
 from ..common import format_date_iso
@@ -13,6 +14,7 @@ class CurrencyLayer(Client, AuthMixin):
     # https is only enabled for paid subscriptions
     base_url = "http://apilayer.net/api/"
     error_keys = ["error"]
+    endpoint_ttl = {"list": 86400}
     timeout = 120
 
     def __init__(self, access_key: str, timeout: int = None, **kwargs):
@@ -343,3 +345,7 @@ class CurrencyLayer(Client, AuthMixin):
         if currencies is not None:
             params["currencies"] = currencies
         return super().get(endpoint, params=params)
+
+
+class CurrencyLayerAsync(AsyncClient, CurrencyLayer):
+    pass
@@ -0,0 +1,45 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+Decoder = Callable[[Union[bytes, str]], Any]
+
+# Available JSON backends, fastest first. All of them decode bytes directly
+# and raise ValueError subclasses on invalid documents.
+DECODERS: Dict[str, Decoder] = {}
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+if ujson is not None:
+    DECODERS["ujson"] = ujson.loads
+DECODERS["json"] = json.loads
+
+
+def get_decoder(decoder: Union[str, Decoder] = None) -> Decoder:
+    """Return a JSON decoder by backend name, or the fastest one installed.
+
+    Args:
+        decoder: "orjson", "ujson", "json" or a callable taking bytes.
+    """
+    if decoder is None:
+        return next(iter(DECODERS.values()))
+    if callable(decoder):
+        return decoder
+    try:
+        return DECODERS[decoder]
+    except KeyError:
+        raise ValueError(
+            f"JSON decoder '{decoder}' is not installed, "
+            f"available: {', '.join(DECODERS)}"
+        ) from None
+
+
+loads: Decoder = get_decoder()
@@ -28,6 +28,13 @@ class InvalidResponse(APIException):
         self.message = message
 
 
+class RateLimitExceeded(InvalidResponse):
+    def __init__(self, error_msg: str, r: Response, retry_after: float = None):
+        super().__init__(error_msg, r)
+        # Seconds to wait before retrying, as requested by the server
+        self.retry_after = retry_after
+
+
 class DecodeError(APIException):
     def __init__(self, msg, r: Response):
         super().__init__(msg, response=r)
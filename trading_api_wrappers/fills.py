@@ -0,0 +1,72 @@
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import accumulate
+from typing import Iterable, List
+
+
+def iter_levels(levels: Iterable) -> Iterable:
+    """(price, amount) pairs of a side of an order book, `BookSide` included."""
+    if hasattr(levels, "price") and hasattr(levels, "amount"):
+        return zip(levels.price.tolist(), levels.amount.tolist())
+    return levels
+
+
+class Fill(namedtuple("fill", ["base", "quote", "price", "incomplete"])):
+    """Market order fill: base and quote amounts exchanged, price of the last
+    level taken (None if nothing was taken) and whether the book ran out."""
+
+    @property
+    def vwap(self) -> float:
+        return self.quote / self.base if self.base else None
+
+
+class BookFills:
+    """Simulate market order fills against one side of an order book.
+
+    Cumulative amounts are computed once, so every fill is a bisect and many
+    order sizes can be evaluated against the same book in microseconds.
+
+    Args:
+        levels: (price, amount) pairs, best first, ex. order book entry
+            models, raw JSON levels (numbers or strings) or a `BookSide`.
+    """
+
+    def __init__(self, levels: Iterable):
+        self.prices: List[float] = []
+        amounts, quotes = [], []
+        for level in iter_levels(levels):
+            price, amount = float(level[0]), float(level[1])
+            self.prices.append(price)
+            amounts.append(amount)
+            quotes.append(price * amount)
+        self.bases: List[float] = [0.0, *accumulate(amounts)]
+        self.quotes: List[float] = [0.0, *accumulate(quotes)]
+
+    def fill_base(self, amount: float) -> Fill:
+        """Fill of an order for `amount` in the base currency."""
+        index = bisect_left(self.bases, amount)
+        if index >= len(self.bases):
+            return self._exhausted()
+        if not index:
+            return Fill(0.0, 0.0, None, False)
+        price = self.prices[index - 1]
+        quote = self.quotes[index - 1] + (amount - self.bases[index - 1]) * price
+        return Fill(float(amount), quote, price, False)
+
+    def fill_quote(self, amount: float) -> Fill:
+        """Fill of an order for `amount` in the quote currency."""
+        index = bisect_left(self.quotes, amount)
+        if index >= len(self.quotes):
+            return self._exhausted()
+        if not index:
+            return Fill(0.0, 0.0, None, False)
+        price = self.prices[index - 1]
+        base = self.bases[index - 1] + (amount - self.quotes[index - 1]) / price
+        return Fill(base, float(amount), price, False)
+
+    def _exhausted(self) -> Fill:
+        price = self.prices[-1] if self.prices else None
+        return Fill(self.bases[-1], self.quotes[-1], price, True)
+
+    def __len__(self):
+        return len(self.prices)
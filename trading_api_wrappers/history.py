@@ -0,0 +1,169 @@
+import json
+import sqlite3
+from collections import namedtuple
+from contextlib import closing
+from datetime import timezone
+from itertools import islice
+from typing import Dict, Iterable, Iterator
+
+from .common import parse_datetime
+
+Record = namedtuple("record", ["id", "timestamp", "data"])
+
+
+def utc_timestamp(value: str) -> float:
+    """Epoch seconds of a UTC datetime string."""
+    return parse_datetime(value).replace(tzinfo=timezone.utc).timestamp()
+
+
+class Feed:
+    """Account history endpoint that can be read incrementally.
+
+    `fetch` yields the records at or after a timestamp (all of them if it is
+    None). Overlapping reads are fine, records already stored are skipped.
+
+    Args:
+        client: Authenticated (sync) client.
+        name (str): Name of the feed in the store, defaults to `name` plus
+            the endpoint parameters.
+        params: Endpoint parameters, ex. a symbol or an asset.
+    """
+
+    name: str = ""
+
+    def __init__(self, client, name: str = None, **params):
+        self.client = client
+        self.params: dict = {k: v for k, v in params.items() if v is not None}
+        if name is None:
+            name = ":".join([self.name] + [f"{k}={v}" for k, v in self.params.items()])
+        self.name: str = name
+
+    def fetch(self, since: float = None) -> Iterator[Record]:
+        raise NotImplementedError
+
+
+class HistoryStore:
+    """Append-only SQLite store of synced records, with a cursor per feed.
+
+    Records are unique by account, feed and id: stored records are never
+    updated and duplicates are dropped.
+
+    Args:
+        path (str): Database file.
+    """
+
+    batch_size: int = 500
+
+    def __init__(self, path: str):
+        self.path: str = path
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "account TEXT, feed TEXT, id TEXT, timestamp REAL, data TEXT, "
+                "PRIMARY KEY (account, feed, id))"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS records_timestamp "
+                "ON records (account, feed, timestamp)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cursors ("
+                "account TEXT, feed TEXT, timestamp REAL, "
+                "PRIMARY KEY (account, feed))"
+            )
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    def cursor(self, account: str, feed: str) -> float:
+        """Timestamp of the newest record synced, None before the first sync."""
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT timestamp FROM cursors WHERE account = ? AND feed = ?",
+                (account, feed),
+            ).fetchone()
+        return row[0] if row else None
+
+    def append(self, account: str, feed: str, records: Iterable[Record]) -> int:
+        """Store new records and move the cursor, return the number added.
+
+        Records are written in batches as they come, the cursor only moves
+        once they have all been read, so an interrupted sync is resumed from
+        the previous cursor.
+        """
+        added, newest = 0, self.cursor(account, feed)
+        records = iter(records)
+        with self._connect() as db:
+            while True:
+                batch = list(islice(records, self.batch_size))
+                if not batch:
+                    break
+                rows = [
+                    (account, feed, str(r.id), r.timestamp, json.dumps(r.data))
+                    for r in batch
+                ]
+                before = db.total_changes
+                db.execute("BEGIN")
+                db.executemany(
+                    "INSERT OR IGNORE INTO records VALUES (?, ?, ?, ?, ?)", rows
+                )
+                db.execute("COMMIT")
+                added += db.total_changes - before
+                latest = max(r.timestamp for r in batch)
+                newest = latest if newest is None else max(newest, latest)
+            if newest is not None:
+                db.execute(
+                    "INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)",
+                    (account, feed, newest),
+                )
+        return added
+
+    def records(
+        self, account: str, feed: str, since: float = None, until: float = None
+    ) -> Iterator[Record]:
+        """Stored records in [since, until), oldest first."""
+        query = "SELECT id, timestamp, data FROM records WHERE account = ? AND feed = ?"
+        params = [account, feed]
+        if since is not None:
+            query += " AND timestamp >= ?"
+            params.append(since)
+        if until is not None:
+            query += " AND timestamp < ?"
+            params.append(until)
+        with self._connect() as db:
+            rows = db.execute(query + " ORDER BY timestamp, id", params)
+            for record_id, timestamp, data in rows:
+                yield Record(record_id, timestamp, json.loads(data))
+
+    def count(self, account: str, feed: str) -> int:
+        with self._connect() as db:
+            return db.execute(
+                "SELECT COUNT(*) FROM records WHERE account = ? AND feed = ?",
+                (account, feed),
+            ).fetchone()[0]
+
+
+class HistorySync:
+    """Bring the history feeds of an account up to date in a store.
+
+    Only records newer than the last checkpoint of each feed are fetched.
+
+    Args:
+        store (HistoryStore): Local store.
+        account (str): Account name, feeds are tracked per account.
+    """
+
+    def __init__(self, store: HistoryStore, account: str):
+        self.store: HistoryStore = store
+        self.account: str = account
+
+    def sync(self, feed: Feed) -> int:
+        """Fetch the new records of a feed, return the number added."""
+        since = self.store.cursor(self.account, feed.name)
+        return self.store.append(self.account, feed.name, feed.fetch(since))
+
+    def sync_all(self, feeds: Iterable[Feed]) -> Dict[str, int]:
+        return {feed.name: self.sync(feed) for feed in feeds}
+
+    def records(self, feed: Feed, since: float = None, until: float = None):
+        return self.store.records(self.account, feed.name, since, until)
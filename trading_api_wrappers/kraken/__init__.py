@@ -1,6 +1,8 @@
 from . import constants as _c
-from .client_auth import KrakenAuth
-from .client_public import KrakenPublic
+from .candles import CandleDownloader
+from .client_auth import KrakenAsyncAuth, KrakenAuth
+from .client_public import KrakenAsyncPublic, KrakenPublic
+from .history import ClosedOrdersFeed, LedgersFeed, TradesHistoryFeed
 
 __all__ = [
     "Kraken",
@@ -11,6 +13,14 @@ class Kraken:
     # Enum Types
     Currency = _c.Currency
     Symbol = _c.Symbol
+    # Bulk downloads
+    CandleDownloader = CandleDownloader
+    # History feeds
+    ClosedOrdersFeed = ClosedOrdersFeed
+    LedgersFeed = LedgersFeed
+    TradesHistoryFeed = TradesHistoryFeed
     # Clients
     Auth = KrakenAuth
     Public = KrakenPublic
+    AsyncAuth = KrakenAsyncAuth
+    AsyncPublic = KrakenAsyncPublic
@@ -0,0 +1,45 @@
+from ..candles import CandleDownloader as _CandleDownloader
+from ..candles import Time, to_seconds
+from ..columnar import Candles
+from ..errors import RequestException
+
+
+class CandleDownloader(_CandleDownloader):
+    """Download `KrakenPublic.ohlc` candles from a start time.
+
+    OHLC data is paged with the `since` cursor returned by each response,
+    so requests go one after the other. Kraken only serves the latest 720
+    candles of an interval, older ones are never returned.
+
+    Args:
+        client: `Kraken.Public` client.
+        symbol (str): Pair, ex. "XXBTZUSD".
+        interval (int): Candle duration in minutes.
+    """
+
+    def __init__(self, client, symbol: str, interval: int = 1, retries: int = 2):
+        super().__init__(client, 1, retries)
+        self.symbol: str = str(symbol)
+        self.interval: int = interval
+
+    def download(self, start: Time, end: Time) -> Candles:
+        start, end = to_seconds(start), to_seconds(end)
+        rows, since = [], int(start)
+        while since < end:
+            result = self._ohlc(since)
+            candles = next(v for k, v in result.items() if k != "last")
+            # time, open, high, low, close, vwap, volume, count
+            rows.extend((c[0], c[1], c[2], c[3], c[4], c[6]) for c in candles)
+            last = int(result["last"])
+            if not candles or last <= since:
+                break
+            since = last
+        return Candles.create_from_rows(rows).between(start, end)
+
+    def _ohlc(self, since: int) -> dict:
+        for retry in range(self.retries + 1):
+            try:
+                return self.client.ohlc(self.symbol, self.interval, since)["result"]
+            except RequestException:
+                if retry == self.retries:
+                    raise
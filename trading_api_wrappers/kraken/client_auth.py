@@ -1,10 +1,11 @@
 import base64
 import hashlib
-import hmac
 
 from requests import PreparedRequest as P
+from requests import Request
 
 from .client_public import KrakenPublic
+from ..aio import AsyncClient
 from ..auth import HMACAuth
 from ..base import AuthMixin
 
@@ -20,17 +21,30 @@ class KrakenHMACAuth(HMACAuth):
         body["nonce"] = nonce
         r.prepare_body(data=body, files=None)
 
+    def prepare_payload(self, request: Request):
+        # The nonce goes in the body, add it before encoding
+        nonce = self.new_nonce()
+        request.data = {**(request.data or {}), "nonce": nonce}
+
+        def sign(r: P):
+            self.add_api_key(r)
+            self.add_signature(r, nonce)
+
+        return self._finish(sign)
+
     def build_message(self, r: P, nonce: str):
         auth = (nonce + r.body).encode()
         digest = hashlib.sha256(auth).digest()
         message = r.path_url.encode() + digest
         return message
 
+    def secret_key(self) -> bytes:
+        return base64.b64decode(self.secret)
+
     def sign(self, msg: str):
 
-        h = hmac.new(
-            key=base64.b64decode(self.secret), msg=msg, digestmod=self.algorithm
-        )
+        h = self.new_hmac()
+        h.update(msg)
 
         signature = base64.b64encode(h.digest()).decode()
 
@@ -39,6 +53,15 @@ class KrakenHMACAuth(HMACAuth):
 
 class KrakenAuth(KrakenPublic, AuthMixin):
     auth_cls = KrakenHMACAuth
+    # Ledger/trade history calls cost 2, order placement is counted apart
+    endpoint_weights = {
+        "private/Ledgers": 2,
+        "private/QueryLedgers": 2,
+        "private/TradesHistory": 2,
+        "private/QueryTrades": 2,
+        "private/AddOrder": 0,
+        "private/CancelOrder": 0,
+    }
 
     def __init__(self, key: str, secret: str, timeout: int = None, **kwargs):
         super().__init__(timeout, **kwargs)
@@ -318,3 +341,7 @@ class KrakenAuth(KrakenPublic, AuthMixin):
                 "refid": refid,
             },
         )
+
+
+class KrakenAsyncAuth(AsyncClient, KrakenAuth):
+    pass
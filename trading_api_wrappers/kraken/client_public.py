@@ -1,9 +1,43 @@
+from ..aio import AsyncClient
 from ..base import Client
+from ..columnar import structured_array
+from ..schema import Field
+
+# Columns of the rows returned by OHLC, Trades and Spread
+OHLC_FIELDS = (
+    Field("time", 0, dtype="i8"),
+    Field("open", 1, dtype="f8"),
+    Field("high", 2, dtype="f8"),
+    Field("low", 3, dtype="f8"),
+    Field("close", 4, dtype="f8"),
+    Field("vwap", 5, dtype="f8"),
+    Field("volume", 6, dtype="f8"),
+    Field("count", 7, dtype="i8"),
+)
+TRADE_FIELDS = (
+    Field("price", 0, dtype="f8"),
+    Field("volume", 1, dtype="f8"),
+    Field("time", 2, dtype="f8"),
+    Field("side", 3, dtype="U1"),
+    Field("type", 4, dtype="U1"),
+)
+SPREAD_FIELDS = (
+    Field("time", 0, dtype="i8"),
+    Field("bid", 1, dtype="f8"),
+    Field("ask", 2, dtype="f8"),
+)
 
 
 class KrakenPublic(Client):
     base_url = "https://api.kraken.com/0/"
     error_keys = ["error"]
+    endpoint_ttl = {"public/Assets": 3600, "public/AssetPairs": 3600}
+    # Rate limit errors come with a 200 status code
+    rate_limit_errors = [
+        "EAPI:Rate limit exceeded",
+        "EOrder:Rate limit exceeded",
+        "EGeneral:Too many requests",
+    ]
 
     def server_time(self):
         return self.get("public/Time")
@@ -22,8 +56,14 @@ class KrakenPublic(Client):
             },
         )
 
-    def ohlc(self, symbol: str, interval: int = None, since: str = None):
-        return self.get(
+    def ohlc(
+        self,
+        symbol: str,
+        interval: int = None,
+        since: str = None,
+        columnar: bool = False,
+    ):
+        data = self.get(
             "public/OHLC",
             params={
                 "pair": str(symbol),
@@ -31,6 +71,9 @@ class KrakenPublic(Client):
                 "since": since,
             },
         )
+        if columnar:
+            return self._then(data, lambda d: self._columnar(d, OHLC_FIELDS))
+        return data
 
     def order_book(self, symbol: str, count: int = None):
         return self.get(
@@ -41,20 +84,40 @@ class KrakenPublic(Client):
             },
         )
 
-    def trades(self, symbol: str, since: str = None):
-        return self.get(
+    def trades(self, symbol: str, since: str = None, columnar: bool = False):
+        data = self.get(
             "public/Trades",
             params={
                 "pair": str(symbol),
                 "since": since,
             },
         )
+        if columnar:
+            return self._then(data, lambda d: self._columnar(d, TRADE_FIELDS))
+        return data
 
-    def spread(self, symbol: str, since: str = None):
-        return self.get(
+    def spread(self, symbol: str, since: str = None, columnar: bool = False):
+        data = self.get(
             "public/Spread",
             params={
                 "pair": str(symbol),
                 "since": since,
             },
         )
+        if columnar:
+            return self._then(data, lambda d: self._columnar(d, SPREAD_FIELDS))
+        return data
+
+    @staticmethod
+    def _columnar(data: dict, fields) -> dict:
+        """Response with the rows of the pair as a NumPy structured array,
+        the `last` cursor is kept as is."""
+        result = {
+            key: value if key == "last" else structured_array(value, fields)
+            for key, value in data["result"].items()
+        }
+        return {**data, "result": result}
+
+
+class KrakenAsyncPublic(AsyncClient, KrakenPublic):
+    pass
@@ -0,0 +1,54 @@
+from ..history import Feed, Record
+
+
+class _KrakenFeed(Feed):
+    """Kraken history, newest first, 50 records per `ofs` page."""
+
+    method: str = ""
+    key: str = ""
+    time_key: str = "time"
+
+    def fetch(self, since: float = None):
+        # `start` is exclusive, step back to keep records of the same second
+        start = int(since) - 1 if since is not None else None
+        ofs = 0
+        while True:
+            data = getattr(self.client, self.method)(
+                start=start, ofs=ofs or None, **self.params
+            )
+            result = data["result"]
+            items = result[self.key]
+            for txid, item in items.items():
+                yield Record(txid, float(item[self.time_key]), item)
+            ofs += len(items)
+            if not items or ofs >= int(result["count"]):
+                break
+
+
+class ClosedOrdersFeed(_KrakenFeed):
+    """`KrakenAuth.closed_orders`, by close time."""
+
+    name = "kraken:closed_orders"
+    method = "closed_orders"
+    key = "closed"
+    time_key = "closetm"
+
+    def __init__(self, client, name: str = None, **params):
+        super().__init__(client, name, **params)
+        self.params["closetime"] = "close"
+
+
+class TradesHistoryFeed(_KrakenFeed):
+    """`KrakenAuth.trades_history`."""
+
+    name = "kraken:trades_history"
+    method = "trades_history"
+    key = "trades"
+
+
+class LedgersFeed(_KrakenFeed):
+    """`KrakenAuth.ledgers`."""
+
+    name = "kraken:ledgers"
+    method = "ledgers"
+    key = "ledger"
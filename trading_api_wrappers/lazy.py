@@ -0,0 +1,55 @@
+from typing import Callable, List, Sequence
+
+from .schema import bind_payload
+
+_MISSING = object()
+
+
+class LazyList(Sequence):
+    """List of models built from their payloads on first access.
+
+    Each item is built once and memoized, so reading the top of an order
+    book or the first order of a page doesn't pay for the rest.
+
+    Args:
+        items (list): Decoded payloads.
+        builder: Function building a model from a payload.
+    """
+
+    __slots__ = ("_items", "_builder", "_built")
+
+    def __init__(self, items: List, builder: Callable):
+        self._items: List = items
+        self._builder: Callable = builder
+        self._built: List = [_MISSING] * len(items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._built[index]
+        if item is _MISSING:
+            item = self._built[index] = self._builder(self._items[index])
+        return item
+
+    def __len__(self):
+        return len(self._items)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def map(self, func: Callable) -> "LazyList":
+        """Lazy list of `func` applied to each model."""
+        builder = self._builder
+        return type(self)(self._items, lambda item: func(builder(item)))
+
+
+def build_list(items: List, builder: Callable, lazy: bool = False):
+    """Models built from a list of payloads, all at once or on access."""
+    if lazy:
+        return LazyList(items, bind_payload(builder))
+    return [builder(item) for item in items]
@@ -0,0 +1,244 @@
+import asyncio
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+from .locks import FileLock
+
+Budget = namedtuple("budget", ["rate", "capacity", "tokens"])
+
+
+def reserve_tokens(tokens, updated, now, rate, capacity, weight):
+    """Refill a token bucket and take `weight` tokens from it.
+
+    Tokens can go negative: later callers queue behind the debt. A bucket
+    blocked until a future `updated` time only refills from then on.
+
+    Returns:
+        tuple: (tokens, updated, seconds to wait before sending)
+    """
+    if now > updated:
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        updated = now
+    tokens -= weight
+    delay = updated - now
+    if tokens < 0:
+        delay += -tokens / rate
+    return tokens, updated, delay
+
+
+class RateLimiter:
+    """Book request slots, callers then wait the returned delay.
+
+    Splitting the reservation from the wait lets one limiter serve threads
+    (`acquire`) and coroutines (`acquire_async`) alike.
+    """
+
+    def reserve(self, weight: float = 1) -> float:
+        """Take `weight` tokens and return the seconds to wait."""
+        raise NotImplementedError
+
+    def acquire(self, weight: float = 1):
+        delay = self.reserve(weight)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, weight: float = 1):
+        delay = self.reserve(weight)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    # Server feedback ---------------------------------------------------------
+    def on_success(self):
+        """A request went through."""
+
+    def on_rate_limited(self, retry_after: float = None):
+        """The server rejected a request for exceeding its rate limit."""
+
+    def on_quota(self, remaining: float, reset: float = None):
+        """The server reported `remaining` requests until `reset` seconds."""
+
+    def budget(self) -> Budget:
+        """Current rate, capacity and available tokens."""
+        raise NotImplementedError
+
+
+class _Bucket(RateLimiter):
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate: float = rate
+        self.capacity: float = capacity
+
+    def _apply(self, func):
+        """Update (tokens, updated) atomically with func(tokens, updated, now).
+
+        func returns the new (tokens, updated) and a result to return.
+        """
+        raise NotImplementedError
+
+    def reserve(self, weight: float = 1) -> float:
+        return self._apply(
+            lambda tokens, updated, now: reserve_tokens(
+                tokens, updated, now, self.rate, self.capacity, weight
+            )
+        )
+
+    def _block(self, seconds: float, tokens: float):
+        """Hold back requests for `seconds`, then allow `tokens` at once."""
+
+        def block(current, updated, now):
+            until = max(updated, now + seconds)
+            return min(current, tokens), until, None
+
+        self._apply(block)
+
+    def on_rate_limited(self, retry_after: float = None):
+        if retry_after:
+            self._block(retry_after, tokens=1)
+        else:
+            self._block(0, tokens=0)
+
+    def on_quota(self, remaining: float, reset: float = None):
+        if remaining <= 0 and reset:
+            self._block(reset, tokens=1)
+        else:
+            self._block(0, tokens=remaining)
+
+    def budget(self) -> Budget:
+        def available(tokens, updated, now):
+            refilled, _, delay = reserve_tokens(
+                tokens, updated, now, self.rate, self.capacity, 0
+            )
+            # Negative while blocked or in debt: the seconds to wait, in tokens
+            return tokens, updated, -delay * self.rate if delay > 0 else refilled
+
+        tokens = self._apply(available)
+        return Budget(rate=self.rate, capacity=self.capacity, tokens=tokens)
+
+
+class TokenBucket(_Bucket):
+    """In-process token bucket, shared by every thread using it.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (float): Bucket size, max burst of requests.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        super().__init__(rate, capacity)
+        self._tokens: float = capacity
+        self._updated: float = self.clock()
+        self._lock = threading.Lock()
+
+    def _apply(self, func):
+        with self._lock:
+            self._tokens, self._updated, result = func(
+                self._tokens, self._updated, self.clock()
+            )
+        return result
+
+
+class LeakyBucket(TokenBucket):
+    """Space requests evenly at `rate` per second, without bursts."""
+
+    def __init__(self, rate: float):
+        super().__init__(rate, capacity=1)
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket that learns the sustainable rate from the server (AIMD).
+
+    The rate is multiplied by `decrease` after a rate limit error (at most
+    once per `cooldown` seconds) and grows back by `increase` tokens/second
+    for every second without errors, up to `max_rate`.
+
+    Args:
+        rate (float): Initial tokens added per second.
+        capacity (float): Bucket size, max burst of requests.
+        min_rate (float): Lower bound for the rate (default: rate / 20).
+        max_rate (float): Upper bound for the rate (default: rate).
+        decrease (float): Multiplicative decrease factor.
+        increase (float): Additive increase, in tokens/second per second.
+        cooldown (float): Min seconds between two decreases.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1,
+        min_rate: float = None,
+        max_rate: float = None,
+        decrease: float = 0.5,
+        increase: float = None,
+        cooldown: float = 1,
+    ):
+        super().__init__(rate, capacity)
+        self.min_rate: float = min_rate if min_rate is not None else rate / 20
+        self.max_rate: float = max_rate if max_rate is not None else rate
+        self.decrease: float = decrease
+        self.increase: float = increase if increase is not None else rate / 20
+        self.cooldown: float = cooldown
+        self._last_decrease: float = None
+        self._last_increase: float = self.clock()
+
+    def on_success(self):
+        with self._lock:
+            now = self.clock()
+            elapsed = now - self._last_increase
+            self._last_increase = now
+            self.rate = min(self.max_rate, self.rate + self.increase * elapsed)
+
+    def on_rate_limited(self, retry_after: float = None):
+        with self._lock:
+            now = self.clock()
+            self._last_increase = now
+            if self._last_decrease is None or (
+                now - self._last_decrease >= self.cooldown
+            ):
+                self._last_decrease = now
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+        super().on_rate_limited(retry_after)
+
+
+class FileTokenBucket(_Bucket):
+    """Token bucket shared across processes through a locked state file.
+
+    Every limiter created with the same `name` (or `path`) draws from the
+    same bucket, ex. all workers using the same API key.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (float): Bucket size, max burst of requests.
+        name (str): Bucket name, its file is created in the temp directory.
+        path (str): Explicit path for the bucket file.
+    """
+
+    clock = staticmethod(time.time)
+    state = struct.Struct("dd")
+
+    def __init__(
+        self, rate: float, capacity: float = 1, name: str = None, path: str = None
+    ):
+        if path is None:
+            if name is None:
+                raise ValueError("Either 'name' or 'path' is needed!")
+            path = os.path.join(tempfile.gettempdir(), f"{name}.bucket")
+        super().__init__(rate, capacity)
+        self.path: str = path
+        self._file = FileLock(path)
+
+    def _apply(self, func):
+        with self._file:
+            data = self._file.read(self.state.size)
+            now = self.clock()
+            if len(data) == self.state.size:
+                tokens, updated = self.state.unpack(data)
+            else:
+                tokens, updated = self.capacity, now
+            tokens, updated, result = func(tokens, updated, now)
+            self._file.write(self.state.pack(tokens, updated))
+        return result
@@ -0,0 +1,58 @@
+import os
+import struct
+import tempfile
+import threading
+
+from .locks import FileLock
+
+
+class NonceGenerator:
+    """Strictly increasing nonces, shared by every thread using it.
+
+    Nonces follow the clock of the auth (ex. microseconds), but are always
+    greater than the last one issued, so concurrent requests never collide.
+    """
+
+    def __init__(self):
+        self.last: int = 0
+        self._lock = threading.Lock()
+
+    def next(self, now: int) -> int:
+        """Nonce for the current time `now`, in the auth units."""
+        with self._lock:
+            self.last = max(int(now), self.last + 1)
+            return self.last
+
+
+class FileNonceGenerator(NonceGenerator):
+    """Nonces shared across processes through a locked state file.
+
+    Every generator created with the same `name` (or `path`) issues nonces
+    from the same sequence, ex. all workers using the same API key. The last
+    nonce is kept in the file, so the sequence survives restarts even if the
+    clock goes back.
+
+    Args:
+        name (str): Sequence name, its file is created in the temp directory.
+        path (str): Explicit path for the sequence file.
+    """
+
+    state = struct.Struct("q")
+
+    def __init__(self, name: str = None, path: str = None):
+        if path is None:
+            if name is None:
+                raise ValueError("Either 'name' or 'path' is needed!")
+            path = os.path.join(tempfile.gettempdir(), f"{name}.nonce")
+        super().__init__()
+        self.path: str = path
+        self._file = FileLock(path)
+
+    def next(self, now: int) -> int:
+        with self._file:
+            data = self._file.read(self.state.size)
+            last = self.state.unpack(data)[0] if len(data) == self.state.size else 0
+            nonce = max(int(now), last + 1)
+            self._file.write(self.state.pack(nonce))
+        self.last = nonce
+        return nonce
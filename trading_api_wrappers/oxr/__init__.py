@@ -1,5 +1,6 @@
-from .client import OXR
+from .client import OXR, OXRAsync
 
 __all__ = [
     "OXR",
+    "OXRAsync",
 ]
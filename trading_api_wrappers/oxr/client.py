@@ -1,3 +1,4 @@
+from ..aio import AsyncClient
 from ..auth import ApiKeyAuth
 from ..base import AuthMixin, Client
 from ..common import format_date_iso, format_datetime_iso
@@ -6,6 +7,8 @@ from ..common import format_date_iso, format_datetime_iso
 class OXR(Client, AuthMixin):
     base_url = "https://openexchangerates.org/api/"
     error_keys = ["error"]
+    endpoint_ttl = {"currencies.json": 86400}
+    conditional_endpoints = ["historical/*"]
 
     def __init__(self, app_id: str, timeout: int = None, **kwargs):
         super().__init__(timeout, **kwargs)
@@ -86,3 +89,7 @@ class OXR(Client, AuthMixin):
         if symbols is not None:
             params["symbols"] = symbols
         return super().get(endpoint, params=params)
+
+
+class OXRAsync(AsyncClient, OXR):
+    pass
@@ -0,0 +1,91 @@
+import asyncio
+import time
+from typing import Callable, Iterable
+
+import backoff
+
+from .errors import RateLimitExceeded, RequestException
+
+
+class RetryPolicy:
+    """Retry requests with exponential backoff.
+
+    Built once per client (or per endpoint) and reused on every request,
+    instead of decorating each request with `backoff.on_exception`.
+    """
+
+    def __init__(
+        self,
+        max_tries: int = 3,
+        factor: float = 1.5,
+        max_time: float = None,
+        retry_codes: Iterable[int] = (),
+        jitter: Callable[[float], float] = backoff.full_jitter,
+    ):
+        self.max_tries: int = max_tries
+        self.factor: float = factor
+        self.max_time: float = max_time
+        self.retry_codes: frozenset = frozenset(retry_codes)
+        self.jitter = jitter
+
+    def replace(self, **kwargs) -> "RetryPolicy":
+        """Return a copy of this policy with some settings overridden."""
+        settings = dict(
+            max_tries=self.max_tries,
+            factor=self.factor,
+            max_time=self.max_time,
+            retry_codes=self.retry_codes,
+            jitter=self.jitter,
+        )
+        settings.update(kwargs)
+        return type(self)(**settings)
+
+    def give_up(self, e: RequestException) -> bool:
+        if isinstance(e, RateLimitExceeded):
+            return False
+        if e.response is not None:
+            return e.response.status_code not in self.retry_codes
+        return False
+
+    def wait(self, e: RequestException, tries: int, elapsed: float):
+        """Seconds to wait before the next try, None to give up."""
+        if tries >= self.max_tries or self.give_up(e):
+            return None
+        seconds = self.factor * 2 ** (tries - 1)
+        if self.jitter is not None:
+            seconds = self.jitter(seconds)
+        # Never retry before the server says so
+        retry_after = getattr(e, "retry_after", None) or 0
+        seconds = max(seconds, retry_after)
+        if self.max_time is not None:
+            remaining = self.max_time - elapsed
+            if remaining <= 0 or retry_after > remaining:
+                return None
+            seconds = min(seconds, remaining)
+        return seconds
+
+    def call(self, target, *args, **kwargs):
+        start = time.monotonic()
+        tries = 0
+        while True:
+            tries += 1
+            try:
+                return target(*args, **kwargs)
+            except RequestException as e:
+                seconds = self.wait(e, tries, time.monotonic() - start)
+                if seconds is None:
+                    raise
+            time.sleep(seconds)
+
+    async def acall(self, target, *args, **kwargs):
+        start = time.monotonic()
+        tries = 0
+        while True:
+            tries += 1
+            try:
+                return await target(*args, **kwargs)
+            except RequestException as e:
+                seconds = self.wait(e, tries, time.monotonic() - start)
+                if seconds is None:
+                    raise
+            await asyncio.sleep(seconds)
@@ -1,5 +1,5 @@
 from . import models as _m
-from .clients import RipioPublic
+from .clients import RipioAsyncPublic, RipioPublic
 
 __all__ = [
     "Ripio",
@@ -12,3 +12,4 @@ class Ripio:
     # Enum Types
     # Clients
     Public = RipioPublic
+    AsyncPublic = RipioAsyncPublic
@@ -1,5 +1,7 @@
 from . import models as _m
+from ..aio import AsyncClient
 from ..base import Client, ModelMixin
+from ..columnar import ColumnarOrderBook
 
 
 class RipioExchangePublic(Client, ModelMixin):
@@ -8,19 +10,29 @@ class RipioExchangePublic(Client, ModelMixin):
     base_url = "https://exchange.ripio.com/api/v1/"
     error_keys = ["detail"]
 
-    def order_books(self):
+    def order_books(self, columnar: bool = False):
         """Fetch order books for all markets"""
         data = self.get("book/")
-        if self.return_json:
-            return data
-        return {
-            market: _m.OrderBook.create_from_json(book) for market, book in data.items()
-        }
+        if columnar:
+            return self._then(
+                data,
+                lambda d: {
+                    market: ColumnarOrderBook.create_from_json(book, "price", "amount")
+                    for market, book in d.items()
+                },
+            )
+        return self._build(
+            data,
+            lambda d: {
+                market: _m.OrderBook.create_from_json(book)
+                for market, book in d.items()
+            },
+        )
 
-    def order_book(self, market: str):
+    def order_book(self, market: str, columnar: bool = False):
         """Fetch order book for the provided market"""
-        data = self.order_books()
-        return data[market]
+        data = self.order_books(columnar)
+        return self._then(data, lambda d: d[market])
 
 
 # TODO: Ripio Auth not implemented
@@ -33,9 +45,7 @@ class RipioExchangeAuth(RipioExchangePublic):
                 "page": page,
             },
         )
-        if self.return_json:
-            return data
-        return _m.Trades.create_from_json(data)
+        return self._build(data, _m.Trades.create_from_json)
 
 
 class RipioPublic(Client, ModelMixin):
@@ -43,10 +53,12 @@ class RipioPublic(Client, ModelMixin):
 
     base_url = "https://ripio.com/api/v1/"
     error_keys = ["detail"]
+    exchange_cls = RipioExchangePublic
 
     def __init__(self, timeout: int = None, **kwargs):
         super().__init__(timeout, **kwargs)
-        self.exchange = RipioExchangePublic(timeout, **kwargs)
+        self.exchange = self.exchange_cls(timeout, **kwargs)
+        self.exchange.share_pool(self)
 
     def rates_raw(self):
         return self.get("rates/")
@@ -54,12 +66,26 @@ class RipioPublic(Client, ModelMixin):
     def rates(self):
         """Fetch rates"""
         data = self.rates_raw()
-        data = {"base": data["base"], "rates": data["rates"]}
-        if self.return_json:
-            return data
-        return _m.Rates.create_from_json(data)
+        data = self._then(data, lambda d: {"base": d["base"], "rates": d["rates"]})
+        return self._build(data, _m.Rates.create_from_json)
 
     def variation(self):
         """Fetch rates variation"""
         data = self.rates_raw()
-        return data["variation"]
+        return self._then(data, lambda d: d["variation"])
+
+
+class RipioExchangeAsyncPublic(AsyncClient, RipioExchangePublic):
+    pass
+
+
+class RipioExchangeAsyncAuth(AsyncClient, RipioExchangeAuth):
+    pass
+
+
+class RipioAsyncPublic(AsyncClient, RipioPublic):
+    exchange_cls = RipioExchangeAsyncPublic
+
+    async def aclose(self):
+        await self.exchange.aclose()
+        await super().aclose()
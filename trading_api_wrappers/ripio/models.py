@@ -1,10 +1,7 @@
 from collections import namedtuple
-from datetime import datetime
 
-
-def parse_datetime(datetime_str):
-    if datetime_str:
-        return datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S.%fZ")
+from ..common import parse_datetime
+from ..schema import payload
 
 
 class Price(
@@ -28,7 +25,7 @@ class Price(
             price=float(price["price"]),
             fees=float(price["fees"]),
             total=float(price["total"]),
-            json=price,
+            json=payload(price),
         )
 
 
@@ -76,7 +73,7 @@ class OrderBook(
             ],
             timestamp=order_book["timestamp"],
             last_price=order_book["last_price"],
-            json=order_book,
+            json=payload(order_book),
         )
 
 
@@ -126,7 +123,7 @@ class Trades(
             next=trades["next"],
             previous=trades["previous"],
             results=[Trade.create_from_json(trade) for trade in trades["results"]],
-            json=trades,
+            json=payload(trades),
         )
 
 
@@ -145,5 +142,5 @@ class Rates(
         return cls(
             base=rates["base"],
             rates=rates["rates"],
-            json=rates,
+            json=payload(rates),
         )
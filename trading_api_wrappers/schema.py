@@ -0,0 +1,117 @@
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Hashable
+
+# Source of a field holding the whole payload, ex. `json`
+PAYLOAD = ...
+
+# Models keep their raw payload, unless built `without_payload`
+_keep_payload: ContextVar = ContextVar("keep_payload", default=True)
+
+
+def payload(d):
+    """Raw payload to keep in the `json` field of a model being built."""
+    return d if _keep_payload.get() else None
+
+
+@contextmanager
+def without_payload():
+    """Build models with an empty `json` field, see `ModelMixin.keep_json`."""
+    token = _keep_payload.set(False)
+    try:
+        yield
+    finally:
+        _keep_payload.reset(token)
+
+
+def bind_payload(builder: Callable) -> Callable:
+    """`builder` keeping the payload setting of now, for models built later
+    (ex. by a `LazyList`)."""
+    if _keep_payload.get():
+        return builder
+
+    def build(d):
+        with without_payload():
+            return builder(d)
+
+    return build
+
+
+class Field(namedtuple("field", ["name", "source", "convert", "many", "dtype"])):
+    """Model field decoded from a payload.
+
+    Args:
+        name (str): Model field.
+        source: Key or index in the payload (default: `name`), `PAYLOAD`
+            for the payload itself.
+        convert: Function applied to the value, ex. `float`.
+        many (bool): The value is a list, convert each item.
+        dtype (str): NumPy type of the column in columnar responses, ex.
+            "f8", see `columnar.structured_array`.
+    """
+
+    def __new__(
+        cls,
+        name: str,
+        source: Hashable = None,
+        convert: Callable = None,
+        many: bool = False,
+        dtype: str = None,
+    ):
+        if many and convert is None:
+            raise TypeError(f"Field {name!r} is many without a convert function")
+        source = name if source is None else source
+        return super().__new__(cls, name, source, convert, many, dtype)
+
+
+def compile_decoder(model_cls, fields, optional: bool = False) -> Callable:
+    """Generate a `create_from_json(cls, d)` function building a
+    `model_cls` (or a subclass, as a classmethod) from a payload.
+
+    Every field becomes an inline expression of a single tuple, instead of
+    keyword arguments and a helper call per field.
+
+    Args:
+        model_cls: Namedtuple model.
+        fields (list): A `Field` for each field of the model.
+        optional (bool): Return empty payloads (None, []) as they are.
+    """
+    by_name = {field.name: field for field in fields}
+    if sorted(by_name) != sorted(model_cls._fields):
+        raise TypeError(f"{model_cls.__name__} schema doesn't match its fields")
+    namespace = {"_new": tuple.__new__, "_payload": payload}
+    values = []
+    for i, name in enumerate(model_cls._fields):
+        field = by_name[name]
+        value = "_payload(d)" if field.source is PAYLOAD else f"d[{field.source!r}]"
+        if field.convert is not None:
+            namespace[f"_c{i}"] = field.convert
+            if field.many:
+                value = f"[_c{i}(x) for x in {value}]"
+            else:
+                value = f"_c{i}({value})"
+        values.append(value)
+    lines = ["def create_from_json(cls, d):"]
+    if optional:
+        lines += ["    if not d:", "        return d"]
+    lines.append(f"    return _new(cls, ({', '.join(values)},))")
+    source = "\n".join(lines)
+    exec(compile(source, f"<{model_cls.__name__} decoder>", "exec"), namespace)
+    decoder = namespace["create_from_json"]
+    decoder.__qualname__ = f"{model_cls.__name__}.create_from_json"
+    decoder.source = source
+    return decoder
+
+
+def schema(*fields: Field, optional: bool = False):
+    """Class decorator giving a namedtuple model a compiled
+    `create_from_json`, see `compile_decoder`."""
+
+    def decorate(model_cls):
+        decoder = compile_decoder(model_cls, fields, optional)
+        model_cls.schema = fields
+        model_cls.create_from_json = classmethod(decoder)
+        return model_cls
+
+    return decorate
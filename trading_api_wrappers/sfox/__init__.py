@@ -1,6 +1,6 @@
 from . import constants as _c
 from . import models as _m
-from .client_public import SFOXPublic
+from .client_public import SFOXAsyncPublic, SFOXPublic
 
 __all__ = [
     "SFOX",
@@ -14,3 +14,4 @@ class SFOX:
     Side = _c.Side
     # Clients
     Public = SFOXPublic
+    AsyncPublic = SFOXAsyncPublic
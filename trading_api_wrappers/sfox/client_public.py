@@ -1,6 +1,8 @@
 from . import constants as _c
 from . import models as _m
+from ..aio import AsyncClient
 from ..base import Client, ModelMixin
+from ..columnar import ColumnarOrderBook
 
 
 class SFOXPublic(Client, ModelMixin):
@@ -11,9 +13,7 @@ class SFOXPublic(Client, ModelMixin):
     def best_price(self, side: str, amount: str):
         """Return the price needed for a limit order to execute fully."""
         data = self.get(f"offer/{side}", params={"amount": amount})
-        if self.return_json:
-            return data
-        return _m.Price.create_from_json(data)
+        return self._build(data, _m.Price.create_from_json)
 
     def best_buy_price(self, amount: str):
         """Return the price needed for a limit BUY order to execute fully."""
@@ -26,15 +26,21 @@ class SFOXPublic(Client, ModelMixin):
     def order_book_raw(self):
         return self.get("markets/orderbook")
 
-    def order_book(self, market_making: bool = False):
+    def order_book(self, market_making: bool = False, columnar: bool = False):
         """Return the blended order book of all the available exchanges."""
         data = self.order_book_raw()
-        if market_making:
-            data = data["market_making"]
-        order_book = {"bids": data["bids"], "asks": data["asks"]}
-        if self.return_json:
-            return order_book
-        return _m.OrderBook.create_from_json(order_book)
+
+        def build(data):
+            if market_making:
+                data = data["market_making"]
+            order_book = {"bids": data["bids"], "asks": data["asks"]}
+            if columnar:
+                return ColumnarOrderBook.create_from_json(order_book)
+            if self.return_json:
+                return order_book
+            return _m.OrderBook.create_from_json(order_book)
+
+        return self._then(data, build)
 
     def market_making_order_book(self):
         """Return the blended market making order book of all the available
@@ -44,4 +50,8 @@ class SFOXPublic(Client, ModelMixin):
     def exchanges(self):
         """Return all the available exchanges."""
         data = self.order_book_raw()
-        return data["exchanges"]
+        return self._then(data, lambda d: d["exchanges"])
+
+
+class SFOXAsyncPublic(AsyncClient, SFOXPublic):
+    pass
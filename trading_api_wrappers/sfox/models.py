@@ -1,5 +1,7 @@
 from collections import namedtuple
 
+from ..schema import payload
+
 
 class Price(
     namedtuple(
@@ -22,7 +24,7 @@ class Price(
             price=float(price["price"]),
             fees=float(price["fees"]),
             total=float(price["total"]),
-            json=price,
+            json=payload(price),
         )
 
 
@@ -66,5 +68,5 @@ class OrderBook(
                 OrderBookEntry.create_from_json(book_entry)
                 for book_entry in order_book["asks"]
             ],
-            json=order_book,
+            json=payload(order_book),
         )
@@ -0,0 +1,31 @@
+from . import constants as _c
+from . import models as _m
+from ..fills import BookFills
+
+
+def best_price(order_book, side: str, amount: float, fee: float = 0.0) -> _m.Price:
+    """Compute `SFOXPublic.best_price` locally from a fresh order book.
+
+    `price` is the worst level taken, the one a limit order needs to execute
+    fully, and `total` includes the fees (added on buys, taken on sells).
+    Books not deep enough are filled as far as they go.
+
+    Args:
+        order_book: `OrderBook` model (or `ColumnarOrderBook`).
+        side (str): "buy" (walks the asks) or "sell" (walks the bids).
+        amount (float): Quantity to trade.
+        fee (float): Fee rate, ex. 0.0035 for 0.35%.
+    """
+    buying = str(_c.Side.check(side)) == _c.Side.BUY.value
+    fills = BookFills(order_book.asks if buying else order_book.bids)
+    fill = fills.fill_base(float(amount))
+    fees = fill.quote * fee
+    return _m.Price.create_from_json(
+        {
+            "quantity": fill.base,
+            "vwap": fill.vwap or 0.0,
+            "price": fill.price or 0.0,
+            "fees": fees,
+            "total": fill.quote + fees if buying else fill.quote - fees,
+        }
+    )
@@ -0,0 +1,158 @@
+import json
+import os
+import re
+import tempfile
+from typing import Callable, List, Tuple
+
+from .candles import Time, to_seconds
+from .columnar import _check_numpy, np
+
+DAY = 86400
+
+
+class MarketStore:
+    """On-disk store of market data series, ex. `Candles` or `Trades`.
+
+    Each series is kept as one `.npy` file of fixed-width rows per UTC day,
+    under `root/exchange/market/kind/`, read memory-mapped. The ranges
+    written are recorded, so only the missing ones are ever fetched.
+
+    Args:
+        root (str): Store directory.
+    """
+
+    def __init__(self, root: str):
+        _check_numpy()
+        self.root: str = root
+
+    def path(self, exchange: str, market: str, series_cls) -> str:
+        market = re.sub(r"[^\w.-]", "-", str(market))
+        return os.path.join(
+            self.root, str(exchange).lower(), market, series_cls.__name__.lower()
+        )
+
+    def coverage(self, exchange: str, market: str, series_cls) -> List[List]:
+        """Ranges stored, as sorted disjoint [start, end) pairs."""
+        return self._load_coverage(self.path(exchange, market, series_cls))
+
+    def missing(
+        self, exchange: str, market: str, series_cls, start: Time, end: Time
+    ) -> List[Tuple[float, float]]:
+        """Ranges of [start, end) not stored yet."""
+        start, end = to_seconds(start), to_seconds(end)
+        gaps = []
+        for low, high in self.coverage(exchange, market, series_cls):
+            if high <= start:
+                continue
+            if low >= end:
+                break
+            if low > start:
+                gaps.append((start, low))
+            start = max(start, high)
+        if start < end:
+            gaps.append((start, end))
+        return gaps
+
+    def write(self, exchange: str, market: str, series, start: Time, end: Time):
+        """Store the rows of a series fetched for [start, end).
+
+        Rows stored before in that range are replaced by the new ones.
+        """
+        start, end = to_seconds(start), to_seconds(end)
+        path = self.path(exchange, market, type(series))
+        os.makedirs(path, exist_ok=True)
+        rows = self._rows(series)
+        rows = rows[(rows["timestamp"] >= start) & (rows["timestamp"] < end)]
+        days = (rows["timestamp"] // DAY).astype(np.int64)
+        for day in range(int(start // DAY), int(-(-end // DAY))):
+            file = self._file(path, day)
+            new = rows[days == day]
+            if os.path.exists(file):
+                old = np.load(file)
+                keep = (old["timestamp"] < start) | (old["timestamp"] >= end)
+                new = np.concatenate([old[keep], new.astype(old.dtype)])
+            elif not len(new):
+                continue
+            order = np.argsort(new["timestamp"], kind="stable")
+            self._save(file, new[order])
+        self._cover(path, start, end)
+
+    def read(self, exchange: str, market: str, series_cls, start: Time, end: Time):
+        """Series stored in [start, end)."""
+        start, end = to_seconds(start), to_seconds(end)
+        path = self.path(exchange, market, series_cls)
+        parts = []
+        for day in range(int(start // DAY), int(-(-end // DAY))):
+            file = self._file(path, day)
+            if not os.path.exists(file):
+                continue
+            rows = np.load(file, mmap_mode="r")
+            timestamps = rows["timestamp"]
+            low, high = np.searchsorted(timestamps, [start, end])
+            parts.append(rows[low:high])
+        if not parts:
+            return series_cls.create_from_rows([])
+        rows = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        return series_cls(*(rows[field] for field in series_cls._fields))
+
+    def get(
+        self,
+        exchange: str,
+        market: str,
+        series_cls,
+        start: Time,
+        end: Time,
+        fetch: Callable,
+    ):
+        """Series in [start, end), fetching and storing the missing ranges.
+
+        Args:
+            fetch: Function returning the series of a (start, end) range in
+                seconds, ex. `CandleDownloader.download`.
+        """
+        for low, high in self.missing(exchange, market, series_cls, start, end):
+            self.write(exchange, market, fetch(low, high), low, high)
+        return self.read(exchange, market, series_cls, start, end)
+
+    @staticmethod
+    def _rows(series):
+        dtype = [(f, column.dtype) for f, column in zip(series._fields, series)]
+        rows = np.empty(len(series.timestamp), dtype=dtype)
+        for field, column in zip(series._fields, series):
+            rows[field] = column
+        return rows
+
+    @staticmethod
+    def _file(path: str, day: int) -> str:
+        date = np.datetime64(day, "D")
+        return os.path.join(path, f"{date}.npy")
+
+    @staticmethod
+    def _save(file: str, rows):
+        # Replace the file at once, readers never see it half written
+        fd, tmp = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(file))
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, rows)
+        os.replace(tmp, file)
+
+    def _cover(self, path: str, start: float, end: float):
+        ranges = []
+        for low, high in sorted(
+            self._load_coverage(path) + [[start, end]], key=lambda r: r[0]
+        ):
+            if ranges and low <= ranges[-1][1]:
+                ranges[-1][1] = max(ranges[-1][1], high)
+            else:
+                ranges.append([low, high])
+        file = os.path.join(path, "coverage.json")
+        with open(file + ".tmp", "w") as f:
+            json.dump(ranges, f)
+        os.replace(file + ".tmp", file)
+
+    @staticmethod
+    def _load_coverage(path: str) -> List[List]:
+        try:
+            with open(os.path.join(path, "coverage.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
@@ -0,0 +1,98 @@
+import codecs
+import json
+import re
+from json import JSONDecodeError
+from typing import Iterable, Iterator, List
+
+SPACES = " \t\n\r"
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parser states
+START, FIRST_ITEM, ITEM, DELIMITER, END, DOCUMENT = range(6)
+
+
+class JSONArrayParser:
+    """Incremental parser for the items of a top-level JSON array.
+
+    Feed it raw chunks as they are downloaded and it returns the items that
+    are complete so far, so only the current item is ever kept in memory.
+    Responses that are not arrays (ex. error objects) are decoded whole on
+    `close` and stored in `document`.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer: str = ""
+        self._state: int = START
+        self.document = None
+
+    def feed(self, chunk: bytes) -> List:
+        return self._parse(self._decoder.decode(chunk), final=False)
+
+    def close(self) -> List:
+        items = self._parse(self._decoder.decode(b"", final=True), final=True)
+        if self._state == DOCUMENT:
+            self.document = json.loads(self._buffer)
+        elif self._state != END:
+            raise JSONDecodeError("Unterminated array", self._buffer, 0)
+        return items
+
+    def _parse(self, text: str, final: bool) -> List:
+        buffer = self._buffer + text
+        if self._state == DOCUMENT:
+            self._buffer = buffer
+            return []
+        items = []
+        state, pos, size = self._state, 0, len(buffer)
+        while True:
+            if pos < size and buffer[pos] in SPACES:
+                pos = WHITESPACE.match(buffer, pos).end()
+            if pos == size:
+                break
+            char = buffer[pos]
+            if state == START:
+                if char != "[":
+                    state = DOCUMENT
+                    break
+                state, pos = FIRST_ITEM, pos + 1
+            elif state == DELIMITER or (state == FIRST_ITEM and char == "]"):
+                if char == "]":
+                    state, pos = END, pos + 1
+                elif char == ",":
+                    state, pos = ITEM, pos + 1
+                else:
+                    raise JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            elif state == END:
+                raise JSONDecodeError("Extra data", buffer, pos)
+            else:
+                try:
+                    item, end = self._raw_decode(buffer, pos)
+                except JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # Numbers can continue in the next chunk, wait for a delimiter
+                delimiter = end
+                if delimiter < size and buffer[delimiter] in SPACES:
+                    delimiter = WHITESPACE.match(buffer, end).end()
+                if not final and (delimiter == size or buffer[delimiter] not in ",]"):
+                    break
+                items.append(item)
+                if delimiter < size and buffer[delimiter] == ",":
+                    state, pos = ITEM, delimiter + 1
+                else:
+                    state, pos = DELIMITER, end
+        self._state = state
+        self._buffer = buffer[pos:] if state != DOCUMENT else buffer
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """Yield the items of a JSON array read from an iterable of byte chunks."""
+    parser = JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+    if parser.document is not None:
+        raise JSONDecodeError("Expecting a JSON array", "", 0)